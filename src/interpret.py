@@ -5,11 +5,46 @@
 #       LIBRARIES       #
 # - - - - - - - - - - - #
 #   -   -   -   -   -   -   -   -
+import io
+import os
 import sys
 import re
+import json
+import operator
+import time
+import pickle
+import signal
+import socket
+import hashlib
 import argparse
+import contextlib
+import traceback
+import socketserver
 import xml.etree.ElementTree as ET
 
+# version of the interpret -> part of the compiled program cache key
+INTERPRET_VERSION = "2023.9"
+
+
+
+# -   # - - - - - - - - - - - - - - - - - #
+# -   #       INTERPRET-EXIT CLASSES      #
+# -   # - - - - - - - - - - - - - - - - - #
+#
+# usage:
+# - InterpretExit is raised by the EXIT instruction, code is the exit code of the program (0-49)
+# - InterpretError is raised on every error of the interpret, error message is written into stderr before
+# - Interpret.run() returns the code of the exception, only the main of the script exits with it
+class InterpretExit(Exception):
+
+    def __init__(self, code):
+        super().__init__(code)
+        self.code = code                    # exit code of the interpret
+
+
+class InterpretError(InterpretExit):
+    pass
+
 
 
 # -   # - - - - - - - - - - - - - - #
@@ -21,34 +56,117 @@ import xml.etree.ElementTree as ET
 # - The user can use the Interpret class to interpret the xml source file
 # - run_script() method runs interprets the source file
 # - read_args() method reads the arguments of the interpret.py script (optional)
+# - run() method runs the given program and returns its exit code, the same instance can run many programs
+#   = reset() is called before every program -> new frames, stacks, label table and output buffer
+#   = errors and EXIT raise InterpretExit/InterpretError, run() returns their code instead of exiting
+# - with the stati file the instructions are run in the instrumented loop, statistics are then written into the file
+# - with the profile file the instructions are run in the profiling loop, collapsed stacks are then written into the file
+# - with the cache directory the compiled program is loaded from the cache, the xml source is parsed only once
+# - with the server socket (--serve) the programs are run by InterpretServer for the clients
+# - constant operations are folded and unreachable instructions removed (ProgramOptimizer), not with stati or profile
+# - common instruction sequences are fused into superinstructions (InstructionFusion), not with stati or profile
+# - control flow graph of the program (ControlFlowGraph) is written in the DOT format with --cfg
+# - with --engine=compiled the basic blocks are compiled into python functions (BlockCompiler)
 #
 # dependencies:
 # - InputParser class
+# - InstructionCompiler class
 # - ExecuteInstruction class
 # - SymbolTableJump class
+# - Statistics class
+# - Profiler class
+# - ProgramCache class
+# - ProgramOptimizer class
+# - InstructionFusion class
+# - ControlFlowGraph class
+# - BlockCompiler class
 class Interpret:
 
     def __init__(self):
         self.input_parse = InputParser()    # input parser class
-        self.run = ExecuteInstruction()
-        self.symt_jump = SymbolTableJump()
         self.source = sys.stdin             # default = stdin -> xml_file source
         self.input = None                   # default = None  -> read input
         self.stati = None                   # default = None  -> stati file
-        self.stati_args = None              # default = None  -> stati arguments
+        self.stati_args = []                # default = []    -> stati arguments
+        self.profile = None                 # default = None  -> profile file
+        self.profile_counts = False         # default = False -> profile weighted by time
+        self.cache = None                   # default = None  -> compiled program cache (ProgramCache)
+        self.serve = None                   # default = None  -> server socket (--serve)
+        self.optimize = True                # default = True  -> constant operations are folded, unreachable instructions removed
+        self.optimize_report = None         # default = None  -> optimizer report file
+        self.fusion = True                  # default = True  -> instruction sequences are fused into superinstructions
+        self.fusion_report = None           # default = None  -> fusion report file
+        self.cfg = None                     # default = None  -> control flow graph file (DOT)
+        self.engine = "reference"           # default = reference -> execution engine (reference, compiled)
+        self.reset()                        # compiler, label table and execution of the program
+
+    # reset():
+    # - pub. method which prepares the interpret for the next program
+    # - creates new compiler, label table and execution (frames, stacks, output buffer) -> nothing is left from the previous program
+    def reset(self):
+        self.compiler = InstructionCompiler()
+        self.symt_jump = SymbolTableJump()
+        self.execute = ExecuteInstruction(self.symt_jump)
+
+    # run():
+    # - pub. method which runs the program and returns its exit code, errors don't exit the script
+    # - program is the xml source (file name or file object), stdin is the input of READ, stdout is the output of WRITE
+    # - stderr is the output of the error messages, DPRINT and BREAK (default sys.stderr)
+    #
+    # return codes:
+    #  = 0       - program ended after its last instruction
+    #  = 0 - 49  - EXIT instruction
+    #  = 11 - 99 - error code of the interpret -> see the other methods
+    def run(self, program, stdin=None, stdout=None, stderr=None):
+
+        # new frames, stacks and label table
+        self.reset()
+        self.input = sys.stdin if stdin is None else stdin
+        self.execute.output = OutputBuffer(sys.stdout if stdout is None else stdout)
+
+        with contextlib.redirect_stderr(sys.stderr if stderr is None else stderr):
+
+            # open the source file, file object is used as it is
+            self.source = program
+            if isinstance(program, str):
+                try:
+                    self.source = open(program, "r")
+                except OSError:
+                    sys.stderr.write(f"[interpret.py]: ERROR (11) - Interpret - run()\n")
+                    sys.stderr.write(f"                NOTE - Can't open source file {program}\n")
+                    return 11
+
+            # run the program, EXIT and errors are returned as the exit code
+            try:
+                self.run_script()
+                return 0
+            except InterpretExit as exit_code:
+                return exit_code.code
+            finally:
+                if isinstance(program, str):
+                    self.source.close()
 
     # read_args():
-    # - pub. method which reads interpret.py arguments from the command line
-    # - method sets up the source file, input file, stati file and stati arguments
+    # - pub. method which reads interpret.py arguments from the command line (or the given list of arguments)
+    # - method sets up the source file, input file, stati file, stati arguments, profile file and program cache
+    # - with --serve only the server socket is set up, files are opened for every request of the client
     # - this function doesn't need to be called by the user if he doesn't want to read the arguments
     #
     # return error codes:
     #  = 11 - can't open source file -> file not found, permission denied, ect.
     #  = 12 - can't write to output file -> permission denied, ect.
-    def read_args(self):
+    def read_args(self, args=None):
 
         # parse the arguments
-        self.source, self.input, self.stati, self.stati_args = self.input_parse.parse_arguments()
+        args = self.input_parse.parse_arguments(args)
+        self.serve = args.serve
+        if self.serve != None:
+            return
+        self.source, self.input, self.stati, self.stati_args = args.source, args.input, args.stati, args.stati_args
+        self.profile, self.profile_counts = args.profile, args.profile_counts
+        self.optimize, self.optimize_report = not args.no_optimize, args.optimize_report
+        self.fusion, self.fusion_report = not args.no_fusion, args.fusion_report
+        self.cfg, self.engine = args.cfg, args.engine
         
         # setup stdin as defalut for source file
         if self.source == None:
@@ -58,19 +176,19 @@ class Interpret:
         if self.source != sys.stdin:
             try:
                 self.source = open(self.source, "r")
-            except FileNotFoundError or PermissionError:
+            except OSError:
                 sys.stderr.write(f"[interpret.py]: ERROR (11) Interpret - read_args()\n")
                 sys.stderr.write(f"                NOTE - Can't open source file {self.source}\n")
-                sys.exit(11)
+                raise InterpretError(11)
         
         # open input file if possible
         if self.input != None:
             try:
                 self.input = open(self.input, "r")
-            except FileNotFoundError or PermissionError:
+            except OSError:
                 sys.stderr.write(f"[interpret.py]: ERROR (11) - Interpret - read_args()\n")
                 sys.stderr.write(f"                NOTE - Can't open input file {self.input}\n")
-                sys.exit(11)
+                raise InterpretError(11)
 
         # set stdin for the input file
         if self.input == None:
@@ -80,23 +198,133 @@ class Interpret:
         if self.stati != None:
             try:
                 self.stati = open(self.stati, "w")
-            except FileNotFoundError or PermissionError:
+            except OSError:
                 sys.stderr.write(f"[interpret.py]: ERROR (12) - Interpret - read_args()\n")
                 sys.stderr.write(f"                NOTE - Can't write to stati file {self.stati}\n")
-                sys.exit(12)
+                raise InterpretError(12)
+
+        # set up the profile file
+        if self.profile != None:
+            try:
+                self.profile = open(self.profile, "w")
+            except OSError:
+                sys.stderr.write(f"[interpret.py]: ERROR (12) - Interpret - read_args()\n")
+                sys.stderr.write(f"                NOTE - Can't write to profile file {self.profile}\n")
+                raise InterpretError(12)
+
+        # set up the optimizer report file
+        if self.optimize_report != None:
+            try:
+                self.optimize_report = open(self.optimize_report, "w")
+            except OSError:
+                sys.stderr.write(f"[interpret.py]: ERROR (12) - Interpret - read_args()\n")
+                sys.stderr.write(f"                NOTE - Can't write to optimizer report file {self.optimize_report}\n")
+                raise InterpretError(12)
+
+        # set up the fusion report file
+        if self.fusion_report != None:
+            try:
+                self.fusion_report = open(self.fusion_report, "w")
+            except OSError:
+                sys.stderr.write(f"[interpret.py]: ERROR (12) - Interpret - read_args()\n")
+                sys.stderr.write(f"                NOTE - Can't write to fusion report file {self.fusion_report}\n")
+                raise InterpretError(12)
+
+        # set up the control flow graph file
+        if self.cfg != None:
+            try:
+                self.cfg = open(self.cfg, "w")
+            except OSError:
+                sys.stderr.write(f"[interpret.py]: ERROR (12) - Interpret - read_args()\n")
+                sys.stderr.write(f"                NOTE - Can't write to control flow graph file {self.cfg}\n")
+                raise InterpretError(12)
+
+        # set up the compiled program cache
+        if args.cache != None:
+            self.cache = ProgramCache(args.cache, args.cache_size)
 
     # run_script():
     # - publ. method which runs the interpret.py script, 
     # - interprets the source file and executes the instructions
     def run_script(self): 
 
+        # try to load the compiled program from the cache
+        program = None
+        if self.cache != None:
+            cache_key, self.source = self.cache.source_key(self.source)
+            program = self.cache.load(cache_key)
+
+        # compiled program is in the cache -> instructions, labels and frame layout
+        if program != None:
+            inst, labels, layout = program
+            self.symt_jump.set_table(labels)
+
+        # compile the source
+        else:
+            inst = self.__compile_source()
+            layout = self.compiler.frame_layout()
+            if self.cache != None:
+                self.cache.store(cache_key, inst, self.symt_jump.get_table(), layout)
+
+        # set up the frames by the variable slots
+        self.execute.frame_data.frame_layout(*layout)
+
+        # write the control flow graph of the program (original instructions, before the fusion)
+        if self.cfg != None:
+            ControlFlowGraph(inst).write_dot(self.cfg)
+
+        # fold the constant operations and remove the unreachable instructions -> stati and profile count the original instructions
+        if self.optimize and self.profile == None and self.stati == None:
+            optimizer = ProgramOptimizer(self.symt_jump)
+            inst = optimizer.optimize(inst)
+            if self.optimize_report != None:
+                optimizer.write(self.optimize_report)
+
+        # run the instructions
+        self.compiler.bind_handlers(inst, self.execute.handlers, self.execute.unresolved_handlers)  # saves the execution method into every instruction
+        self.execute.input_reader = InputReader(self.input)       # input for the READ instruction
+
+        # compile the basic blocks into python functions (compiled engine)
+        if self.engine == "compiled":
+            blocks = BlockCompiler(self.execute).compile_blocks(inst)
+
+        # fuse the instruction sequences -> only the plain loop, stati and profile count the original instructions
+        fusion = None
+        if self.fusion and self.engine == "reference" and self.profile == None and self.stati == None:
+            fusion = InstructionFusion(self.execute.fused_handlers, self.fusion_report != None)
+            inst = fusion.fuse(inst)
+
+        # runs every instruction in the array of instructions, buffered output is flushed at the end (EXIT and errors included)
+        try:
+            if self.profile != None:
+                self.__run_instructions_profile(inst)
+            elif self.stati != None:
+                self.__run_instructions_stati(inst)
+            elif self.engine == "compiled":
+                self.__run_blocks(blocks)
+            else:
+                self.__run_instructions(inst)
+        finally:
+            self.execute.output.flush()
+            if self.fusion_report != None and fusion != None:
+                fusion.write(self.fusion_report)
+
+
+    # compile_source():
+    # - parses and compiles the source file, labels are saved into the symt_jump
+    # - returns the compiled instructions (without handlers -> they can be saved into the cache)
+    def __compile_source(self):
+
         # parse the instructions onto an array of instructions
         inst = self.input_parse.parse_instructions(self.source)
 
-        # run the instructions
-        self.__init_symt_jump(inst)                        # searches for labels and saves their position
-        self.__run_instructions(inst, self.symt_jump)      # runs every instruction in the array of instructions
+        # check and decode the instruction arguments only once
+        inst = self.compiler.compile_instructions(inst)
 
+        # resolve the labels
+        self.__init_symt_jump(inst)                           # searches for labels and saves their position
+        self.compiler.link_labels(inst, self.symt_jump)       # saves the label position into the jump instructions
+        return inst
 
     # init_symt_jump():
     # - initializes the symt_jump class 
@@ -107,151 +335,106 @@ class Interpret:
         i = 0
         while i < len(inst):    
             if inst[i].opcode == "LABEL":
-                self.symt_jump.add_label(inst[i].arg1_text, i)
+                self.symt_jump.add_label(inst[i].arg1.value, i)
 
             i += 1
 
     # run_instructions():
     # - executes every instruction in the array of instructions
-    # - calls the appropriate method for every instruction
-    #
-    # return error codes:
-    # = 32 - invalid instruction -> instruction not found in the opcode_inst_methods dictionary
-    def __run_instructions(self, inst, symt_jump):
-
-        # [1] - methods with instrusction data
-        opcode_inst_methods = {
-            "MOVE" : self.run.execute_move,               # Data frames
-            "DEFVAR" : self.run.execute_defvar,
-            "CREATEFRAME" : self.run.execute_createframe,    
-            "PUSHFRAME" : self.run.execute_pushframe,
-            "POPFRAME" : self.run.execute_popframe,
-            "PUSHS" : self.run.execute_pushs,             # Data stack
-            "POPS" : self.run.execute_pops,
-            "ADD" : self.run.execute_add,                 # Arithmetic
-            "SUB" : self.run.execute_sub,
-            "MUL" : self.run.execute_mul,
-            "IDIV" : self.run.execute_idiv,
-            "LT" : self.run.execute_lt,                   # Relational
-            "GT" : self.run.execute_gt,
-            "EQ" : self.run.execute_eq,
-            "AND" : self.run.execute_and,                 # Logical
-            "OR" : self.run.execute_or,
-            "NOT" : self.run.execute_not,
-            "INT2CHAR" : self.run.execute_int2char,       # Conversion
-            "STRI2INT" : self.run.execute_stri2int,
-            "WRITE" : self.run.execute_write,             # I/O  
-            "CONCAT" : self.run.execute_concat,           # String operations
-            "STRLEN" : self.run.execute_strlen,
-            "GETCHAR" : self.run.execute_getchar,
-            "SETCHAR" : self.run.execute_setchar,
-            "TYPE" : self.run.execute_type,               # Type           
-            "LABEL" : self.run.execute_label,             # Program flow
-            "EXIT" : self.run.execute_exit,                        
-            "DPRINT" : self.run.execute_dprint,           # Debugging
-            "BREAK" : self.run.execute_break,
-            "CLEARS" : self.run.execute_clears,           # Data-stack expansions
-            "ADDS" : self.run.execute_adds,
-            "SUBS" : self.run.execute_subs,
-            "MULS" : self.run.execute_muls,
-            "IDIVS" : self.run.execute_idivs,
-            "LTS" : self.run.execute_lts,
-            "GTS" : self.run.execute_gts,
-            "EQS" : self.run.execute_eqs,
-            "ANDS" : self.run.execute_ands,
-            "ORS" : self.run.execute_ors,
-            "NOTS" : self.run.execute_nots,
-            "INT2CHARS" : self.run.execute_int2chars,
-            "STRI2INTS" : self.run.execute_stri2ints,
-        }
-
-        # [2] - methods with instrusction data which return a jump value
-        opcode_jump_methods = {
-            "JUMP" : self.run.execute_jump,                   # Program flow
-            "JUMPIFEQ" : self.run.execute_jumpifeq,
-            "JUMPIFNEQ" : self.run.execute_jumpifneq,         # Data-stack expansions
-            "JUMPIFEQS" : self.run.execute_jumpifeqs,
-            "JUMPIFNEQS" : self.run.execute_jumpifneqs,
-        }
-
-        # [3] - call method
-        opcode_call_method = {
-            "CALL" : self.run.execute_call,                   # Function calls         
-        }
-
-        # [4] - return method
-        opcode_return_method = {
-            "RETURN" : self.run.execute_return,               # Function calls
-        }
-
-        # [5] - methods which require input/output
-        opcode_read_method = {
-           "READ" : self.run.execute_read,                   # Input/Output
-        }
-
-
-        # reading instructions and calling the corresponding execution method
-        i = 0
-        while i < len(inst):
-
-            # [0] - debug
-            #sys.stderr.write(f"{inst[i].order} - {inst[i].opcode}\n")
-            #sys.stderr.write(f"              {inst[i].arg1_type} {inst[i].arg1_text}\n")
-            #sys.stderr.write(f"              {inst[i].arg2_type} {inst[i].arg2_text}\n")
-            #sys.stderr.write(f"              {inst[i].arg3_type} {inst[i].arg3_text}\n")
-
-            # [1] - basic instructions
-            if inst[i].opcode in opcode_inst_methods:
-                opcode_inst_methods[inst[i].opcode](inst[i])
-                i += 1
-
-            # [2] - jump instructions
-            elif inst[i].opcode in opcode_jump_methods:
-                
-                # get the next instruction index
-                inst_order = opcode_jump_methods[inst[i].opcode](inst[i], symt_jump)
-                
-                # if the instruction is not a jump, then continue with the next instruction
-                if inst_order == -1:
-                    i += 1
-                else:
-                    i = inst_order
-
-
-            # [3] - call instruction
-            elif inst[i].opcode in opcode_call_method:
-
-                # get the next instruction index
-                inst_order = opcode_call_method[inst[i].opcode](inst[i], symt_jump, i)
-
-                # if the instruction is not a jump, then continue with the next instruction
-                if inst_order == -1:
-                    i += 1
+    # - every instruction has its bound handler, which returns the position of the next instruction
+    def __run_instructions(self, inst):
+
+        # reading instructions and calling their handlers
+        pc = 0
+        inst_count = len(inst)
+        while pc < inst_count:
+            pc = inst[pc].handler(inst[pc], pc)
+
+    # run_blocks():
+    # - executes the compiled basic blocks (BlockCompiler), every block returns the position of the next block
+    def __run_blocks(self, blocks):
+
+        # calling the blocks
+        pc = 0
+        inst_count = len(blocks)
+        while pc < inst_count:
+            pc = blocks[pc]()
+
+    # run_instructions_stati():
+    # - same as run_instructions(), but it also collects the statistics (STATI extension)
+    # - statistics are written into the stati file at the end of the program or on the EXIT instruction
+    def __run_instructions_stati(self, inst):
+
+        # statistics and the instructions which can initialize a new variable
+        stati = Statistics(inst)
+        frame_data = self.execute.frame_data
+        writes_var = [self.compiler.writes_var(instruction) for instruction in inst]
+
+        # reading instructions and calling their handlers
+        pc = 0
+        inst_count = len(inst)
+        try:
+            while pc < inst_count:
+                stati.counts[pc] += 1
+
+                # variable which wasn't initialized -> number of initialized variables can grow
+                if writes_var[pc] and not frame_data.symt_is_init(inst[pc].arg1):
+                    pc_next = inst[pc].handler(inst[pc], pc)
+                    stati.update_vars(frame_data.symt_count_init())
+                    pc = pc_next
                 else:
-                    i = inst_order
-
-            # [4] - return instruction
-            elif inst[i].opcode in opcode_return_method:
-
-                # get the next instruction index
-                inst_order = opcode_return_method[inst[i].opcode](inst[i])
-
-                # if the instruction is not a jump, then continue with the next instruction
-                if inst_order == -1:
-                    i += 1
+                    pc = inst[pc].handler(inst[pc], pc)
+
+        # EXIT instruction -> write the statistics, errors don't write them
+        except InterpretExit as exit_code:
+            if not isinstance(exit_code, InterpretError):
+                stati.write(self.stati, self.stati_args)
+            raise
+
+        stati.write(self.stati, self.stati_args)
+
+    # run_instructions_profile():
+    # - same as run_instructions(), but it measures the wall time and the count of every executed instruction
+    # - the called functions (CALL targets) are tracked by the size of the function call stack
+    # - collapsed stacks are written into the profile file when the program ends (EXIT and errors included)
+    def __run_instructions_profile(self, inst):
+
+        # profiler and its current stack of called functions
+        profiler = Profiler(inst)
+        samples = profiler.samples
+        func_stack = self.execute.func_stack
+        clock = time.perf_counter_ns
+        stack = profiler.stack
+        depth = 0
+
+        # reading instructions and calling their handlers
+        pc = 0
+        inst_count = len(inst)
+        try:
+            while pc < inst_count:
+                start = clock()
+                pc_next = inst[pc].handler(inst[pc], pc)
+                elapsed = clock() - start
+
+                # save the sample of the instruction
+                sample = samples.get((stack, pc))
+                if sample is None:
+                    samples[(stack, pc)] = [1, elapsed]
                 else:
-                    i = inst_order
+                    sample[0] += 1
+                    sample[1] += elapsed
 
-            # [5] - read instruction
-            elif inst[i].opcode in opcode_read_method:
-                opcode_read_method[inst[i].opcode](inst[i], self.input)
-                i += 1
+                # CALL or RETURN was executed -> change the stack of called functions
+                if func_stack.size() != depth:
+                    depth = func_stack.size()
+                    stack = profiler.update_stack(inst[pc], depth)
 
-            # [6] - unknown instruction
-            else:
-                sys.stderr.write(f"[interpret.py]: ERROR (32) - Interpret - run_instructions()\n")
-                sys.stderr.write(f"                NOTE - Unknown instruction ({inst[i].opcode})\n")
-                sys.exit(32)
+                pc = pc_next
+        finally:
+            # instruction which ended the program (EXIT, error) has no sample yet
+            if pc < inst_count:
+                profiler.add_sample(stack, pc, clock() - start)
+            profiler.write(self.profile, self.profile_counts)
 
 
 
@@ -268,6 +451,8 @@ class InputParser:
     # - contains all the information about the instruction
     # - used for easier access to the instruction data, used like c like structure
     class Instruction:
+        __slots__ = ("opcode", "order", "arg1_type", "arg1_text", "arg2_type", "arg2_text", "arg3_type", "arg3_text")
+
         def __init__(self, opcode, order, arg1_type, arg1_text, arg2_type, arg2_text, arg3_type, arg3_text):
             self.opcode = opcode
             self.order = order
@@ -278,8 +463,10 @@ class InputParser:
             self.arg3_type = arg3_type
             self.arg3_text = arg3_text
 
-    # run_instructions():
+    # parse_instructions():
     # - parses the xml file and saves the instructions into a list of Instruction class
+    # - the xml file is read as a stream (iterparse), every processed instruction element is removed from the tree
+    # - structure errors are reported after the whole file is read, so the invalid xml (31) has always priority
     # - method returns the list of instructions
     #
     # return errors codes:
@@ -288,115 +475,131 @@ class InputParser:
     def parse_instructions(self, source):
 
         # initialize instruction data
-        inst = []
+        parsed = []             # [(order, instruction, argument error)]
+        error = None            # first root/instruction error -> (error code, note)
+        tree_root = None
+        args = []
+        depth = 0
 
-        # get xml_tree children data
+        # read the xml elements one by one
         try:
-            tree_root = ET.fromstring(source.read())
-        except:
+            for event, element in ET.iterparse(source, events=("start", "end")):
+
+                # check the root when it starts (attributes are already known)
+                if event == "start":
+                    depth += 1
+                    if depth == 1:
+                        tree_root = element
+                        if element.tag != "program" or element.attrib.get("language") != "IPPcode23":
+                            error = (32, f"Unknown root xml argument ({element.tag})")
+                    continue
+                depth -= 1
+
+                # save the instruction argument
+                if depth == 2:
+                    args.append((element.tag, element.attrib.get("type"), element.text))
+
+                # save the instruction and remove it from the tree
+                elif depth == 1:
+                    if error is None:
+                        error = self.__check_instruction(element)
+                    if error is None:
+                        instruction = self.Instruction(element.attrib.get("opcode").upper(), element.attrib.get("order"), None, None, None, None, None, None)
+                        parsed.append((int(instruction.order), instruction, self.__parse_instruction_args(instruction, args)))
+                    args = []
+                    tree_root.clear()
+
+        except (ET.ParseError, UnicodeDecodeError, ValueError):
             sys.stderr.write(f"[interpret.py]: ERROR (31) - InputParser - parse_instructions()\n")
             sys.stderr.write(f"                NOTE - Source file is not in xml format\n")
-            sys.exit(31)
+            raise InterpretError(31)
 
-        # check root arg
-        if tree_root.tag != "program" or tree_root.attrib.get("language") != "IPPcode23":
-            sys.stderr.write(f"[interpret.py]: ERROR (32) - InputParser - parse_instructions()\n")
-            sys.stderr.write(f"                NOTE - Unknown root xml argument ({tree_root.tag})\n")
-            sys.exit(32)
-        
-        # get xml_tree children data
-        tree_children = list(tree_root)
-
-        # go through the children and check if the order and args are valid
-        for child in tree_children:
-
-            # check if the root arg is valid
-            if (child.tag != "instruction"):
-                sys.stderr.write(f"[interpret.py]: ERROR (32) - InputParser - parse_instructions()\n")
-                sys.stderr.write(f"                NOTE - Unknown child xml argument ({child.tag})\n")
-                sys.exit(32)
-
-            # check if opcode exists
-            if child.attrib.get('opcode') is None:
-                sys.stderr.write(f"[interpret.py]: ERROR (32) - InputParser - parse_instructions()\n")
-                sys.stderr.write(f"                NOTE - Missing opcode xml argument ({child.attrib.get('opcode')})\n")
-                sys.exit(32)
-
-            # check the order type if it is a number and if it is positive
-            if (child.attrib.get('order') is None) or (not child.attrib.get('order').isdigit()) or (int(child.attrib.get('order')) < 0):
-                sys.stderr.write(f"[interpret.py]: ERROR (32) - InputParser - parse_instructions()\n")
-                sys.stderr.write(f"                NOTE - Wrong xml instruction order ({child.attrib.get('order')})\n")
-                sys.exit(32)
-
-        # try to sort the children by the order
-        try:
-            tree_children.sort(key=lambda child: int(child.attrib.get('order') or 0))
-        except:
-            sys.stderr.write(f"[interpret.py]: ERROR (32) - InputParser - parse_instructions()\n")
-            sys.stderr.write(f"                NOTE - Wrong xml instruction order ({child.attrib.get('order')})\n")
-            sys.exit(32)
+        # report the root/instruction error
+        if error is not None:
+            self.__structure_error(error)
 
-        # reading tree_children -> instruction data
+        # sort the instructions by the order and check their arguments
+        inst = []
         order = 0
-        for child in tree_children:
+        for inst_order, instruction, args_error in sorted(parsed, key=lambda parsed_inst: parsed_inst[0]):
 
             # check if the instruction has been sorted correctly by the order
-            if (int(child.attrib.get('order')) <= order):
-                sys.stderr.write(f"[interpret.py]: ERROR (32) - InputParser - parse_instructions()\n")
-                sys.stderr.write(f"                NOTE - Wrong xml instruction order ({child.attrib.get('order')})\n")
-                sys.exit(32)
-            
-            # get instruction data
-            instruction = self.Instruction(child.attrib.get("opcode").upper(), child.attrib.get("order"), None, None, None, None, None, None)
-            order = int(child.attrib.get('order'))
+            if inst_order <= order:
+                self.__structure_error((32, f"Wrong xml instruction order ({instruction.order})"))
+            order = inst_order
 
-            # get xml_tree sub_children data
-            tree_sub_children = list(child)
-            
-            # sort the sub_children by the arg + number
-            try:
-                tree_sub_children.sort(key=lambda sub_child: sub_child.tag)
-            except:
-                sys.stderr.write(f"[interpret.py]: ERROR (32) - InputParser - parse_instructions()\n")
-                sys.stderr.write(f"                NOTE - Unknown subchild xml argument ({sub_child.tag})\n")
-                sys.exit(32)
-            
-            # reading tree_sub_children -> instruction arguments
-            sub_child_index = 0
-            for sub_child_index, sub_child in enumerate(tree_sub_children):
-
-                # check if the argument is valid
-                if sub_child.tag != "arg" + str(sub_child_index + 1):
-                    sys.stderr.write(f"[interpret.py]: ERROR (32) - InputParser - parse_instructions()\n")
-                    sys.stderr.write(f"                NOTE - Unknown subchild xml argument ({sub_child.tag})\n")
-                    sys.exit(32)
-                
-                # get instruction argument data
-                if sub_child_index == 0:
-                    instruction.arg1_type = sub_child.attrib.get("type")
-                    instruction.arg1_text = sub_child.text
-                elif sub_child_index == 1:
-                    instruction.arg2_type = sub_child.attrib.get("type")
-                    instruction.arg2_text = sub_child.text
-                elif sub_child_index == 2:
-                    instruction.arg3_type = sub_child.attrib.get("type")
-                    instruction.arg3_text = sub_child.text
-                else:
-                    sys.stderr.write(f"[interpret.py]: ERROR (31) - InputParser - parse_instructions()\n")
-                    sys.stderr.write(f"                NOTE - Too many arguments , the maximum number of arguments is 3\n")
-                    sys.exit(31)
+            # check the instruction arguments
+            if args_error is not None:
+                self.__structure_error(args_error)
 
-            inst.append(instruction) 
+            inst.append(instruction)
         return inst
+
+    # check_instruction():
+    # - checks the instruction element (tag, opcode, order)
+    # - returns None or the error -> (error code, note)
+    def __check_instruction(self, element):
+
+        # check if the root arg is valid
+        if element.tag != "instruction":
+            return (32, f"Unknown child xml argument ({element.tag})")
+
+        # check if opcode exists
+        if element.attrib.get('opcode') is None:
+            return (32, f"Missing opcode xml argument ({element.attrib.get('opcode')})")
+
+        # check the order type if it is a number and if it is positive
+        if (element.attrib.get('order') is None) or (not element.attrib.get('order').isdigit()) or (int(element.attrib.get('order')) < 0):
+            return (32, f"Wrong xml instruction order ({element.attrib.get('order')})")
+
+        return None
+
+    # parse_instruction_args():
+    # - saves the arguments [(tag, type, text)] into the instruction
+    # - returns None or the error -> (error code, note)
+    def __parse_instruction_args(self, instruction, args):
+
+        # reading arguments sorted by the arg + number
+        for arg_index, (arg_tag, arg_type, arg_text) in enumerate(sorted(args, key=lambda arg: arg[0])):
+
+            # check if the argument is valid
+            if arg_tag != "arg" + str(arg_index + 1):
+                return (32, f"Unknown subchild xml argument ({arg_tag})")
+
+            # get instruction argument data
+            if arg_index == 0:
+                instruction.arg1_type = arg_type
+                instruction.arg1_text = arg_text
+            elif arg_index == 1:
+                instruction.arg2_type = arg_type
+                instruction.arg2_text = arg_text
+            elif arg_index == 2:
+                instruction.arg3_type = arg_type
+                instruction.arg3_text = arg_text
+            else:
+                return (31, f"Too many arguments , the maximum number of arguments is 3")
+
+        return None
+
+    # structure_error():
+    # - reports the xml structure error -> (error code, note) and exits
+    def __structure_error(self, error):
+        error_code, note = error
+        sys.stderr.write(f"[interpret.py]: ERROR ({error_code}) - InputParser - parse_instructions()\n")
+        sys.stderr.write(f"                NOTE - {note}\n")
+        raise InterpretError(error_code)
     
     # parse_arguments():
     # - parses the arguments from the command line
     # - uses the argparse library
-    # - returns the interpret.py arguments as (source_file, input_file, stati_file, stati_args[])
+    # - returns the interpret.py arguments (argparse.Namespace), they are read by their names
+    #   = source, input, stati, stati_args[], profile, profile_counts, cache, cache_size, serve, no_fusion, fusion_report, cfg, engine,
+    #     no_optimize, optimize_report
+    # - args are the parsed arguments, default is the command line (sys.argv)
     #
     # return error codes:
     # = 10 - missing/wrong arguments
-    def parse_arguments(self):
+    def parse_arguments(self, args=None):
 
         # initialize the argument parser
         parser = argparse.ArgumentParser()
@@ -405,28 +608,1481 @@ class InputParser:
         parser.add_argument("--source", help="source file -> path to ippcode23.xml file, default is (stdin)", required=False)       # source file input
         parser.add_argument("--input", help="input file -> path to a file, defalut is (stdin)", required=False)                     # input file input
 
-        # stati arguments -> to be implemented
+        # stati arguments -> saved into stati_args in the order they were given
         parser.add_argument("--stati", help="statistics file -> file where statistics are writen", required=False)                  # stati file output
-        parser.add_argument("--insts", help="  stati arg (insts)", required=False)                                                  # insts
-        parser.add_argument("--hot", help="  stati arg (hot)", required=False)                                                      # hot
-        parser.add_argument("--vars", help="  stati arg (vars)", required=False)                                                    # vars
-        parser.add_argument("--frequent", help="  stati arg (frequent)", required=False)                                            # frequent
-        parser.add_argument("--eol", help="  stati arg (eol)", required=False)                                                      # eol
+        parser.add_argument("--insts", help="  stati arg (insts)", dest="stati_args", action="append_const", const="insts")        # insts
+        parser.add_argument("--hot", help="  stati arg (hot)", dest="stati_args", action="append_const", const="hot")              # hot
+        parser.add_argument("--vars", help="  stati arg (vars)", dest="stati_args", action="append_const", const="vars")           # vars
+        parser.add_argument("--frequent", help="  stati arg (frequent)", dest="stati_args", action="append_const", const="frequent")   # frequent
+        parser.add_argument("--eol", help="  stati arg (eol)", dest="stati_args", action="append_const", const="eol")              # eol
 
-        # parse the arguments
-        arg_source = parser.parse_args().source
-        arg_input = parser.parse_args().input
-        arg_stati = parser.parse_args().stati
-        stati_args = [arg_stati, parser.parse_args().insts, parser.parse_args().vars, parser.parse_args().hot, parser.parse_args().frequent, parser.parse_args().eol]
+        # profile arguments
+        parser.add_argument("--profile", help="profile file -> file where collapsed stacks (flame graph) are writen", required=False)   # profile file output
+        parser.add_argument("--profile-counts", help="  profile weighted by execution counts instead of time", action="store_true")      # profile counts
+
+        # compiled program cache arguments
+        parser.add_argument("--cache", help="cache directory -> compiled programs are saved there and reused, has to be trusted (pickle)", required=False)                # cache directory
+        parser.add_argument("--cache-size", help="  maximal size of the cache in MB, default is 64", type=int, default=64)                      # cache size
+
+        # optimizer arguments
+        parser.add_argument("--no-optimize", help="constant operations aren't folded and unreachable instructions aren't removed", action="store_true")   # optimizer off
+        parser.add_argument("--optimize-report", help="optimizer report file -> folded and eliminated instructions are writen", required=False)          # optimizer report
+
+        # superinstruction arguments
+        parser.add_argument("--no-fusion", help="instruction sequences aren't fused into superinstructions", action="store_true")          # fusion off
+        parser.add_argument("--fusion-report", help="fusion report file -> fused sequences and saved dispatches are writen", required=False)   # fusion report
 
-        # check arg_souce and arg_input args -> one must be present
-        if arg_source == None and arg_input == None:
+        # control flow graph arguments
+        parser.add_argument("--cfg", help="control flow graph file -> basic blocks of the program are writen in the DOT format", required=False)   # cfg file output
+
+        # execution engine arguments
+        parser.add_argument("--engine", help="execution engine -> reference (instruction by instruction) or compiled (python code of basic blocks)", default="reference")   # engine
+
+        # server arguments
+        parser.add_argument("--serve", help="server socket -> interpret waits for the programs of the clients (interpret_client.py)", required=False)    # server socket
+
+        # parse the arguments
+        args = parser.parse_args(args)
+        if args.stati_args == None:
+            args.stati_args = []
+
+        # server -> the other arguments are given by the clients
+        if args.serve != None:
+            if args.source != None or args.input != None or args.stati != None or args.profile != None or args.cache != None:
+                sys.stderr.write("[interpret.py]: ERROR (10) - InputParser - parse_arguments()\n")
+                sys.stderr.write("                NOTE - Argument --serve can't be used with the other arguments\n")
+                raise InterpretError(10)
+            return args
+
+        # check the source and input arguments -> one must be present
+        if args.source == None and args.input == None:
             sys.stderr.write("[interpret.py]: ERROR (10) - InputParser - parse_arguments()\n")
             sys.stderr.write("                NOTE - Missing arguments: --source and --input\n")
-            sys.exit(10)
+            raise InterpretError(10)
+
+        # check the stati arguments -> they can't be used without the stati file
+        if args.stati == None and len(args.stati_args) > 0:
+            sys.stderr.write("[interpret.py]: ERROR (10) - InputParser - parse_arguments()\n")
+            sys.stderr.write("                NOTE - Missing argument: --stati, required by --insts, --hot, --vars, --frequent, --eol\n")
+            raise InterpretError(10)
+
+        # check the profile arguments -> profile can't be used with stati, counts can't be used without profile
+        if args.profile != None and args.stati != None:
+            sys.stderr.write("[interpret.py]: ERROR (10) - InputParser - parse_arguments()\n")
+            sys.stderr.write("                NOTE - Arguments --profile and --stati can't be used together\n")
+            raise InterpretError(10)
+        if args.profile == None and args.profile_counts:
+            sys.stderr.write("[interpret.py]: ERROR (10) - InputParser - parse_arguments()\n")
+            sys.stderr.write("                NOTE - Missing argument: --profile, required by --profile-counts\n")
+            raise InterpretError(10)
+
+        # check the optimizer arguments -> stati and profile count the original instructions
+        if args.optimize_report != None and (args.no_optimize or args.stati != None or args.profile != None):
+            sys.stderr.write("[interpret.py]: ERROR (10) - InputParser - parse_arguments()\n")
+            sys.stderr.write("                NOTE - Argument --optimize-report can't be used with --no-optimize, --stati or --profile\n")
+            raise InterpretError(10)
+
+        # check the fusion arguments -> report needs the fused instructions, stati and profile count the original instructions
+        if args.fusion_report != None and (args.no_fusion or args.stati != None or args.profile != None):
+            sys.stderr.write("[interpret.py]: ERROR (10) - InputParser - parse_arguments()\n")
+            sys.stderr.write("                NOTE - Argument --fusion-report can't be used with --no-fusion, --stati or --profile\n")
+            raise InterpretError(10)
+
+        # check the engine -> compiled blocks can't count the single instructions (stati, profile, fusion report)
+        if args.engine not in ("reference", "compiled"):
+            sys.stderr.write("[interpret.py]: ERROR (10) - InputParser - parse_arguments()\n")
+            sys.stderr.write(f"                NOTE - Wrong argument: --engine={args.engine}, expected reference or compiled\n")
+            raise InterpretError(10)
+        if args.engine == "compiled" and (args.stati != None or args.profile != None or args.fusion_report != None):
+            sys.stderr.write("[interpret.py]: ERROR (10) - InputParser - parse_arguments()\n")
+            sys.stderr.write("                NOTE - Argument --engine=compiled can't be used with --stati, --profile or --fusion-report\n")
+            raise InterpretError(10)
+
+        # check the cache size
+        if args.cache_size <= 0:
+            sys.stderr.write("[interpret.py]: ERROR (10) - InputParser - parse_arguments()\n")
+            sys.stderr.write(f"                NOTE - Wrong argument: --cache-size={args.cache_size}, has to be positive\n")
+            raise InterpretError(10)
 
         # return the arguments
-        return arg_source, arg_input, arg_stati, stati_args
+        return args
+
+
+
+# -  # - - - - - - - - - - - - - - - - - #
+# -  #    INSTRUCTION-COMPILER CLASS      #
+# -  # - - - - - - - - - - - - - - - - - #
+#
+# usage:
+# - compiles the parsed instructions (InputParser.Instruction) before they are executed
+# - checks the number and the kind of instruction arguments and decodes every operand exactly once
+# - the executed instructions then only do the semantic work (frames, types, values)
+#
+# dependencies:
+# - VariableAnalysis class      - used to check/decode the operands
+# - SymbolTableJump class       - used to resolve labels into instruction positions
+class InstructionCompiler:
+
+    # Operand class:
+    # - pre-decoded instruction argument, used like c like structure
+    # - kind "var"   -> scope, name, slot (GF@x -> "GF", "x", index of x in the frame)
+    # - kind "const" -> type, value   (string@a\032b -> "string", "a b")
+    # - kind "label" -> value, target (label name, absolute position of the label in the instruction array)
+    # - kind "type"  -> value         (type name -> int, bool, string)
+    class Operand:
+        __slots__ = ("kind", "type", "text", "value", "scope", "name", "slot", "target")
+
+        def __init__(self, kind, arg_type, text):
+            self.kind = kind
+            self.type = arg_type
+            self.text = text
+            self.value = None
+            self.scope = None
+            self.name = None
+            self.slot = None
+            self.target = None
+
+    # CompiledInstruction class:
+    # - instruction with pre-decoded operands, used like c like structure
+    # - arg1, arg2, arg3 are Operand objects or None if the argument is not used
+    # - handler is the bound execution method -> handler(inst, pc) returns the next pc
+    # - fused are the original instructions of the superinstruction (InstructionFusion), None for the other instructions
+    class CompiledInstruction:
+        __slots__ = ("opcode", "order", "arg1", "arg2", "arg3", "handler", "fused")
+
+        def __init__(self, opcode, order, arg1, arg2, arg3):
+            self.opcode = opcode
+            self.order = order
+            self.arg1 = arg1
+            self.arg2 = arg2
+            self.arg3 = arg3
+            self.handler = None
+            self.fused = None
+
+    def __init__(self):
+        self.inspect = VariableAnalysis()   # checks/decodes the operands
+        self.gf_slots = {}                  # GF variable name -> slot
+        self.frame_slots = {}               # LF/TF variable name -> slot (TF becomes LF, so they share the slots)
+
+        # expected arguments of every instruction
+        self.signatures = {
+            "MOVE" : ("var", "symb"),                       # Data frames
+            "DEFVAR" : ("var",),
+            "CREATEFRAME" : (),
+            "PUSHFRAME" : (),
+            "POPFRAME" : (),
+            "CALL" : ("label",),                            # Function calls
+            "RETURN" : (),
+            "PUSHS" : ("symb",),                            # Data stack
+            "POPS" : ("var",),
+            "ADD" : ("var", "symb", "symb"),                # Arithmetic
+            "SUB" : ("var", "symb", "symb"),
+            "MUL" : ("var", "symb", "symb"),
+            "IDIV" : ("var", "symb", "symb"),
+            "DIV" : ("var", "symb", "symb"),
+            "LT" : ("var", "symb", "symb"),                 # Relational
+            "GT" : ("var", "symb", "symb"),
+            "EQ" : ("var", "symb", "symb"),
+            "AND" : ("var", "symb", "symb"),                # Logical
+            "OR" : ("var", "symb", "symb"),
+            "NOT" : ("var", "symb"),
+            "INT2CHAR" : ("var", "symb"),                   # Conversion
+            "STRI2INT" : ("var", "symb", "symb"),
+            "INT2FLOAT" : ("var", "symb"),
+            "FLOAT2INT" : ("var", "symb"),
+            "READ" : ("var", "type"),                       # I/O
+            "WRITE" : ("symb",),
+            "CONCAT" : ("var", "symb", "symb"),             # String operations
+            "STRLEN" : ("var", "symb"),
+            "GETCHAR" : ("var", "symb", "symb"),
+            "SETCHAR" : ("var", "symb", "symb"),
+            "TYPE" : ("var", "symb"),                       # Type
+            "LABEL" : ("label",),                           # Program flow
+            "JUMP" : ("label",),
+            "JUMPIFEQ" : ("label", "symb", "symb"),
+            "JUMPIFNEQ" : ("label", "symb", "symb"),
+            "EXIT" : ("symb",),
+            "DPRINT" : ("symb",),                           # Debugging
+            "BREAK" : (),
+            "CLEARS" : (),                                  # Data-stack expansions
+            "ADDS" : (),
+            "SUBS" : (),
+            "MULS" : (),
+            "IDIVS" : (),
+            "LTS" : (),
+            "GTS" : (),
+            "EQS" : (),
+            "ANDS" : (),
+            "ORS" : (),
+            "NOTS" : (),
+            "INT2CHARS" : (),
+            "STRI2INTS" : (),
+            "DIVS" : (),                                    # Float extension
+            "INT2FLOATS" : (),
+            "FLOAT2INTS" : (),
+            "JUMPIFEQS" : ("label",),
+            "JUMPIFNEQS" : ("label",),
+        }
+
+    # compile_instructions():
+    # - compiles every parsed instruction into CompiledInstruction
+    # - returns the list of compiled instructions
+    def compile_instructions(self, inst):
+        self.gf_slots = {}
+        self.frame_slots = {}
+        return [self.compile_instruction(instruction) for instruction in inst]
+
+    # frame_layout():
+    # - returns the variable names of the GF slots and of the LF/TF slots -> (gf_names, frame_names)
+    def frame_layout(self):
+        return list(self.gf_slots), list(self.frame_slots)
+
+    # compile_instruction():
+    # - checks the instruction arguments and decodes them into Operand objects
+    # - returns the CompiledInstruction
+    #
+    # return error codes:
+    # = 32 - Unknown instruction -> opcode doesn't exist
+    # = 32 - Wrong number of arguments -> too many or missing arguments
+    def compile_instruction(self, inst):
+
+        # check if the instruction exists
+        if inst.opcode not in self.signatures:
+            sys.stderr.write(f"[interpret.py]: ERROR (32) - InstructionCompiler - compile_instruction()\n")
+            sys.stderr.write(f"                NOTE - Unknown instruction ({inst.opcode})\n")
+            raise InterpretError(32)
+
+        # expected and given arguments
+        signature = self.signatures[inst.opcode]
+        args = [(inst.arg1_type, inst.arg1_text), (inst.arg2_type, inst.arg2_text), (inst.arg3_type, inst.arg3_text)]
+        expected = " ".join([inst.opcode] + [f"<{kind}>" for kind in signature])
+
+        # check if there are no extra arguments
+        for arg_type, arg_text in args[len(signature):]:
+            if arg_type is not None or arg_text is not None:
+                sys.stderr.write(f"[interpret.py]: ERROR (32) - InstructionCompiler - compile_instruction()\n")
+                sys.stderr.write(f"                NOTE - Too many arguments, expected - {expected}\n")
+                sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode}\n")
+                raise InterpretError(32)
+
+        # decode the expected arguments
+        operands = [None, None, None]
+        for index, kind in enumerate(signature):
+            arg_type, arg_text = args[index]
+
+            # check if the argument is present
+            if arg_type is None:
+                sys.stderr.write(f"[interpret.py]: ERROR (32) - InstructionCompiler - compile_instruction()\n")
+                sys.stderr.write(f"                NOTE - Missing argument, expected - {expected}\n")
+                sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode}\n")
+                raise InterpretError(32)
+
+            operands[index] = self.compile_operand(inst, kind, arg_type, arg_text)
+
+        return self.CompiledInstruction(inst.opcode, int(inst.order), operands[0], operands[1], operands[2])
+
+    # compile_operand():
+    # - decodes one instruction argument of the given kind (var, symb, label, type)
+    # - symb with unexpected type is kept undecoded and reported (53) when the instruction is executed
+    #
+    # return error codes:
+    # = 32 - Wrong argument kind -> for example <var> was expected
+    # = 32 - Wrong argument format -> decoding in VariableAnalysis failed
+    def compile_operand(self, inst, kind, arg_type, arg_text):
+
+        # change arg_text to ""
+        if arg_text is None:
+            arg_text = ""
+
+        # symb is a variable or a constant
+        if kind == "symb":
+            kind = "var" if arg_type == "var" else "const"
+
+        # check the argument kind
+        if kind in ("var", "label", "type") and arg_type != kind:
+            sys.stderr.write(f"[interpret.py]: ERROR (32) - InstructionCompiler - compile_operand()\n")
+            sys.stderr.write(f"                NOTE - Wrong argument, expected <{kind}>\n")
+            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} <{arg_type}>, {arg_text}\n")
+            raise InterpretError(32)
+
+        operand = self.Operand(kind, arg_type, arg_text)
+
+        # decode the operand
+        if kind == "var":
+            operand.scope, operand.name = self.inspect.analyze_var(arg_text)
+            slots = self.gf_slots if operand.scope == "GF" else self.frame_slots
+            operand.slot = slots.setdefault(operand.name, len(slots))
+        elif kind == "const" and arg_type not in ("int", "float", "bool", "string", "nil"):
+            operand.value = arg_text
+        else:
+            operand.value, _ = self.inspect.analyze_arg(arg_text, arg_type)
+
+        return operand
+
+    # link_labels():
+    # - saves the absolute position of the label into every label operand
+    # - labels which don't exist stay unresolved (None) -> reported only when the jump is executed
+    def link_labels(self, inst, symt_jump):
+        for instruction in inst:
+            if instruction.arg1 is not None and instruction.arg1.kind == "label":
+                instruction.arg1.target = symt_jump.find_label(instruction.arg1.value)
+
+    # writes_var():
+    # - returns True if the instruction saves a value into its first argument (var), DEFVAR doesn't save any value
+    def writes_var(self, instruction):
+        return instruction.opcode != "DEFVAR" and instruction.arg1 is not None and instruction.arg1.kind == "var"
+
+    # bind_handlers():
+    # - saves the execution method of every instruction into the instruction (direct-threaded dispatch)
+    # - handlers is the opcode -> method dictionary of the ExecuteInstruction class
+    # - jumps/calls to the label which doesn't exist get the method from unresolved_handlers (reports error 52 when executed)
+    #   = jump methods of the handlers read only the pre-resolved label position (arg1.target)
+    def bind_handlers(self, inst, handlers, unresolved_handlers):
+        for instruction in inst:
+            if instruction.arg1 is not None and instruction.arg1.kind == "label" and instruction.arg1.target is None \
+               and instruction.opcode in unresolved_handlers:
+                instruction.handler = unresolved_handlers[instruction.opcode]
+            else:
+                instruction.handler = handlers[instruction.opcode]
+
+
+
+# -  # - - - - - - - - - - - - - - - - - - #
+# -  #      PROGRAM-OPTIMIZER CLASS         #
+# -  # - - - - - - - - - - - - - - - - - - - #
+#
+# usage:
+# - optimizes the compiled instructions before their handlers are bound
+#   = instructions with only literal operands are folded into MOVE var <result> -> ADD GF@x int@3 int@4 = MOVE GF@x int@7
+#   = conditional jumps with literal operands are always taken (JUMP) or never taken (removed)
+#   = instructions after JUMP, EXIT and RETURN are unreachable until the next LABEL (removed)
+# - only the operations which can't fail are folded -> wrong types, division by zero and undefined labels stay for the runtime
+# - removed instructions are left out of the array, label positions (Operand.target, SymbolTableJump) are moved
+# - with the report the folded and eliminated instructions are counted
+#
+# dependencies:
+# - InstructionCompiler class   - used to create the folded instructions (CompiledInstruction, Operand)
+# - SymbolTableJump class       - label positions are moved after the removed instructions
+class ProgramOptimizer:
+
+    def __init__(self, symt_jump):
+        self.symt_jump = symt_jump          # label table
+        self.folded = {}                    # opcode -> number of folded instructions
+        self.always_taken = 0               # conditional jumps rewritten into JUMP
+        self.never_taken = 0                # removed conditional jumps
+        self.unreachable = 0                # removed unreachable instructions
+        self.before = 0                     # number of instructions before the optimization
+        self.after = 0                      # number of instructions after the optimization
+
+        # opcode -> method which returns (type, value) of the result, None if the instruction can't be folded
+        self.folds = {
+            "ADD" : self.fold_arithmetic,
+            "SUB" : self.fold_arithmetic,
+            "MUL" : self.fold_arithmetic,
+            "IDIV" : self.fold_arithmetic,
+            "DIV" : self.fold_arithmetic,
+            "LT" : self.fold_relational,
+            "GT" : self.fold_relational,
+            "EQ" : self.fold_eq,
+            "AND" : self.fold_logical,
+            "OR" : self.fold_logical,
+            "NOT" : self.fold_not,
+            "INT2FLOAT" : self.fold_convert,
+            "FLOAT2INT" : self.fold_convert,
+            "CONCAT" : self.fold_concat,
+            "STRLEN" : self.fold_strlen,
+            "TYPE" : self.fold_type,
+        }
+
+    # optimize():
+    # - folds the instructions, rewrites the conditional jumps and removes the unreachable instructions
+    # - returns the optimized instructions
+    def optimize(self, inst):
+        self.before = len(inst)
+
+        # fold the instructions and the jumps, removed instructions are None
+        inst = [self.fold(instruction) for instruction in inst]
+
+        # instructions after the unconditional jumps are unreachable until the next label
+        unreachable = False
+        for pc, instruction in enumerate(inst):
+            if instruction == None:
+                continue
+            if instruction.opcode == "LABEL":
+                unreachable = False
+            elif unreachable:
+                inst[pc] = None
+                self.unreachable += 1
+            elif instruction.opcode in ("JUMP", "EXIT", "RETURN"):
+                unreachable = True
+
+        inst = self.compact(inst)
+        self.after = len(inst)
+        return inst
+
+    # fold():
+    # - returns the folded instruction, None if the instruction is removed (never taken jump)
+    def fold(self, instruction):
+
+        # conditional jump with literal operands and the existing label
+        if instruction.opcode in ("JUMPIFEQ", "JUMPIFNEQ"):
+            taken = self.jump_taken(instruction)
+            if taken == None:
+                return instruction
+            if taken:
+                self.always_taken += 1
+                return InstructionCompiler.CompiledInstruction("JUMP", instruction.order, instruction.arg1, None, None)
+            self.never_taken += 1
+            return None
+
+        # instruction with literal operands -> MOVE var <result>
+        fold_method = self.folds.get(instruction.opcode)
+        if fold_method == None or not self.literal(instruction.arg2) or not self.literal(instruction.arg3):
+            return instruction
+        result = fold_method(instruction)
+        if result == None:
+            return instruction
+
+        self.folded[instruction.opcode] = self.folded.get(instruction.opcode, 0) + 1
+        return InstructionCompiler.CompiledInstruction("MOVE", instruction.order, instruction.arg1, self.constant(*result), None)
+
+    # literal():
+    # - returns True if the operand is a decoded constant (or isn't used)
+    def literal(self, operand):
+        return operand == None or (operand.kind == "const" and operand.type in ("int", "float", "bool", "string", "nil"))
+
+    # constant():
+    # - returns the const operand of the folded value
+    def constant(self, const_type, value):
+        if const_type == "bool":
+            text = "true" if value else "false"
+        elif const_type == "nil":
+            text = "nil"
+        elif const_type == "float":
+            text = value.hex()
+        elif const_type == "string":
+            text = STRING_CODEC.encode(value)
+        else:
+            text = str(value)
+        operand = InstructionCompiler.Operand("const", const_type, text)
+        operand.value = value
+        return operand
+
+    # compact():
+    # - leaves out the removed instructions and moves the label positions
+    def compact(self, inst):
+
+        # new position of every instruction
+        positions = []
+        position = 0
+        for instruction in inst:
+            positions.append(position)
+            if instruction != None:
+                position += 1
+
+        # labels are never removed -> their new positions
+        for instruction in inst:
+            if instruction != None and instruction.arg1 != None and instruction.arg1.kind == "label" and instruction.arg1.target != None:
+                instruction.arg1.target = positions[instruction.arg1.target]
+        labels = self.symt_jump.get_table()
+        for label in labels:
+            labels[label] = positions[labels[label]]
+
+        return [instruction for instruction in inst if instruction != None]
+
+
+    # - FOLDS - #
+    # - every method returns (type, value) of the result or None if the runtime reports an error
+
+    # fold_arithmetic():
+    # - ADD, SUB, MUL int int or float float, IDIV int int, DIV float float (division by zero isn't folded)
+    def fold_arithmetic(self, inst):
+        value_type = inst.arg2.type
+        if value_type != inst.arg3.type or value_type not in ("int", "float"):
+            return None
+        value_1, value_2 = inst.arg2.value, inst.arg3.value
+        if inst.opcode == "ADD":
+            return value_type, value_1 + value_2
+        if inst.opcode == "SUB":
+            return value_type, value_1 - value_2
+        if inst.opcode == "MUL":
+            return value_type, value_1 * value_2
+        if value_2 == 0 or value_type != ("int" if inst.opcode == "IDIV" else "float"):
+            return None
+        if inst.opcode == "IDIV":
+            return "int", value_1 // value_2
+        return "float", value_1 / value_2
+
+    # fold_relational():
+    # - LT, GT with two same types (int, float, string, bool)
+    def fold_relational(self, inst):
+        if inst.arg2.type != inst.arg3.type or inst.arg2.type not in ("int", "float", "string", "bool"):
+            return None
+        if inst.opcode == "LT":
+            return "bool", inst.arg2.value < inst.arg3.value
+        return "bool", inst.arg2.value > inst.arg3.value
+
+    # equal():
+    # - returns True/False if the literals are equal (same types or nil), None if the types can't be compared
+    def equal(self, symb1, symb2):
+        if symb1.type == "nil" or symb2.type == "nil":
+            return symb1.type == symb2.type
+        if symb1.type != symb2.type:
+            return None
+        return symb1.value == symb2.value
+
+    # fold_eq():
+    # - EQ with two same types or nil
+    def fold_eq(self, inst):
+        equal = self.equal(inst.arg2, inst.arg3)
+        return None if equal == None else ("bool", equal)
+
+    # fold_logical():
+    # - AND, OR bool bool
+    def fold_logical(self, inst):
+        if inst.arg2.type != "bool" or inst.arg3.type != "bool":
+            return None
+        if inst.opcode == "AND":
+            return "bool", inst.arg2.value and inst.arg3.value
+        return "bool", inst.arg2.value or inst.arg3.value
+
+    # fold_not():
+    # - NOT bool
+    def fold_not(self, inst):
+        return ("bool", not inst.arg2.value) if inst.arg2.type == "bool" else None
+
+    # fold_convert():
+    # - INT2FLOAT int, FLOAT2INT float (too big int, inf and nan aren't folded)
+    def fold_convert(self, inst):
+        try:
+            if inst.opcode == "INT2FLOAT" and inst.arg2.type == "int":
+                return "float", float(inst.arg2.value)
+            if inst.opcode == "FLOAT2INT" and inst.arg2.type == "float":
+                return "int", int(inst.arg2.value)
+        except (ValueError, OverflowError):
+            return None
+        return None
+
+    # fold_concat():
+    # - CONCAT string string
+    def fold_concat(self, inst):
+        if inst.arg2.type != "string" or inst.arg3.type != "string":
+            return None
+        return "string", inst.arg2.value + inst.arg3.value
+
+    # fold_strlen():
+    # - STRLEN string
+    def fold_strlen(self, inst):
+        return ("int", len(inst.arg2.value)) if inst.arg2.type == "string" else None
+
+    # fold_type():
+    # - TYPE of the literal is its type name
+    def fold_type(self, inst):
+        return "string", inst.arg2.type
+
+    # jump_taken():
+    # - returns True/False if the conditional jump with literal operands is taken, None if it can't be decided now
+    def jump_taken(self, inst):
+        if inst.arg1.target == None or not self.literal(inst.arg2) or not self.literal(inst.arg3):
+            return None
+        equal = self.equal(inst.arg2, inst.arg3)
+        if equal == None:
+            return None
+        return equal if inst.opcode == "JUMPIFEQ" else not equal
+
+    # write():
+    # - writes the report -> folded instructions and the eliminated instructions
+    def write(self, report_file):
+        report_file.write(f"{'instructions before':28} {self.before:8}\n")
+        for opcode, count in sorted(self.folded.items()):
+            report_file.write(f"{'folded ' + opcode:28} {count:8}\n")
+        report_file.write(f"{'jumps always taken':28} {self.always_taken:8}\n")
+        report_file.write(f"{'jumps never taken':28} {self.never_taken:8}\n")
+        report_file.write(f"{'unreachable':28} {self.unreachable:8}\n")
+        report_file.write(f"{'eliminated':28} {self.before - self.after:8}\n")
+        report_file.write(f"{'instructions after':28} {self.after:8}\n")
+        report_file.flush()
+
+
+
+# -  # - - - - - - - - - - - - - - - - - #
+# -  #      INSTRUCTION-FUSION CLASS        #
+# -  # - - - - - - - - - - - - - - - - - - #
+#
+# usage:
+# - fuses the common instruction sequences into superinstructions, which are executed by one handler
+#   = PUSHS symb1, PUSHS symb2, ADDS/SUBS/MULS/IDIVS, POPS var -> the data stack isn't used
+#   = LT/GT/EQ var, JUMPIFEQ/JUMPIFNEQ label var bool -> compare and jump
+#   = DEFVAR var, MOVE var symb
+#   = CREATEFRAME, PUSHFRAME
+#   = TYPE var symb, JUMPIFEQ/JUMPIFNEQ label var string, ... -> type switch (one lookup by the type name)
+# - superinstruction replaces the first instruction of the sequence, the other instructions stay in the array
+#   = positions of the instructions don't change -> labels, CALL and RETURN work without any change
+#   = sequences don't contain LABEL (and CALL), so the jumps can't go into the middle of the superinstruction
+# - fused handlers have the same semantics and error codes as the original sequence (ExecuteInstruction)
+# - with the report the executions of every superinstruction are counted -> saved dispatches
+#
+# dependencies:
+# - InstructionCompiler class   - used to create the superinstructions (CompiledInstruction, Operand)
+class InstructionFusion:
+
+    def __init__(self, handlers, count):
+        self.handlers = handlers            # superinstruction -> execution method (ExecuteInstruction.fused_handlers)
+        self.count = count                  # count the executions of the superinstructions (report)
+        self.sites = {}                     # superinstruction -> number of fused sequences
+        self.executed = {}                  # superinstruction -> number of executions
+        self.saved = {}                     # superinstruction -> number of saved dispatches
+        self.type_names = ("int", "float", "bool", "string", "nil", "")    # results of TYPE ("" - uninitialized)
+
+        # sequences by their first opcode -> (opcodes, method which creates the superinstruction)
+        self.patterns = {}
+        for opcode in ("ADDS", "SUBS", "MULS", "IDIVS"):
+            self.add_pattern(("PUSHS", "PUSHS", opcode, "POPS"), self.fuse_stack_arith)
+        for compare in ("LT", "GT", "EQ"):
+            for jump in ("JUMPIFEQ", "JUMPIFNEQ"):
+                self.add_pattern((compare, jump), self.fuse_compare_jump)
+        self.add_pattern(("DEFVAR", "MOVE"), self.fuse_defvar_move)
+        self.add_pattern(("CREATEFRAME", "PUSHFRAME"), self.fuse_createframe_pushframe)
+        for jump in ("JUMPIFEQ", "JUMPIFNEQ"):
+            self.add_pattern(("TYPE", jump), self.fuse_type_switch, ("JUMPIFEQ", "JUMPIFNEQ"))
+
+    # add_pattern():
+    # - adds the sequence of opcodes, fuse_method creates the superinstruction or returns None if it can't be fused
+    # - repeat are the opcodes which can continue the sequence (fuse_method chooses how many instructions are fused)
+    def add_pattern(self, opcodes, fuse_method, repeat=()):
+        self.patterns.setdefault(opcodes[0], []).append((opcodes, fuse_method, repeat))
+
+    # fuse():
+    # - replaces the first instruction of every fused sequence by the superinstruction
+    # - returns the instructions (instructions have to be bound to their handlers)
+    def fuse(self, inst):
+
+        pc = 0
+        while pc < len(inst):
+            for opcodes, fuse_method, repeat in self.patterns.get(inst[pc].opcode, ()):
+                sequence = inst[pc:pc + len(opcodes)]
+                if tuple(instruction.opcode for instruction in sequence) != opcodes:
+                    continue
+
+                # continue the sequence by the repeated opcodes
+                end = pc + len(opcodes)
+                while end < len(inst) and inst[end].opcode in repeat:
+                    sequence.append(inst[end])
+                    end += 1
+
+                # sequence has the right opcodes, check its operands
+                fused = fuse_method(sequence)
+                if fused == None:
+                    continue
+
+                # save the superinstruction (fuse_method can fuse only the start of the repeated sequence)
+                fused.opcode = "+".join(opcodes)
+                fused.order = sequence[0].order
+                if fused.fused == None:
+                    fused.fused = tuple(sequence)
+                fused.handler = self.handlers[fused.opcode]
+                if self.count:
+                    fused.handler = self.counted(fused.handler, fused.opcode, len(fused.fused))
+
+                self.sites[fused.opcode] = self.sites.get(fused.opcode, 0) + 1
+                inst[pc] = fused
+                pc += len(fused.fused) - 1
+                break
+            pc += 1
+
+        return inst
+
+    # counted():
+    # - returns the handler which counts the executions of the superinstruction
+    # - length is the number of the fused instructions -> every execution saves length - 1 dispatches
+    def counted(self, handler, opcode, length):
+        executed = self.executed
+        saved = self.saved
+        executed.setdefault(opcode, 0)
+        saved.setdefault(opcode, 0)
+
+        def counted_handler(inst, pc):
+            executed[opcode] += 1
+            saved[opcode] += length - 1
+            return handler(inst, pc)
+
+        return counted_handler
+
+    # superinstruction():
+    # - creates the superinstruction with the given operands
+    def superinstruction(self, arg1, arg2, arg3):
+        return InstructionCompiler.CompiledInstruction(None, None, arg1, arg2, arg3)
+
+    # fuse_stack_arith():
+    # - PUSHS symb1, PUSHS symb2, ADDS/SUBS/MULS/IDIVS, POPS var -> var, symb1, symb2
+    def fuse_stack_arith(self, sequence):
+        pushs_1, pushs_2, _, pops = sequence
+        return self.superinstruction(pops.arg1, pushs_1.arg1, pushs_2.arg1)
+
+    # fuse_compare_jump():
+    # - LT/GT/EQ var, JUMPIFEQ/JUMPIFNEQ label var bool -> label, var, bool value which jumps
+    # - only the result of the compare instruction can be compared with the bool constant, the label has to exist
+    def fuse_compare_jump(self, sequence):
+        compare, jump = sequence
+        var, const = jump.arg2, jump.arg3
+
+        if jump.arg1.target == None or var.kind != "var" or const.kind != "const" or const.type != "bool":
+            return None
+        if var.scope != compare.arg1.scope or var.name != compare.arg1.name:
+            return None
+
+        jump_value = InstructionCompiler.Operand("const", "bool", const.text)
+        jump_value.value = const.value if jump.opcode == "JUMPIFEQ" else not const.value
+        return self.superinstruction(jump.arg1, var, jump_value)
+
+    # fuse_defvar_move():
+    # - DEFVAR var1, MOVE var2 symb -> var1, var2, symb
+    def fuse_defvar_move(self, sequence):
+        defvar, move = sequence
+        return self.superinstruction(defvar.arg1, move.arg1, move.arg2)
+
+    # fuse_createframe_pushframe():
+    # - CREATEFRAME, PUSHFRAME -> no operands
+    def fuse_createframe_pushframe(self, sequence):
+        return self.superinstruction(None, None, None)
+
+    # fuse_type_switch():
+    # - TYPE var symb, JUMPIFEQ/JUMPIFNEQ label var string, ... -> var, symb, switch (type name -> jump target)
+    # - jumps compare the result of TYPE with the string constant, their labels have to exist
+    # - chain ends at the first other jump, the targets of the switch are found by running the chain for every type name
+    def fuse_type_switch(self, sequence):
+        type_inst = sequence[0]
+        var = type_inst.arg1
+
+        # jumps of the chain
+        chain = []
+        for jump in sequence[1:]:
+            operands = (jump.arg2, jump.arg3) if jump.arg2.kind == "var" else (jump.arg3, jump.arg2)
+            if jump.arg1.target == None or operands[0].kind != "var" or operands[1].kind != "const" or operands[1].type != "string":
+                break
+            if operands[0].scope != var.scope or operands[0].name != var.name:
+                break
+            chain.append(jump)
+        if len(chain) == 0:
+            return None
+
+        # type name -> target of the first taken jump, other types continue after the chain
+        table = {}
+        for type_name in self.type_names:
+            for jump in chain:
+                equal = type_name == (jump.arg3.value if jump.arg2.kind == "var" else jump.arg2.value)
+                if equal == (jump.opcode == "JUMPIFEQ"):
+                    table[type_name] = jump.arg1.target
+                    break
+
+        switch = InstructionCompiler.Operand("const", "switch", None)
+        switch.value = table
+        fused = self.superinstruction(var, type_inst.arg2, switch)
+        fused.fused = (type_inst,) + tuple(chain)
+        return fused
+
+    # write():
+    # - writes the report -> fused sequences, their executions and the saved dispatches
+    def write(self, report_file):
+        saved_total = 0
+        report_file.write(f"{'superinstruction':28} {'sites':>8} {'executed':>12} {'saved':>12}\n")
+        for opcode, sites in sorted(self.sites.items(), key=lambda item: -self.saved[item[0]]):
+            saved = self.saved[opcode]
+            saved_total += saved
+            report_file.write(f"{opcode:28} {sites:8} {self.executed[opcode]:12} {saved:12}\n")
+        report_file.write(f"{'total':28} {sum(self.sites.values()):8} {sum(self.executed.values()):12} {saved_total:12}\n")
+        report_file.flush()
+
+
+
+# -  # - - - - - - - - - - - - - - - - - - #
+# -  #      CONTROL-FLOW-GRAPH CLASS        #
+# -  # - - - - - - - - - - - - - - - - - - - #
+#
+# usage:
+# - splits the compiled instructions into basic blocks and links them into the control flow graph
+#   = basic block starts at the first instruction, at LABEL and after JUMP, JUMPIFEQ(S), JUMPIFNEQ(S), CALL, RETURN and EXIT
+#   = instructions of the basic block are executed one after another, only its last instruction can jump
+# - successors of the block are saved as (block index, kind of the edge)
+#   = "fallthrough" - next block, "jump" - JUMP, "branch" - taken conditional jump
+#   = "call" - CALL target, "return" - RETURN to every instruction after CALL
+#   = EXIT, jump to an undefined label and the end of the program have no successors
+# - graph can be written in the DOT format (graphviz) -> dot -Tsvg cfg.dot > cfg.svg
+# - foundation for the block analyses -> reachable() returns the blocks which can be executed
+#
+# dependencies:
+# - InstructionCompiler class   - compiled instructions with linked labels (Operand.target)
+class ControlFlowGraph:
+
+    # BasicBlock class:
+    # - instructions inst[start:end] of the block, used like c like structure
+    # - label is the name of the LABEL which starts the block or None
+    # - successors and predecessors are lists of (block index, kind of the edge)
+    class BasicBlock:
+        __slots__ = ("index", "start", "end", "label", "successors", "predecessors")
+
+        def __init__(self, index, start, end, label):
+            self.index = index
+            self.start = start
+            self.end = end
+            self.label = label
+            self.successors = []
+            self.predecessors = []
+
+        # name():
+        # - returns the name of the block -> label, entry or B<index>
+        def name(self):
+            if self.label != None:
+                return self.label
+            return "entry" if self.index == 0 else f"B{self.index}"
+
+    def __init__(self, inst):
+        self.inst = inst                        # compiled instructions
+        self.blocks = []                        # basic blocks in the order of the instructions
+        self.block_of = [0] * len(inst)         # instruction position -> block index
+        self.ends_block = ("JUMP", "JUMPIFEQ", "JUMPIFNEQ", "JUMPIFEQS", "JUMPIFNEQS", "CALL", "RETURN", "EXIT")
+        self.conditional = ("JUMPIFEQ", "JUMPIFNEQ", "JUMPIFEQS", "JUMPIFNEQS")
+        self.build()
+
+    # build():
+    # - splits the instructions into the basic blocks and links their successors
+    def build(self):
+
+        # first instructions of the blocks (leaders)
+        leaders = {0} if len(self.inst) > 0 else set()
+        for pc, instruction in enumerate(self.inst):
+            if instruction.opcode == "LABEL":
+                leaders.add(pc)
+            elif instruction.opcode in self.ends_block and pc + 1 < len(self.inst):
+                leaders.add(pc + 1)
+
+        # create the blocks
+        leaders = sorted(leaders)
+        for index, start in enumerate(leaders):
+            end = leaders[index + 1] if index + 1 < len(leaders) else len(self.inst)
+            label = self.inst[start].arg1.value if self.inst[start].opcode == "LABEL" else None
+            self.blocks.append(self.BasicBlock(index, start, end, label))
+            self.block_of[start:end] = [index] * (end - start)
+
+        # instructions after CALL -> targets of every RETURN
+        return_sites = [pc + 1 for pc, instruction in enumerate(self.inst) if instruction.opcode == "CALL" and pc + 1 < len(self.inst)]
+
+        # link the successors of every block by its last instruction
+        for block in self.blocks:
+            last = self.inst[block.end - 1]
+            if last.opcode == "JUMP":
+                self.add_edge(block, last.arg1.target, "jump")
+            elif last.opcode in self.conditional:
+                self.add_edge(block, last.arg1.target, "branch")
+                self.add_edge(block, block.end, "fallthrough")
+            elif last.opcode == "CALL":
+                self.add_edge(block, last.arg1.target, "call")
+            elif last.opcode == "RETURN":
+                for pc in return_sites:
+                    self.add_edge(block, pc, "return")
+            elif last.opcode != "EXIT":
+                self.add_edge(block, block.end, "fallthrough")
+
+    # add_edge():
+    # - links the block with the block of the instruction (pc), undefined label and the end of the program are skipped
+    def add_edge(self, block, pc, kind):
+        if pc == None or pc >= len(self.inst):
+            return
+        successor = self.blocks[self.block_of[pc]]
+        block.successors.append((successor.index, kind))
+        successor.predecessors.append((block.index, kind))
+
+    # block_at():
+    # - returns the basic block of the instruction (pc)
+    def block_at(self, pc):
+        return self.blocks[self.block_of[pc]]
+
+    # reachable():
+    # - returns the set of block indexes which can be reached from the first block
+    def reachable(self):
+        if len(self.blocks) == 0:
+            return set()
+
+        visited = {0}
+        stack = [0]
+        while stack:
+            for successor, _ in self.blocks[stack.pop()].successors:
+                if successor not in visited:
+                    visited.add(successor)
+                    stack.append(successor)
+        return visited
+
+    # dot_escape():
+    # - escapes the text for the DOT string
+    def dot_escape(self, text):
+        return str(text).replace("\\", "\\\\").replace('"', '\\"')
+
+    # write_dot():
+    # - writes the control flow graph in the DOT format, every node lists the instructions of the block
+    # - unreachable blocks are gray, edges have the style of their kind
+    def write_dot(self, dot_file):
+        styles = {"fallthrough": "solid", "jump": "bold", "branch": "dashed", "call": "dotted", "return": "dotted"}
+        reachable = self.reachable()
+
+        dot_file.write("digraph cfg {\n")
+        dot_file.write('    node [shape=box, fontname="monospace"];\n')
+        for block in self.blocks:
+            lines = [self.dot_escape(block.name())]
+            lines += [f"{instruction.order} {instruction.opcode}" for instruction in self.inst[block.start:block.end]]
+            label = "\\l".join(lines) + "\\l"
+            color = "" if block.index in reachable else ", color=gray, fontcolor=gray"
+            dot_file.write(f'    B{block.index} [label="{label}"{color}];\n')
+        for block in self.blocks:
+            for successor, kind in block.successors:
+                dot_file.write(f'    B{block.index} -> B{successor} [label="{kind}", style={styles[kind]}];\n')
+        dot_file.write("}\n")
+        dot_file.flush()
+
+
+
+# -  # - - - - - - - - - - - - - - - - #
+# -  #      BLOCK-COMPILER CLASS        #
+# -  # - - - - - - - - - - - - - - - - - #
+#
+# usage:
+# - compiles every basic block (ControlFlowGraph) into a python function (--engine=compiled)
+#   = source of all blocks is generated and compiled by compile() only once, every block returns the position of the next block
+#   = variables are accessed by their slots in the frame lists (GF, LF, TF), the data stack is the python list
+#   = jumps are return statements with the label positions resolved by the InstructionCompiler
+# - fast path of the supported instruction is guarded by its checks (frame, defined and initialized variables, types)
+#   = when the guard fails nothing has been changed and the instruction is executed by its handler (ExecuteInstruction)
+#   = handler reports the same error (code and message) as the reference engine
+# - other instructions (READ, WRITE, CALL, ...) are always executed by their handlers
+# - LF/TF frames stored as dictionaries (SymbolTableDict) are accessed only by the handlers
+# - slots with the rope (StringRope, "rope") and the buffer (StringBuffer, "chars") fail every guard -> run by the handlers
+#
+# dependencies:
+# - ControlFlowGraph class      - basic blocks of the program
+# - ExecuteInstruction class    - handlers of the instructions, frames and the data stack
+# - SymbolTableData class       - slots of the frames -> get_table()
+# - DataStack class             - lists of the data stack (values, tags, top)
+class BlockCompiler:
+
+    def __init__(self, execute):
+        self.execute = execute                                              # execution of the instructions
+        self.frame_data = execute.frame_data                                # frames of the program
+        self.list_frames = self.frame_data.frame_class is SymbolTableData   # LF/TF frames are lists
+        self.frame_ops = ("CREATEFRAME", "PUSHFRAME", "POPFRAME")           # instructions which change LF/TF
+        self.source = ""                                                    # generated source (debugging)
+
+        # opcode -> method which generates the fast path
+        self.emitters = {
+            "MOVE" : self.emit_move,                      # Data frames
+            "DEFVAR" : self.emit_defvar,
+            "PUSHS" : self.emit_pushs,                    # Data stack
+            "POPS" : self.emit_pops,
+            "ADD" : self.emit_arithmetic,                 # Arithmetic
+            "SUB" : self.emit_arithmetic,
+            "MUL" : self.emit_arithmetic,
+            "IDIV" : self.emit_arithmetic,
+            "DIV" : self.emit_arithmetic,
+            "LT" : self.emit_relational,                  # Relational
+            "GT" : self.emit_relational,
+            "EQ" : self.emit_eq,
+            "AND" : self.emit_logical,                    # Logical
+            "OR" : self.emit_logical,
+            "NOT" : self.emit_not,
+            "INT2FLOAT" : self.emit_int2float,            # Conversions
+            "FLOAT2INT" : self.emit_float2int,
+            "CONCAT" : self.emit_concat,                  # String operations
+            "STRLEN" : self.emit_strlen,
+            "TYPE" : self.emit_type,                      # Type
+            "LABEL" : self.emit_label,                    # Program flow
+            "JUMP" : self.emit_jump,
+            "JUMPIFEQ" : self.emit_jumpifeq,
+            "JUMPIFNEQ" : self.emit_jumpifeq,
+        }
+        self.universal = ("int", "float", "bool", "string", "nil")        # types of the universal symb
+        self.operators = {"ADD": "+", "SUB": "-", "MUL": "*", "IDIV": "//", "DIV": "/", "LT": "<", "GT": ">", "AND": "and", "OR": "or"}
+
+    # compile_blocks():
+    # - compiles the basic blocks of the instructions (with bound handlers) into python functions
+    # - returns the list of functions indexed by the instruction position
+    #
+    # return error codes:
+    # = 99 - generated source can't be compiled (internal error)
+    def compile_blocks(self, inst):
+
+        # objects used by the blocks -> GF slots, data stack, frames
+        cfg = ControlFlowGraph(inst)
+        self.namespace = {
+            "G": self.frame_data.symt_gf.get_table(),
+            "ds": self.execute.data_stack,
+            "SV": self.execute.data_stack.values,
+            "ST": self.execute.data_stack.tags,
+            "TAGS": STACK_TAGS,
+            "TYPES": STACK_TYPES,
+            "fd": self.frame_data,
+            "NIL": NIL,
+        }
+
+        # generate and compile the source of all blocks
+        source = []
+        for block in cfg.blocks:
+            source += self.compile_block(inst, block)
+        self.source = "\n".join(source) + "\n"
+        try:
+            exec(compile(self.source, "<compiled blocks>", "exec"), self.namespace)
+        except (SyntaxError, RecursionError, MemoryError) as error:
+            sys.stderr.write(f"[interpret.py]: ERROR (99) - BlockCompiler - compile_blocks()\n")
+            sys.stderr.write(f"                NOTE - (Internal error), generated source can't be compiled - {error}\n")
+            raise InterpretError(99)
+
+        # position of the block -> function, no jump goes inside the block (its instructions are run one by one)
+        blocks = [None] * len(inst)
+        for block in cfg.blocks:
+            blocks[block.start] = self.namespace[f"block_{block.start}"]
+        for pc in range(len(inst)):
+            if blocks[pc] == None:
+                blocks[pc] = self.single_step(inst[pc], pc)
+
+        return blocks
+
+    # single_step():
+    # - returns the function which executes only the instruction by its handler
+    def single_step(self, instruction, pc):
+        return lambda: instruction.handler(instruction, pc)
+
+    # compile_block():
+    # - returns the lines of the function which executes the basic block
+    def compile_block(self, inst, block):
+
+        # LF/TF lists are loaded at the start of the block and after the instructions which change them
+        self.used = {"G", "fd", "NIL"}
+        frames = self.list_frames and any(self.uses_frames(inst[pc]) for pc in range(block.start, block.end))
+        body = self.load_frames() if frames else []
+
+        for pc in range(block.start, block.end):
+            instruction = inst[pc]
+            terminator = pc == block.end - 1 and self.is_terminator(instruction)
+            emitter = self.emitters.get(instruction.opcode)
+            fast = emitter(instruction, pc) if emitter != None else None
+
+            # handler of the instruction (fallback)
+            self.namespace[f"h{pc}"] = instruction.handler
+            self.namespace[f"i{pc}"] = instruction
+            handler = f"h{pc}(i{pc}, {pc})"
+            if terminator:
+                handler = "return " + handler
+
+            # instruction without the fast path
+            if fast == None:
+                self.used.update((f"h{pc}", f"i{pc}"))
+                body.append(handler)
+                if frames and instruction.opcode in self.frame_ops:
+                    body += self.load_frames()
+                continue
+
+            # fast path, the handler is called when the guard fails
+            guards, statements = fast
+            if len(guards) == 0:
+                body += statements
+            else:
+                self.used.update((f"h{pc}", f"i{pc}"))
+                body.append("if " + " and ".join(guards) + ":")
+                body += ["    " + statement for statement in statements]
+                body.append("else:")
+                body.append("    " + handler)
+
+        # block continues by the next block
+        if block.end > block.start and not self.is_terminator(inst[block.end - 1]):
+            body.append(f"return {block.end}")
+        if len(body) == 0:
+            body.append(f"return {block.end}")
+
+        # function of the block, used objects are its default arguments (local variables)
+        arguments = ", ".join(f"{name}={name}" for name in sorted(self.used))
+        return [f"def block_{block.start}({arguments}):"] + ["    " + line for line in body] + [""]
+
+    # is_terminator():
+    # - returns True if the instruction ends the basic block by a jump (its handler returns the next position)
+    def is_terminator(self, instruction):
+        return instruction.opcode in ("JUMP", "JUMPIFEQ", "JUMPIFNEQ", "JUMPIFEQS", "JUMPIFNEQS", "CALL", "RETURN", "EXIT")
+
+    # uses_frames():
+    # - returns True if the instruction has LF/TF operand or changes the frames
+    def uses_frames(self, instruction):
+        if instruction.opcode in self.frame_ops:
+            return True
+        return any(arg != None and arg.kind == "var" and arg.scope != "GF" for arg in (instruction.arg1, instruction.arg2, instruction.arg3))
+
+    # load_frames():
+    # - returns the lines which load the LF/TF lists (None if the frame doesn't exist)
+    def load_frames(self):
+        return [
+            "L = fd.symt_lf",
+            "L = L.get_table() if L is not None else None",
+            "T = fd.symt_tf",
+            "T = T.get_table() if T is not None else None",
+        ]
+
+
+    # - OPERANDS - #
+
+    # frame():
+    # - returns the name of the frame list of the variable, None if the frame isn't a list (SymbolTableDict)
+    def frame(self, var):
+        if var.scope == "GF":
+            return "G"
+        if not self.list_frames:
+            return None
+        return "L" if var.scope == "LF" else "T"
+
+    # operand():
+    # - returns (guards, pair, value, type) expressions of the symb, name is the local variable of the read slot
+    # - types are the allowed types (None -> any type), None is returned if the symb can't be read by the fast path
+    def operand(self, symb, name, types=None):
+
+        # variable -> frame exists, variable is defined and initialized, its type is allowed
+        if symb.kind == "var":
+            frame = self.frame(symb)
+            if frame == None:
+                return None
+            guards = [] if frame == "G" else [f"{frame} is not None"]
+            guards.append(f"({name} := {frame}[{symb.slot}]) is not None")
+            if types == None:
+                guards.append(f"{name}[1] in {self.universal!r}")
+            elif len(types) == 1:
+                guards.append(f"{name}[1] == {types[0]!r}")
+            else:
+                guards.append(f"{name}[1] in {tuple(types)!r}")
+            return guards, name, f"{name}[0]", f"{name}[1]"
+
+        # constant -> the type is checked now (inf, nan float is created from its repr)
+        if symb.type not in (self.universal if types == None else types):
+            return None
+        value = "NIL" if symb.type == "nil" else repr(symb.value)
+        if symb.type == "float" and value in ("inf", "-inf", "nan"):
+            value = f"float({value!r})"
+        return [], f"({value}, {symb.type!r})", value, repr(symb.type)
+
+    # destination():
+    # - returns (guards, slot) expressions of the var which is updated, None if it can't be updated by the fast path
+    def destination(self, var):
+        frame = self.frame(var)
+        if frame == None:
+            return None
+        guards = [] if frame == "G" else [f"{frame} is not None"]
+        guards.append(f"{frame}[{var.slot}] is not None")
+        return guards, f"{frame}[{var.slot}]"
+
+
+    # - FAST PATHS - #
+    # - every method returns (guards, statements) or None if the instruction is executed by its handler
+
+    # emit_move():
+    # - MOVE var symb -> the slot is copied
+    def emit_move(self, inst, pc):
+        symb, dest = self.operand(inst.arg2, "a"), self.destination(inst.arg1)
+        if symb == None or dest == None:
+            return None
+        return symb[0] + dest[0], [f"{dest[1]} = {symb[1]}"]
+
+    # emit_defvar():
+    # - DEFVAR var -> the slot is defined
+    def emit_defvar(self, inst, pc):
+        frame = self.frame(inst.arg1)
+        if frame == None:
+            return None
+        guards = [] if frame == "G" else [f"{frame} is not None"]
+        return guards + [f"{frame}[{inst.arg1.slot}] is None"], [f"{frame}[{inst.arg1.slot}] = (None, None)"]
+
+    # emit_pushs():
+    # - PUSHS symb -> the value and the type tag are saved on the top of the stack lists
+    def emit_pushs(self, inst, pc):
+        symb = self.operand(inst.arg1, "a")
+        if symb == None:
+            return None
+        tag = f"TAGS[{symb[3]}]" if inst.arg1.kind == "var" else str(STACK_TAGS[inst.arg1.type])
+        self.used.update(("ds", "SV", "ST", "TAGS"))
+        return symb[0], ["n = ds.top", "if n == len(SV): ds.grow()", f"SV[n] = {symb[2]}", f"ST[n] = {tag}", "ds.top = n + 1"]
+
+    # emit_pops():
+    # - POPS var -> the stack isn't empty
+    def emit_pops(self, inst, pc):
+        dest = self.destination(inst.arg1)
+        if dest == None:
+            return None
+        self.used.update(("ds", "SV", "ST", "TYPES"))
+        return ["ds.top"] + dest[0], ["n = ds.top - 1", "ds.top = n", f"{dest[1]} = (SV[n], TYPES[ST[n]])", "SV[n] = None"]
+
+    # emit_arithmetic():
+    # - ADD, SUB, MUL var symb1 symb2 -> two same types (int, float), IDIV -> two int, DIV -> two float
+    # - IDIV, DIV also check the zero divisor
+    def emit_arithmetic(self, inst, pc):
+        types = {"IDIV": ("int",), "DIV": ("float",)}.get(inst.opcode, ("int", "float"))
+        symb1, symb2 = self.operand(inst.arg2, "a", types), self.operand(inst.arg3, "b", types)
+        dest = self.destination(inst.arg1)
+        if symb1 == None or symb2 == None or dest == None:
+            return None
+        guards = symb1[0] + symb2[0]
+        if len(types) > 1:
+            guards.append(f"{symb1[3]} == {symb2[3]}")
+        if inst.opcode in ("IDIV", "DIV"):
+            guards.append(f"{symb2[2]} != 0")
+        return guards + dest[0], [f"{dest[1]} = ({symb1[2]} {self.operators[inst.opcode]} {symb2[2]}, {symb1[3]})"]
+
+    # emit_relational():
+    # - LT, GT var symb1 symb2 -> two same types (int, float, string, bool), python compares bool as False < True
+    def emit_relational(self, inst, pc):
+        types = ("int", "float", "string", "bool")
+        symb1, symb2 = self.operand(inst.arg2, "a", types), self.operand(inst.arg3, "b", types)
+        dest = self.destination(inst.arg1)
+        if symb1 == None or symb2 == None or dest == None:
+            return None
+        guards = symb1[0] + symb2[0] + [f"{symb1[3]} == {symb2[3]}"] + dest[0]
+        return guards, [f"{dest[1]} = ({symb1[2]} {self.operators[inst.opcode]} {symb2[2]}, 'bool')"]
+
+    # compare_eq():
+    # - returns (guards, condition) of EQ, JUMPIFEQ, JUMPIFNEQ -> same types or nil
+    def compare_eq(self, inst):
+        types = ("int", "float", "string", "bool", "nil")
+        symb1, symb2 = self.operand(inst.arg2, "a", types), self.operand(inst.arg3, "b", types)
+        if symb1 == None or symb2 == None:
+            return None
+        type_1, type_2 = symb1[3], symb2[3]
+        guards = symb1[0] + symb2[0] + [f"({type_1} == {type_2} or {type_1} == 'nil' or {type_2} == 'nil')"]
+        return guards, f"{type_1} == {type_2} and {symb1[2]} == {symb2[2]}"
+
+    # emit_eq():
+    # - EQ var symb1 symb2
+    def emit_eq(self, inst, pc):
+        compare, dest = self.compare_eq(inst), self.destination(inst.arg1)
+        if compare == None or dest == None:
+            return None
+        return compare[0] + dest[0], [f"{dest[1]} = ({compare[1]}, 'bool')"]
+
+    # emit_logical():
+    # - AND, OR var symb1 symb2 -> two bool
+    def emit_logical(self, inst, pc):
+        symb1, symb2 = self.operand(inst.arg2, "a", ("bool",)), self.operand(inst.arg3, "b", ("bool",))
+        dest = self.destination(inst.arg1)
+        if symb1 == None or symb2 == None or dest == None:
+            return None
+        return symb1[0] + symb2[0] + dest[0], [f"{dest[1]} = ({symb1[2]} {self.operators[inst.opcode]} {symb2[2]}, 'bool')"]
+
+    # emit_not():
+    # - NOT var symb -> bool
+    def emit_not(self, inst, pc):
+        symb, dest = self.operand(inst.arg2, "a", ("bool",)), self.destination(inst.arg1)
+        if symb == None or dest == None:
+            return None
+        return symb[0] + dest[0], [f"{dest[1]} = (not {symb[2]}, 'bool')"]
+
+    # emit_int2float():
+    # - INT2FLOAT var symb -> int, too big int is converted by the handler (error)
+    def emit_int2float(self, inst, pc):
+        symb, dest = self.operand(inst.arg2, "a", ("int",)), self.destination(inst.arg1)
+        if symb == None or dest == None:
+            return None
+        return symb[0] + [f"-1e308 < {symb[2]} < 1e308"] + dest[0], [f"{dest[1]} = (float({symb[2]}), 'float')"]
+
+    # emit_float2int():
+    # - FLOAT2INT var symb -> float, inf and nan are converted by the handler (error)
+    def emit_float2int(self, inst, pc):
+        symb, dest = self.operand(inst.arg2, "a", ("float",)), self.destination(inst.arg1)
+        if symb == None or dest == None:
+            return None
+        return symb[0] + [f"-1e308 < {symb[2]} < 1e308"] + dest[0], [f"{dest[1]} = (int({symb[2]}), 'int')"]
+
+    # emit_concat():
+    # - CONCAT var symb1 symb2 -> two string
+    # - long string appended to the same variable is concatenated by the handler (StringRope)
+    def emit_concat(self, inst, pc):
+        symb1, symb2 = self.operand(inst.arg2, "a", ("string",)), self.operand(inst.arg3, "b", ("string",))
+        dest = self.destination(inst.arg1)
+        if symb1 == None or symb2 == None or dest == None:
+            return None
+        guards = symb1[0] + symb2[0] + dest[0]
+        if inst.arg2.kind == "var" and inst.arg2.scope == inst.arg1.scope and inst.arg2.name == inst.arg1.name:
+            guards.append(f"len({symb1[2]}) < {StringRope.MIN_LENGTH}")
+        return guards, [f"{dest[1]} = ({symb1[2]} + {symb2[2]}, 'string')"]
+
+    # emit_strlen():
+    # - STRLEN var symb -> string
+    def emit_strlen(self, inst, pc):
+        symb, dest = self.operand(inst.arg2, "a", ("string",)), self.destination(inst.arg1)
+        if symb == None or dest == None:
+            return None
+        return symb[0] + dest[0], [f"{dest[1]} = (len({symb[2]}), 'int')"]
+
+    # emit_type():
+    # - TYPE var symb -> variable has to be defined, uninitialized variable is the empty string, rope and buffer are run by the handler
+    def emit_type(self, inst, pc):
+        dest = self.destination(inst.arg1)
+        if dest == None:
+            return None
+
+        # type of the constant is known
+        if inst.arg2.kind != "var":
+            return dest[0], [f"{dest[1]} = ({inst.arg2.type!r}, 'string')"]
+
+        frame = self.frame(inst.arg2)
+        if frame == None:
+            return None
+        guards = [] if frame == "G" else [f"{frame} is not None"]
+        guards.append(f"(a := {frame}[{inst.arg2.slot}]) is not None")
+        guards.append("a[1] not in ('rope', 'chars')")
+        return guards + dest[0], [f"{dest[1]} = (a[1] if a[1] is not None else '', 'string')"]
+
+    # emit_label():
+    # - LABEL does nothing
+    def emit_label(self, inst, pc):
+        return [], []
+
+    # emit_jump():
+    # - JUMP label -> undefined label is reported by the handler
+    def emit_jump(self, inst, pc):
+        if inst.arg1.target == None:
+            return None
+        return [], [f"return {inst.arg1.target}"]
+
+    # emit_jumpifeq():
+    # - JUMPIFEQ, JUMPIFNEQ label symb1 symb2 -> undefined label is reported by the handler
+    def emit_jumpifeq(self, inst, pc):
+        compare = self.compare_eq(inst)
+        if compare == None or inst.arg1.target == None:
+            return None
+        negation = "" if inst.opcode == "JUMPIFEQ" else "not "
+        return compare[0], [f"return {inst.arg1.target} if {negation}({compare[1]}) else {pc + 1}"]
+
+
+
+# -  # - - - - - - - - - - - - - - #
+# -  #      NIL-VALUE CLASS        #
+# -  # - - - - - - - - - - - - - - #
+#
+# usage:
+# - value of the nil type (nil@nil), there is only one instance -> NIL
+# - values in the interpret are native -> int, bool, str and NIL
+class NilValue:
+
+    def __repr__(self):
+        return "nil"
+
+    # pickle saves only the reference to NIL -> there is still only one instance
+    def __reduce__(self):
+        return "NIL"
+
+NIL = NilValue()
+
+
+
+# -  # - - - - - - - - - - - - - - #
+# -  #    STRING-CODEC CLASS       #
+# -  # - - - - - - - - - - - - - - #
+#
+# usage:
+# - decodes the string literals of the source (escape sequences \ddd) and encodes the strings back into the literals
+#   = decoding splits the literal by "\", the escape sequences are found in the table (ddd -> char)
+#   = encoding is str.translate with the table (char -> \ddd), whitespace, "#" and "\" are encoded
+#   = literal without "\", "#", " " and the line end is valid and has no escape sequences -> returned as it is
+# - decoded literals are cached (literal -> string), the programs use the same literals many times
+# - there is only one instance -> STRING_CODEC, so the cache is shared by the programs of the server (--serve)
+class StringCodec:
+
+    def __init__(self, cache_size=4096):
+        self.decode_table = {f"{code:03}": chr(code) for code in range(1000)}           # ddd -> char
+        self.encode_table = {code: f"\\{code:03}" for code in (*range(33), 35, 92)}    # char code -> \ddd
+        self.string_format = re.compile(r"^[^# ]*$")                                    # without "#" and " "
+        self.escape_format = re.compile(r"^(?!.*\\(?![0-9]{3})).*$")                    # "\" only in \ddd
+        self.cache = {}                 # literal -> decoded string
+        self.cache_size = cache_size    # max. number of the cached literals
+
+    # decode():
+    # - decodes the escape sequences of the literal
+    # - returns the string or None if the literal has the wrong format
+    def decode(self, literal):
+
+        # cached literal
+        string = self.cache.get(literal)
+        if string is not None:
+            return string
+
+        # literal without the special characters -> valid and without escape sequences
+        if "\\" not in literal and "#" not in literal and " " not in literal and "\n" not in literal:
+            string = literal
+
+        # check the format and decode the escape sequences
+        else:
+            if not self.string_format.match(literal) or not self.escape_format.match(literal):
+                return None
+            parts = literal.split("\\")
+            string = parts[0] + "".join([self.decode_table[part[:3]] + part[3:] for part in parts[1:]])
+
+        # save the literal
+        if len(self.cache) >= self.cache_size:
+            self.cache.clear()
+        self.cache[literal] = string
+        return string
+
+    # encode():
+    # - encodes the string into the literal (escape sequences \ddd)
+    def encode(self, string):
+        return string.translate(self.encode_table)
+
+STRING_CODEC = StringCodec()
+
+
+
+# -  # - - - - - - - - - - - - - - #
+# -  #     STRING-ROPE CLASS       #
+# -  # - - - - - - - - - - - - - - #
+#
+# usage:
+# - value of the long string which is built by CONCAT var var symb (symb is appended to the same variable)
+#   = appended strings are saved in the list (chunks) -> append is amortized O(1), the string isn't copied
+#   = rope is saved in the frame with the "rope" type, so it can't be used as the string by mistake
+# - other reads of the variable join the chunks and save the string back (FrameStackProtocol.symt_gather_var)
+#   = WRITE, STRLEN, GETCHAR, compare, MOVE, PUSHS, ... get only the python str
+# - rope is created only for the string with MIN_LENGTH characters, copy of the short string is faster
+class StringRope:
+    __slots__ = ("chunks",)
+
+    MIN_LENGTH = 4096                   # min. length of the string which is appended by the rope
+
+    def __init__(self, chunks):
+        self.chunks = chunks            # appended strings
+
+    # append():
+    # - appends the string to the rope
+    def append(self, string):
+        self.chunks.append(string)
+
+    # __str__():
+    # - returns the string of the rope (joined chunks)
+    def __str__(self):
+        return "".join(self.chunks)
+
+
+
+# -  # - - - - - - - - - - - - - - - #
+# -  #     STRING-BUFFER CLASS        #
+# -  # - - - - - - - - - - - - - - - #
+#
+# usage:
+# - value of the long string which is changed by SETCHAR -> list of its characters, SETCHAR changes one item in O(1)
+#   = string is copied into the buffer by the first SETCHAR (copy on write), the buffer is saved in the frame with the "chars" type
+#   = GETCHAR, STRI2INT and STRLEN read the characters of the buffer directly
+# - other reads of the variable (WRITE, compare, CONCAT, MOVE, ...) join the characters and save the string back (like StringRope)
+# - buffer is created only for the string with MIN_LENGTH characters, slicing of the short string is faster
+class StringBuffer:
+    __slots__ = ("chars",)
+
+    MIN_LENGTH = 256                    # min. length of the string which is changed in the buffer
+
+    def __init__(self, string):
+        self.chars = list(string)       # characters of the string
+
+    # __str__():
+    # - returns the string of the buffer (joined characters)
+    def __str__(self):
+        return "".join(self.chars)
 
 
 
@@ -456,7 +2112,7 @@ class VariableAnalysis:
         if inst_type == None:
             sys.stderr.write("[interpret.py]: ERROR (32) - VariableAnalysis - analyze_arg()\n")
             sys.stderr.write(f"               NOTE - Variable has no type -> id doesn't exist\n")
-            sys.exit(32)
+            raise InterpretError(32)
 
         # change inst_arg_type to ""
         if inst_arg == None:
@@ -473,6 +2129,10 @@ class VariableAnalysis:
         # int type
         elif inst_type == "int":
             var_value = self.analyze_int(inst_arg)
+
+        # float type
+        elif inst_type == "float":
+            var_value = self.analyze_float(inst_arg)
                     
         # bool type
         elif inst_type == "bool":
@@ -495,7 +2155,7 @@ class VariableAnalysis:
             sys.stderr.write("[interpret.py]: ERROR (32) - VariableAnalysis - analyze_arg()\n")
             sys.stderr.write(f"               NOTE - Unknown var type was used\n")
             sys.stderr.write(f"               VAR  - <{inst_type}>, {inst_arg}\n")
-            sys.exit(32)
+            raise InterpretError(32)
 
         # return value
         return var_value, var_scope
@@ -513,14 +2173,14 @@ class VariableAnalysis:
             sys.stderr.write("[interpret.py]: ERROR (32) - VariableAnalysis - analyze_var()\n")
             sys.stderr.write(f"               NOTE   - Wrong var operand format\n")
             sys.stderr.write(f"               BAR - {input_var}\n")
-            sys.exit(32)
+            raise InterpretError(32)
 
         # check if the variable does not start with a number
         if re.match(r"^(GF|LF|TF)@[0-9]", input_var):
             sys.stderr.write("[interpret.py]: ERROR (32) - VariableAnalysis - analyze_var()\n")
             sys.stderr.write(f"               NOTE   - Wrong var operand format\n")
             sys.stderr.write(f"               BAR - {input_var}\n")
-            sys.exit(32)
+            raise InterpretError(32)
 
         # split the string into parts -> first @ indicates the split symbol
         var_data = input_var.split("@", 1)
@@ -539,29 +2199,21 @@ class VariableAnalysis:
         if input_string == "" or input_string is None:
             return ""
 
-        # check if the string var starts with string@ and does not contain ["#", " "]
-        if not re.match(r"^[^# ]*$", input_string):
-            sys.stderr.write("[interpret.py]: ERROR (32) - VariableAnalysis - analyze_string()\n")
-            sys.stderr.write(f"               NOTE   - Wrong string operand format\n")
-            sys.stderr.write(f"               STRING - {input_string}\n")
-            sys.exit(32)
-
-        # if '\' is in the string allow use only with the combination '[\][0-9]{3}'
-        if not re.match(r"^(?!.*\\(?![0-9]{3})).*$", input_string):
+        # decode the "[\][0-9]{3}" into the correct characters the three digits represent UTF-8 code
+        # - string can't contain ["#", " "] and '\' is allowed only in the combination '[\][0-9]{3}'
+        output_string = STRING_CODEC.decode(input_string)
+        if output_string is None:
             sys.stderr.write("[interpret.py]: ERROR (32) - VariableAnalysis - analyze_string()\n")
             sys.stderr.write(f"               NOTE   - Wrong string operand format\n")
             sys.stderr.write(f"               STRING - {input_string}\n")
-            sys.exit(32)
-
-        # decode the "[\][0-9]{3}" into the correct characters the three digits represent UTF-8 code
-        input_string = re.sub(r"\\([0-9]{3})", lambda x: chr(int(x.group(1))),input_string)
+            raise InterpretError(32)
 
         # return the new string
-        return input_string
+        return output_string
 
     # analyze_int():
     # - analyzes the given int
-    # - returns the int value in string format
+    # - returns the int value (python int)
     #
     # return error codes:
     # = 32 - Wrong int operand format -> int is not a number
@@ -572,7 +2224,7 @@ class VariableAnalysis:
             sys.stderr.write("[interpret.py]: ERROR (32) - VariableAnalysis - analyze_int()\n")
             sys.stderr.write(f"               NOTE - Wrong int operand format\n")
             sys.stderr.write(f"               INT  - {input_int}\n")
-            sys.exit(32)
+            raise InterpretError(32)
         
         # try to convert the string into int
         try:
@@ -581,14 +2233,34 @@ class VariableAnalysis:
             sys.stderr.write("[interpret.py]: ERROR (32) - VariableAnalysis - analyze_int()\n")
             sys.stderr.write(f"               NOTE - Wrong int operand format\n")
             sys.stderr.write(f"               INT  - {input_int}\n")
-            sys.exit(32)
+            raise InterpretError(32)
 
         # return the new int
-        return str(input_int)
+        return input_int
+
+    # analyze_float():
+    # - analyzes the given float in the hexadecimal format (float.hex() -> 0x1.8p+1)
+    # - returns the float value (python float)
+    #
+    # return error codes:
+    # = 32 - Wrong float operand format -> float is not a hexadecimal number
+    def analyze_float(self, input_float):
+
+        # try to convert the hexadecimal string into float
+        try:
+            input_float = float.fromhex(input_float)
+        except ValueError:
+            sys.stderr.write("[interpret.py]: ERROR (32) - VariableAnalysis - analyze_float()\n")
+            sys.stderr.write(f"               NOTE  - Wrong float operand format\n")
+            sys.stderr.write(f"               FLOAT - {input_float}\n")
+            raise InterpretError(32)
+
+        # return the new float
+        return input_float
 
     # analyze_bool():
     # - analyzes the given bool
-    # - returns the bool value in string format
+    # - returns the bool value (python bool)
     #
     # return error codes:
     # = 32 - Wrong bool operand format -> bool is not true or false
@@ -599,14 +2271,14 @@ class VariableAnalysis:
             sys.stderr.write("[interpret.py]: ERROR (32) - VariableAnalysis - analyze_bool()\n")
             sys.stderr.write(f"               NOTE - Wrong bool operand format\n")
             sys.stderr.write(f"               BOOL - {input_bool}\n")
-            sys.exit(32)
+            raise InterpretError(32)
 
         # return the new bool
-        return input_bool
+        return input_bool == "true"
 
     # analyze_nil():
     # - analyzes the given nil
-    # - returns the nil value in string format
+    # - returns the nil value (NIL)
     #
     # return error codes:
     # = 32 - Wrong nil operand format -> nil is not nil
@@ -619,10 +2291,10 @@ class VariableAnalysis:
             sys.stderr.write("[interpret.py]: ERROR (32) - VariableAnalysis - analyze_string()\n")
             sys.stderr.write(f"               NOTE - Wrong nil operand format\n")
             sys.stderr.write(f"               NIL  - {input_nil}\n")
-            sys.exit(32)
+            raise InterpretError(32)
 
         # return the new nil
-        return ""
+        return NIL
 
     # analyze_label():
     # - analyzes the given label
@@ -637,7 +2309,7 @@ class VariableAnalysis:
             sys.stderr.write("[interpret.py]: ERROR (32) - VariableAnalysis - analyze_label()\n")
             sys.stderr.write(f"               NOTE  - Wrong label operand format\n")
             sys.stderr.write(f"               LABEL - {input_label}\n")
-            sys.exit(32)
+            raise InterpretError(32)
 
         # return the new label
         return input_label
@@ -655,11 +2327,25 @@ class VariableAnalysis:
             sys.stderr.write("[interpret.py]: ERROR (32) - VariableAnalysis - analyze_type()\n")
             sys.stderr.write(f"               NOTE  - Wrong label operand format\n")
             sys.stderr.write(f"               TYPE - {input_type}\n")
-            sys.exit(32)
+            raise InterpretError(32)
 
         # return the new type
         return input_type
 
+    # format_value():
+    # - converts the native value into its output format (WRITE, DPRINT)
+    # - <int> 42 -> "42", <bool> True -> "true", <nil> NIL -> "", <float> 3.0 -> "0x1.8000000000000p+1", <string> is returned as it is
+    def format_value(self, var_type, var_data):
+
+        if var_type == "bool":
+            return "true" if var_data else "false"
+        elif var_type == "nil":
+            return ""
+        elif var_type == "float":
+            return var_data.hex()
+        else:
+            return str(var_data)
+
 
 
 # -   # - - - - - - - - - - - - - - - - - - - #
@@ -668,129 +2354,183 @@ class VariableAnalysis:
 #
 # usage:
 # - Class where methods are used to execute instructions one by one
-# - Every method has instructure as an argument -> Instruction class object which is is then executed by the method
+# - Every method has instructure as an argument -> CompiledInstruction class object which is is then executed by the method
+# - Instruction operands are already checked and decoded by the InstructionCompiler class
+# - Every method has the same calling convention -> execute_<opcode>(inst, pc), returns the position of the next instruction
+# - handlers dictionary maps opcodes onto the methods, the methods are bound to the instructions before execution
 #
 # dependencies:
 # - DataStack class             - used to store data in stack -> PUSHS, POPS
 # - FuncCallStack class         - used to store jump addresses in stack -> CALL, RETURN
 # - FrameStackProtocol class    - used to store data in frames -> CREATEFRAME, DEFVAR, MOVE
 # - VariableAnalysis class      - used to check/decode variables -> STRLEN, JUMP
+# - SymbolTableJump class       - used to report undefined labels -> CALL, JUMP
+# - OutputBuffer class          - used to buffer the output -> WRITE
+# - InputReader class           - used to read the input -> READ
+# - superinstructions (InstructionFusion) are executed by the execute_fused_<name> methods -> fused_handlers dictionary
 class ExecuteInstruction:
 
-    def __init__(self):
+    def __init__(self, symt_jump):
         self.data_stack = DataStack()            # data stack
         self.func_stack = FuncCallStack()        # function call stack
         self.frame_data = FrameStackProtocol()   # interface for the frame stack
         self.inspect = VariableAnalysis()        # decode variable quirks
+        self.symt_jump = symt_jump               # label table
+        self.input_reader = InputReader(None)    # input for the READ instruction
+        self.output = OutputBuffer(sys.stdout)   # output of the WRITE instruction
+
+        # opcode -> execution method
+        self.handlers = {
+            "MOVE" : self.execute_move,                   # Data frames
+            "DEFVAR" : self.execute_defvar,
+            "CREATEFRAME" : self.execute_createframe,
+            "PUSHFRAME" : self.execute_pushframe,
+            "POPFRAME" : self.execute_popframe,
+            "CALL" : self.execute_call,                   # Function calls
+            "RETURN" : self.execute_return,
+            "PUSHS" : self.execute_pushs,                 # Data stack
+            "POPS" : self.execute_pops,
+            "ADD" : self.execute_add,                     # Arithmetic
+            "SUB" : self.execute_sub,
+            "MUL" : self.execute_mul,
+            "IDIV" : self.execute_idiv,
+            "DIV" : self.execute_div,
+            "LT" : self.execute_lt,                       # Relational
+            "GT" : self.execute_gt,
+            "EQ" : self.execute_eq,
+            "AND" : self.execute_and,                     # Logical
+            "OR" : self.execute_or,
+            "NOT" : self.execute_not,
+            "INT2CHAR" : self.execute_int2char,           # Conversion
+            "STRI2INT" : self.execute_stri2int,
+            "INT2FLOAT" : self.execute_int2float,
+            "FLOAT2INT" : self.execute_float2int,
+            "READ" : self.execute_read,                   # I/O
+            "WRITE" : self.execute_write,
+            "CONCAT" : self.execute_concat,               # String operations
+            "STRLEN" : self.execute_strlen,
+            "GETCHAR" : self.execute_getchar,
+            "SETCHAR" : self.execute_setchar,
+            "TYPE" : self.execute_type,                   # Type
+            "LABEL" : self.execute_label,                 # Program flow
+            "JUMP" : self.execute_jump,
+            "JUMPIFEQ" : self.execute_jumpifeq,
+            "JUMPIFNEQ" : self.execute_jumpifneq,
+            "EXIT" : self.execute_exit,
+            "DPRINT" : self.execute_dprint,               # Debugging
+            "BREAK" : self.execute_break,
+            "CLEARS" : self.execute_clears,               # Data-stack expansions
+            "ADDS" : self.execute_adds,
+            "SUBS" : self.execute_subs,
+            "MULS" : self.execute_muls,
+            "IDIVS" : self.execute_idivs,
+            "LTS" : self.execute_lts,
+            "GTS" : self.execute_gts,
+            "EQS" : self.execute_eqs,
+            "ANDS" : self.execute_ands,
+            "ORS" : self.execute_ors,
+            "NOTS" : self.execute_nots,
+            "INT2CHARS" : self.execute_int2chars,
+            "STRI2INTS" : self.execute_stri2ints,
+            "DIVS" : self.execute_divs,                   # Float extension
+            "INT2FLOATS" : self.execute_int2floats,
+            "FLOAT2INTS" : self.execute_float2ints,
+            "JUMPIFEQS" : self.execute_jumpifeqs,
+            "JUMPIFNEQS" : self.execute_jumpifneqs,
+        }
+
+        # superinstruction -> execution method (InstructionFusion)
+        self.fused_handlers = {
+            "PUSHS+PUSHS+ADDS+POPS" : self.execute_fused_adds,
+            "PUSHS+PUSHS+SUBS+POPS" : self.execute_fused_subs,
+            "PUSHS+PUSHS+MULS+POPS" : self.execute_fused_muls,
+            "PUSHS+PUSHS+IDIVS+POPS" : self.execute_fused_idivs,
+            "LT+JUMPIFEQ" : self.execute_fused_compare_jump,
+            "LT+JUMPIFNEQ" : self.execute_fused_compare_jump,
+            "GT+JUMPIFEQ" : self.execute_fused_compare_jump,
+            "GT+JUMPIFNEQ" : self.execute_fused_compare_jump,
+            "EQ+JUMPIFEQ" : self.execute_fused_compare_jump,
+            "EQ+JUMPIFNEQ" : self.execute_fused_compare_jump,
+            "DEFVAR+MOVE" : self.execute_fused_defvar_move,
+            "CREATEFRAME+PUSHFRAME" : self.execute_fused_createframe_pushframe,
+            "TYPE+JUMPIFEQ" : self.execute_fused_type_switch,
+            "TYPE+JUMPIFNEQ" : self.execute_fused_type_switch,
+        }
+
+        # jumps/calls to the label which doesn't exist -> execution method (InstructionCompiler.bind_handlers)
+        self.unresolved_handlers = {
+            "CALL" : self.execute_unresolved_jump,
+            "JUMP" : self.execute_unresolved_jump,
+            "JUMPIFEQ" : self.execute_unresolved_jumpif,
+            "JUMPIFNEQ" : self.execute_unresolved_jumpif,
+            "JUMPIFEQS" : self.execute_unresolved_jumpifs,
+            "JUMPIFNEQS" : self.execute_unresolved_jumpifs,
+        }
 
 
     # - DATA-FRAMES - # 
 
     # execute_defvar():
     # - saves the variable name/tag into the var frame
-    #
-    # return error codes:
-    # = 32 - Too many arguments -> expected - DEFVAR <var>
-    def execute_defvar(self, inst):        
-
-        # check if inst has only <var> as an arguments
-        if inst.arg2_text != None or inst.arg2_type != None or inst.arg3_text != None or inst.arg3_type != None:
-            sys.stderr.write("[interpret.py]: ERROR (32) - ExecuteInstruction - execute_defvar()\n")
-            sys.stderr.write(f"               NOTE - Too many arguments, expected - MOVE <var>\n")
-            sys.exit(32)
-        
+    def execute_defvar(self, inst, pc):        
+
         # insert the variable into the symbol table
-        self.frame_data.symt_insert_var(inst.arg1_text)
+        self.frame_data.symt_insert_var(inst.arg1)
+
+        return pc + 1
 
     # execute_move():
     # - moves the value of the second argument into the variable
-    #
-    # return error codes:
-    # = 32 - Too many arguments -> expected - MOVE <var> <symb>
-    def execute_move(self, inst):
-
-        # check if inst has only <var> <symb> as arguments
-        if inst.arg3_text != None or inst.arg3_type != None:
-            sys.stderr.write("[interpret.py]: ERROR (32) - ExecuteInstruction - execute_move()\n")
-            sys.stderr.write(f"               NOTE - Too many arguments, expected - MOVE <var> <symb>\n")
-            sys.exit(32)
-        
+    def execute_move(self, inst, pc):
+
         # get the variable data from the symbol table and update the variable
-        var_type, var_data = self.frame_data.symt_get_symb(inst, "universal", "arg2", "raw")
+        var_type, var_data = self.frame_data.symt_get_symb(inst.arg2, "universal")
 
         # update the variable
-        self.frame_data.symt_update_var(inst.arg1_text, var_type, var_data)
+        self.frame_data.symt_update_var(inst.arg1, var_type, var_data)
+
+        return pc + 1
 
     # execute_createframe():
     # - creates a new temporary frame
-    #
-    # return error codes:
-    # = 32 - Too many arguments -> expected - CREATEFRAME
-    def execute_createframe(self, inst):
-
-        # check if all the arguments are empty
-        if inst.arg1_type is not None or inst.arg1_text is not None or inst.arg2_type is not None or inst.arg2_text is not None or inst.arg3_type is not None or inst.arg3_text is not None:
-            sys.stderr.write(f"[interpret.py]: ERROR (32) - ExecuteInstruction - execute_createrfame()\n")
-            sys.stderr.write(f"                NOTE - Too many arguments, expected - CREATEFRAME\n")
-            sys.exit(32)
+    def execute_createframe(self, inst, pc):
 
         # create temporary frame
         self.frame_data.frame_stack_create()
 
+        return pc + 1
+
     # execute_pushframe():
     # - pushes the temporary frame to the stack
-    #
-    # return error codes:
-    # = 32 - Too many arguments -> expected - PUSHFRAME
-    def execute_pushframe(self, inst):
-
-        # check if all the arguments are empty
-        if inst.arg1_type is not None or inst.arg1_text is not None or inst.arg2_type is not None or inst.arg2_text is not None or inst.arg3_type is not None or inst.arg3_text is not None:
-            sys.stderr.write(f"[interpret.py]: ERROR (32) - ExecuteInstruction - execute_pushframe()\n")
-            sys.stderr.write(f"                NOTE - Too many arguments, expected - PUSHFRAME\n")
-            sys.exit(32)
+    def execute_pushframe(self, inst, pc):
 
         # push the temporary frame to the stack
         self.frame_data.frame_stack_push()
 
+        return pc + 1
+
     # execute_popframe():
     # - pops the top frame from the stack
-    #
-    # return error codes:
-    # = 32 - Too many arguments -> expected - POPFRAME
-    def execute_popframe(self, inst):
-
-        # check if all the arguments are empty
-        if inst.arg1_type is not None or inst.arg1_text is not None or inst.arg2_type is not None or inst.arg2_text is not None or inst.arg3_type is not None or inst.arg3_text is not None:
-            sys.stderr.write(f"[interpret.py]: ERROR (32) - ExecuteInstruction - execute_popframe()\n")
-            sys.stderr.write(f"                NOTE - Too many arguments, expected input - POPFRAME\n")
-            sys.exit(32)
+    def execute_popframe(self, inst, pc):
 
         # pop frame from the stack
         self.frame_data.frame_stack_pop()
 
+        return pc + 1
+
 
     # - FUNCTION-CALLS - # 
 
     # execute_call():
     # - calls the function - saves the current instruction order to the stack and jumps to the label
     # - returns the instruction order
-    #
-    # return error codes:
-    # = 32 - Too many arguments -> expected - CALL <label>
-    def execute_call(self, inst, symt_jump, push_inst_order):
+    def execute_call(self, inst, pc):
 
-        # check if inst has only <label> as an argument
-        if inst.arg2_type is not None or inst.arg2_text is not None or inst.arg3_type is not None or inst.arg3_text is not None:
-            sys.stderr.write(f"[interpret.py]: ERROR (32) - ExecuteInstruction - execute_call()\n")
-            sys.stderr.write(f"                NOTE - Too many arguments, expected input - CALL <label>\n")
-            sys.exit(32)
-
-        self.inspect.analyze_arg(inst.arg1_text, "label")
-        inst_order = symt_jump.get_label(inst.arg1_text)
+        # get the pre-resolved label position
+        inst_order = inst.arg1.target
 
         # push the current instruction order to the stack
-        self.func_stack.push(push_inst_order)
+        self.func_stack.push(pc)
 
         # return the instruction order
         return inst_order
@@ -798,17 +2538,8 @@ class ExecuteInstruction:
     # execute_return():
     # - returns from the function - pops the instruction order from the stack and jumps to the instruction order
     # - returns the instruction order
-    #
-    # return error codes:
-    # = 32 - Too many arguments -> expected - RETURN
-    def execute_return(self, inst):
-
-        # check if inst has no arguments
-        if inst.arg1_type is not None or inst.arg1_text is not None or inst.arg2_type is not None or inst.arg2_text is not None or inst.arg3_type is not None or inst.arg3_text is not None:
-            sys.stderr.write(f"[interpret.py]: ERROR (32) - ExecuteInstruction - execute_return()\n")
-            sys.stderr.write(f"                NOTE - Too many arguments, expected input - RETURN\n")
-            sys.exit(32)
-        
+    def execute_return(self, inst, pc):
+
         # get the instruction order from the stack
         inst_order = self.func_stack.pop()
         inst_order += 1
@@ -821,109 +2552,123 @@ class ExecuteInstruction:
 
     # execute_pushs():
     # - pushes the symb and type to the stack
-    #
-    # return error codes:
-    # = 32 - Too many arguments -> expected - PUSHS <symb>
-    def execute_pushs(self, inst):
-
-        # check if inst has only <symb> as an argument
-        if inst.arg2_type is not None or inst.arg2_text is not None or inst.arg3_type is not None or inst.arg3_text is not None:
-            sys.stderr.write(f"[interpret.py]: ERROR (32) - ExecuteInstruction - execute_pushs()\n")
-            sys.stderr.write(f"                NOTE - Too many arguments, expected input - PUSHS <symb>\n")
-            sys.exit(32)
+    def execute_pushs(self, inst, pc):
 
         # get the variable
-        var_type, var_data = self.frame_data.symt_get_symb(inst, "universal", "arg1", "raw")
+        var_type, var_data = self.frame_data.symt_get_symb(inst.arg1, "universal")
 
         # push the variable to the stack
         self.data_stack.push(var_data, var_type)
 
+        return pc + 1
+
     # execute_pops():
     # - pops the symb and type from the stack and updates the variable
-    #
-    # return error codes:
-    # = 32 - Too many arguments -> expected - POPS <var>
-    def execute_pops(self, inst):
-
-        # check if inst has only <var> as an argument
-        if inst.arg2_type is not None or inst.arg2_text is not None or inst.arg3_type is not None or inst.arg3_text is not None:
-            sys.stderr.write(f"[interpret.py]: ERROR (32) - ExecuteInstruction - execute_pops()\n")
-            sys.stderr.write(f"                NOTE - Too many arguments, expected input - POPS <var>\n")
-            sys.exit(32)
+    def execute_pops(self, inst, pc):
 
         # get the variables from the stack
         var_data, var_type = self.data_stack.pop()
 
         # update the variable
-        self.frame_data.symt_update_var(inst.arg1_text, var_type, var_data)
+        self.frame_data.symt_update_var(inst.arg1, var_type, var_data)
+
+        return pc + 1
     
 
     # - ARITHMETIC - #
 
     # execute_add():
-    # - adds (int) the symb1 and symb2 and updates the variable with the result
-    def execute_add(self, inst):
+    # - adds (int, float) the symb1 and symb2 and updates the variable with the result
+    def execute_add(self, inst, pc):
 
         # get the variables
-        _, var_data_1, _, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "arithmetic", "same", "decoded")
+        var_type, var_data_1, _, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "arithmetic", "same")
 
         # add the variables
-        var_add = int(var_data_1) + int(var_data_2)
+        var_add = var_data_1 + var_data_2
 
         # update the variable
-        self.frame_data.symt_update_var(inst.arg1_text, "int", str(var_add))
+        self.frame_data.symt_update_var(inst.arg1, var_type, var_add)
+
+        return pc + 1
 
     # execute_sub():
-    # - subtracts (int) the symb1 and symb2 and updates the variable with the result
-    def execute_sub(self, inst):
+    # - subtracts (int, float) the symb1 and symb2 and updates the variable with the result
+    def execute_sub(self, inst, pc):
 
             # get the variables
-            _, var_data_1, _, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "arithmetic", "same", "decoded")
+            var_type, var_data_1, _, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "arithmetic", "same")
 
             # add the variables
-            var_sub = int(var_data_1) - int(var_data_2)
+            var_sub = var_data_1 - var_data_2
 
             # update the variable
-            self.frame_data.symt_update_var(inst.arg1_text, "int", str(var_sub))
+            self.frame_data.symt_update_var(inst.arg1, var_type, var_sub)
+
+            return pc + 1
 
     # execute_mul():
-    # - multiplies (int) the symb1 and symb2 and updates the variable with the result
-    def execute_mul(self, inst):
+    # - multiplies (int, float) the symb1 and symb2 and updates the variable with the result
+    def execute_mul(self, inst, pc):
 
-        if inst.arg1_type == "var":
+        # get the variables
+        var_type, var_data_1, _, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "arithmetic", "same")
 
-            # get the variables
-            _, var_data_1, _, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "arithmetic", "same", "decoded")
+        # add the variables
+        var_mul = var_data_1 * var_data_2
 
-            # add the variables
-            var_mul = int(var_data_1) * int(var_data_2)
+        # update the variable
+        self.frame_data.symt_update_var(inst.arg1, var_type, var_mul)
 
-            # update the variable
-            self.frame_data.symt_update_var(inst.arg1_text, "int", str(var_mul))
+        return pc + 1
 
     # execute_idiv():
     # - divides (int) the symb1 and symb2 and updates the variable with the result
     #
     # return error codes:
     # = 57 - Illegal division by zero
-    def execute_idiv(self, inst):
+    def execute_idiv(self, inst, pc):
 
         # get the variables
-        _, var_data_1, _, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "arithmetic", "same", "decoded")
+        _, var_data_1, _, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "integer", "same")
 
         # catch division by zero
-        if var_data_2 == "0":
+        if var_data_2 == 0:
             sys.stderr.write(f"[interpret.py]: ERROR (57) - ExecuteInstruction - execute_idiv()\n")
             sys.stderr.write(f"                NOTE - Illegal division by zero\n")
-            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {inst.arg2_type} {inst.arg3_type}\n")
-            sys.exit(57)
+            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {inst.arg2.type} {inst.arg3.type}\n")
+            raise InterpretError(57)
 
         else:
             # add the variables
-            var_idiv = int(var_data_1) // int(var_data_2)
+            var_idiv = var_data_1 // var_data_2
             
             # update the variable
-            self.frame_data.symt_update_var(inst.arg1_text, "int", str(var_idiv))
+            self.frame_data.symt_update_var(inst.arg1, "int", var_idiv)
+
+        return pc + 1
+
+    # execute_div():
+    # - divides (float) the symb1 and symb2 and updates the variable with the result
+    #
+    # return error codes:
+    # = 57 - Illegal division by zero
+    def execute_div(self, inst, pc):
+
+        # get the variables
+        _, var_data_1, _, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "float", "same")
+
+        # catch division by zero
+        if var_data_2 == 0:
+            sys.stderr.write(f"[interpret.py]: ERROR (57) - ExecuteInstruction - execute_div()\n")
+            sys.stderr.write(f"                NOTE - Illegal division by zero\n")
+            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {inst.arg2.type} {inst.arg3.type}\n")
+            raise InterpretError(57)
+
+        # update the variable
+        self.frame_data.symt_update_var(inst.arg1, "float", var_data_1 / var_data_2)
+
+        return pc + 1
 
 
     # - RELATIONAL - #
@@ -933,124 +2678,130 @@ class ExecuteInstruction:
     #
     # return error codes:
     # = 53 - Invalid operand type -> expected - symb1 and symb2 to be the same type
-    def execute_lt(self, inst):
+    def execute_lt(self, inst, pc):
         
         # get the variables
-        var_type_1, var_data_1, var_type_2, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "relational", "same", "decoded")
+        var_type_1, var_data_1, var_type_2, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "relational", "same")
 
-        # compare the int variables
-        if var_type_1 == "int" and var_type_2 == "int":
-            if int(var_data_1) < int(var_data_2):
-                self.frame_data.symt_update_var(inst.arg1_text, "bool", "true")
+        # compare the int/float variables
+        if var_type_1 == var_type_2 and var_type_1 in ("int", "float"):
+            if var_data_1 < var_data_2:
+                self.frame_data.symt_update_var(inst.arg1, "bool", True)
             else:
-                self.frame_data.symt_update_var(inst.arg1_text, "bool", "false")
+                self.frame_data.symt_update_var(inst.arg1, "bool", False)
 
         # compare the string variables
         elif var_type_1 == "string" and var_type_2 == "string":
             if var_data_1 < var_data_2:
-                self.frame_data.symt_update_var(inst.arg1_text, "bool", "true")
+                self.frame_data.symt_update_var(inst.arg1, "bool", True)
             else:
-                self.frame_data.symt_update_var(inst.arg1_text, "bool", "false")
+                self.frame_data.symt_update_var(inst.arg1, "bool", False)
 
         # compare the bool variables
         elif var_type_1 == "bool" and var_type_2 == "bool":
-            if var_data_1 == "false" and var_data_2 == "true":
-                self.frame_data.symt_update_var(inst.arg1_text, "bool", "true")
+            if not var_data_1 and var_data_2:
+                self.frame_data.symt_update_var(inst.arg1, "bool", True)
             else:
-                self.frame_data.symt_update_var(inst.arg1_text, "bool", "false")
+                self.frame_data.symt_update_var(inst.arg1, "bool", False)
         else:
             sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_lt()\n")
-            sys.stderr.write(f"                NOTE - Wrong variable types, expected <int, bool, string>\n")
-            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {inst.arg2_type} {inst.arg3_type}\n")
-            sys.exit(53)   
+            sys.stderr.write(f"                NOTE - Wrong variable types, expected <int, float, bool, string>\n")
+            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {inst.arg2.type} {inst.arg3.type}\n")
+            raise InterpretError(53)   
+
+        return pc + 1
 
     # execute_gt():
     # - compares the symb1 and symb2 and updates the variable with gt result (bool)
     #
     # return error codes:
     # = 53 - Invalid operand type -> expected - symb1 and symb2 to be the same type
-    def execute_gt(self, inst):
+    def execute_gt(self, inst, pc):
     
         # get the variables
-        var_type_1, var_data_1, var_type_2, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "relational", "different", "decoded")
+        var_type_1, var_data_1, var_type_2, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "relational", "different")
 
-        # compare the int variables
-        if var_type_1 == "int" and var_type_2 == "int":
-            if int(var_data_1) > int(var_data_2):
-                self.frame_data.symt_update_var(inst.arg1_text, "bool", "true")
+        # compare the int/float variables
+        if var_type_1 == var_type_2 and var_type_1 in ("int", "float"):
+            if var_data_1 > var_data_2:
+                self.frame_data.symt_update_var(inst.arg1, "bool", True)
             else:
-                self.frame_data.symt_update_var(inst.arg1_text, "bool", "false")
+                self.frame_data.symt_update_var(inst.arg1, "bool", False)
 
         # compare the string variables
         elif var_type_1 == "string" and var_type_2 == "string":
             if var_data_1 > var_data_2:
-                self.frame_data.symt_update_var(inst.arg1_text, "bool", "true")
+                self.frame_data.symt_update_var(inst.arg1, "bool", True)
             else:
-                self.frame_data.symt_update_var(inst.arg1_text, "bool", "false")
+                self.frame_data.symt_update_var(inst.arg1, "bool", False)
 
         # compare the bool variables
         elif var_type_1 == "bool" and var_type_2 == "bool":
-            if var_data_1 == "true" and var_data_2 == "false":
-                self.frame_data.symt_update_var(inst.arg1_text, "bool", "true")
+            if var_data_1 and not var_data_2:
+                self.frame_data.symt_update_var(inst.arg1, "bool", True)
             else:
-                self.frame_data.symt_update_var(inst.arg1_text, "bool", "false")
+                self.frame_data.symt_update_var(inst.arg1, "bool", False)
         
         # compare the nil variables
         else:
             sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_gt()\n")
-            sys.stderr.write(f"                NOTE - Wrong variable types, expected <int, bool, string>\n")
-            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {inst.arg2_type} {inst.arg3_type}\n")
-            sys.exit(53)   
+            sys.stderr.write(f"                NOTE - Wrong variable types, expected <int, float, bool, string>\n")
+            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {inst.arg2.type} {inst.arg3.type}\n")
+            raise InterpretError(53)   
+
+        return pc + 1
 
     # execute_eq():
     # - compares the symb1 and symb2 and updates the variable with eq result (bool)
     #
     # return error codes:
     # = 53 - Invalid operand type -> expected - symb1 and symb2 to be the same type
-    def execute_eq(self, inst):
+    def execute_eq(self, inst, pc):
         
         # get the variables
-        var_type_1, var_data_1, var_type_2, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "relational", "different", "decoded")
+        var_type_1, var_data_1, var_type_2, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "relational", "different")
 
         # if var_data_1 or var_data_2 is nil
         if var_type_1 == "nil" or var_type_2 == "nil":
 
             # compare the nil variables
             if var_type_1 == var_type_2:
-                self.frame_data.symt_update_var(inst.arg1_text, "bool", "true")
+                self.frame_data.symt_update_var(inst.arg1, "bool", True)
             else:
-                self.frame_data.symt_update_var(inst.arg1_text, "bool", "false")
+                self.frame_data.symt_update_var(inst.arg1, "bool", False)
 
         # compare other types
         else:
 
-            # compare the int variables
-            if var_type_1 == "int" and var_type_2 == "int":
-                if int(var_data_1) == int(var_data_2):
-                    self.frame_data.symt_update_var(inst.arg1_text, "bool", "true")
+            # compare the int/float variables
+            if var_type_1 == var_type_2 and var_type_1 in ("int", "float"):
+                if var_data_1 == var_data_2:
+                    self.frame_data.symt_update_var(inst.arg1, "bool", True)
                 else:
-                    self.frame_data.symt_update_var(inst.arg1_text, "bool", "false")
+                    self.frame_data.symt_update_var(inst.arg1, "bool", False)
 
             # compare the string variables
             elif var_type_1 == "string" and var_type_2 == "string":
                 if var_data_1 == var_data_2:
-                    self.frame_data.symt_update_var(inst.arg1_text, "bool", "true")
+                    self.frame_data.symt_update_var(inst.arg1, "bool", True)
                 else:
-                    self.frame_data.symt_update_var(inst.arg1_text, "bool", "false")
+                    self.frame_data.symt_update_var(inst.arg1, "bool", False)
 
             # compare the bool variables
             elif var_type_1 == "bool" and var_type_2 == "bool":
                 if var_data_1 == var_data_2:
-                    self.frame_data.symt_update_var(inst.arg1_text, "bool", "true")
+                    self.frame_data.symt_update_var(inst.arg1, "bool", True)
                 else:
-                    self.frame_data.symt_update_var(inst.arg1_text, "bool", "false")
+                    self.frame_data.symt_update_var(inst.arg1, "bool", False)
             
             # wrong types
             else:
                 sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_eq()\n")
                 sys.stderr.write(f"                NOTE - Wrong variable types, expected two same types as second and third argument\n")
-                sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {inst.arg2_type} {inst.arg3_type}\n")
-                sys.exit(53)                
+                sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {inst.arg2.type} {inst.arg3.type}\n")
+                raise InterpretError(53)                
+
+        return pc + 1
 
 
     # - LOGICAL - #
@@ -1060,45 +2811,51 @@ class ExecuteInstruction:
     #
     # return error codes:
     # = 53 - Invalid operand type -> expected - symb1 and symb2 to be bool
-    def execute_and(self, inst):
+    def execute_and(self, inst, pc):
         
         # get the variables
-        _, var_data_1, _, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "logical", "same", "decoded")
+        _, var_data_1, _, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "logical", "same")
 
         # compare the bool variables
-        if var_data_1 == "true" and var_data_2 == "true":
-            self.frame_data.symt_update_var(inst.arg1_text, "bool", "true")
+        if var_data_1 and var_data_2:
+            self.frame_data.symt_update_var(inst.arg1, "bool", True)
         else:
-            self.frame_data.symt_update_var(inst.arg1_text, "bool", "false")
+            self.frame_data.symt_update_var(inst.arg1, "bool", False)
+
+        return pc + 1
 
     # execute_or():
     # - uses or operator on the symb1 and symb2 and updates the variable with the result (bool)
     #
     # return error codes:
     # = 53 - Invalid operand type -> expected - symb1 and symb2 to be bool
-    def execute_or(self, inst):
+    def execute_or(self, inst, pc):
 
         # get the variables
-        _, var_data_1, _, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "logical", "same", "decoded")
+        _, var_data_1, _, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "logical", "same")
 
         # compare the bool variables
-        if var_data_1 == "false" and var_data_2 == "false":
-            self.frame_data.symt_update_var(inst.arg1_text, "bool", "false")
+        if not var_data_1 and not var_data_2:
+            self.frame_data.symt_update_var(inst.arg1, "bool", False)
         else:
-            self.frame_data.symt_update_var(inst.arg1_text, "bool", "true")
+            self.frame_data.symt_update_var(inst.arg1, "bool", True)
+
+        return pc + 1
 
     # execute_not():
     # - negates the symb and updates the variable with the result (bool)
-    def execute_not(self, inst):
+    def execute_not(self, inst, pc):
         
         # get the variables
-        _, var_data = self.frame_data.symt_get_symb(inst, "boolean", "arg2", "decoded")
+        _, var_data = self.frame_data.symt_get_symb(inst.arg2, "boolean")
 
         # compare the bool variables
-        if var_data == "true":
-            self.frame_data.symt_update_var(inst.arg1_text, "bool", "false")
+        if var_data:
+            self.frame_data.symt_update_var(inst.arg1, "bool", False)
         else:
-            self.frame_data.symt_update_var(inst.arg1_text, "bool", "true")
+            self.frame_data.symt_update_var(inst.arg1, "bool", True)
+
+        return pc + 1
 
 
 
@@ -1110,40 +2867,40 @@ class ExecuteInstruction:
     # return error codes:
     # = 32 - Invalid operand type -> expected - symb to be int
     # = 58 - Invalid operand value -> expected - int can't be converted to char
-    def execute_int2char(self, inst):
+    def execute_int2char(self, inst, pc):
 
-        # check if inst has only <var> <symb> arguments
-        if inst.arg3_type != None or inst.arg3_text != None:
-            sys.stderr.write(f"[interpret.py]: ERROR (32) - ExecuteInstruction - execute_int2char()\n")
-            sys.stderr.write(f"                NOTE - Too many arguments, expected - INT2CHAR <var> <symb>\n")
-            sys.exit(32)
-        
         # get the variables
-        _, var_data = self.frame_data.symt_get_symb(inst, "integer", "arg2", "decoded")
+        _, var_data = self.frame_data.symt_get_symb(inst.arg2, "integer")
 
         # convert the int to char
         try:
-            char = chr(int(var_data))
-            char = re.sub(r"([\W\s])", lambda m: fr"\{ord(m.group(1)):03d}", str(char))
-        except ValueError:
+            char = chr(var_data)
+        except (ValueError, OverflowError):
             sys.stderr.write(f"[interpret.py]: ERROR (58) - ExecuteInstruction - execute_int2char()\n")
             sys.stderr.write(f"                NOTE - Int can't be converted into chat\n")
-            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} {inst.arg2_text}\n")
-            sys.exit(58)
+            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} {inst.arg2.text}\n")
+            raise InterpretError(58)
 
         # update value
-        self.frame_data.symt_update_var(inst.arg1_text, "string", char)
+        self.frame_data.symt_update_var(inst.arg1, "string", char)
+
+        return pc + 1
 
     # execute_stri2int():
     # - converts the symb to int and updates the variable with the result (int)
     #
     # return error codes:
     # = 58 - String index out of range
-    def execute_stri2int(self, inst):
+    def execute_stri2int(self, inst, pc):
+
+        # char of the string buffer (SETCHAR)
+        char = self.__buffer_char(inst)
+        if char is not None:
+            self.frame_data.symt_update_var(inst.arg1, "int", ord(char))
+            return pc + 1
 
         # get the variables
-        _, var_data_1, _, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "string_int", "different", "decoded")
-        char_pos = int(var_data_2)
+        _, var_data_1, _, char_pos = self.frame_data.symt_get_symb1_symb2(inst, "string_int", "different")
 
         # check the string index with char_pos position
         if char_pos < len(var_data_1) and char_pos > -1:
@@ -1151,199 +2908,258 @@ class ExecuteInstruction:
         else:
             sys.stderr.write(f"[interpret.py]: ERROR (58) - ExecuteInstruction - execute_stri2int()\n")
             sys.stderr.write(f"                NOTE - String index out of range\n")
-            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} {inst.arg2_text}\n")
-            sys.exit(58)
+            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} {inst.arg2.text}\n")
+            raise InterpretError(58)
 
         # update value
-        self.frame_data.symt_update_var(inst.arg1_text, "int", str(ord(char)))
+        self.frame_data.symt_update_var(inst.arg1, "int", ord(char))
 
+        return pc + 1
 
-    # - INPUT-OUTPUT - #
+    # execute_int2float():
+    # - converts the int symb to float and updates the variable with the result (float)
+    #
+    # return error codes:
+    # = 57 - Invalid operand value -> int is too big for float
+    def execute_int2float(self, inst, pc):
 
-    # execute_read():
-    # - reads the input from input and updates the variable with the result (int, bool, string, nil)
+        # get the variables
+        _, var_data = self.frame_data.symt_get_symb(inst.arg2, "integer")
+
+        # convert the int to float
+        try:
+            var_float = float(var_data)
+        except OverflowError:
+            sys.stderr.write(f"[interpret.py]: ERROR (57) - ExecuteInstruction - execute_int2float()\n")
+            sys.stderr.write(f"                NOTE - Int can't be converted into float\n")
+            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} {inst.arg2.text}\n")
+            raise InterpretError(57)
+
+        # update value
+        self.frame_data.symt_update_var(inst.arg1, "float", var_float)
+
+        return pc + 1
+
+    # execute_float2int():
+    # - converts the float symb to int (truncated) and updates the variable with the result (int)
     #
     # return error codes:
-    # = 32 - Too many arguments -> expected - READ <var> <type>
-    # = 53 - Invalid operand type -> expected - type to be int, bool or string
-    def execute_read(self, inst, input_source):
-
-        # check if inst has only <var> <type> arguments
-        if inst.arg3_type != None or inst.arg3_text != None:
-            sys.stderr.write(f"[interpret.py]: ERROR (32) - ExecuteInstruction - execute_read()\n")
-            sys.stderr.write(f"                NOTE - Too many arguments, expected - READ <var> <type>\n")
-            sys.exit(32)
-        
-        # check the variable type
-        if inst.arg2_text == "int" or inst.arg2_text == "bool" or inst.arg2_text == "string":
-            data_type = inst.arg2_text
-        else:
-            sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_read()\n")
-            sys.stderr.write(f"                NOTE - Wrong variable type, expected int, bool or string\n")
-            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} {inst.arg2_text}\n")
-            sys.exit(53)
+    # = 57 - Invalid operand value -> inf or nan can't be converted to int
+    def execute_float2int(self, inst, pc):
 
-        # get the right source - stdin or file
-        if input_source == None:
-            data_type = "nil"
+        # get the variables
+        _, var_data = self.frame_data.symt_get_symb(inst.arg2, "float")
 
-        elif input_source == sys.stdin:
-            new_data = input()
-        else:
-            new_data = input_source.readline()
+        # convert the float to int
+        try:
+            var_int = int(var_data)
+        except (ValueError, OverflowError):
+            sys.stderr.write(f"[interpret.py]: ERROR (57) - ExecuteInstruction - execute_float2int()\n")
+            sys.stderr.write(f"                NOTE - Float can't be converted into int\n")
+            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} {inst.arg2.text}\n")
+            raise InterpretError(57)
 
-        # check if the new_data are empty
-        if new_data == "" or new_data is None:
-            data_type = "nil"
+        # update value
+        self.frame_data.symt_update_var(inst.arg1, "int", var_int)
 
-        # remove \n from the end of the string
-        if new_data != "" and new_data[-1] == "\n":
-            new_data = new_data[:-1]
+        return pc + 1
 
-        # check the new given data
-        # string
-        if data_type == "string":
 
-            # change every non-alphanumeric character to its ASCII code in formal \[0-9][0-9][0-9]
-            new_data = re.sub(r"([\W\s])", lambda m: fr"\{ord(m.group(1)):03d}", new_data)
+    # - INPUT-OUTPUT - #
 
-            # update value
-            self.frame_data.symt_update_var(inst.arg1_text, "string", new_data)
-            
-        # int
-        elif data_type == "int":
-            if re.match(r"^[-+]?[0-9]+$", new_data):
-                self.frame_data.symt_update_var(inst.arg1_text, "int", new_data)
-            else:
-                self.frame_data.symt_update_var(inst.arg1_text, "nil", "")
-            
-        # bool
-        elif data_type == "bool":
-            new_data = new_data.lower()
-            if re.match(r"^(true|false)$", new_data):
-                self.frame_data.symt_update_var(inst.arg1_text, "bool", new_data)
-            else:
-                self.frame_data.symt_update_var(inst.arg1_text, "bool", "false")
+    # execute_read():
+    # - reads the input from input and updates the variable with the result (int, float, bool, string, nil)
+    #
+    # return error codes:
+    # = 53 - Invalid operand type -> expected - type to be int, float, bool or string
+    def execute_read(self, inst, pc):
 
-        # nil
+        # check the variable type
+        if inst.arg2.value in ("int", "float", "bool", "string"):
+            data_type = inst.arg2.value
         else:
-            self.frame_data.symt_update_var(inst.arg1_text, "nil", "")
+            sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_read()\n")
+            sys.stderr.write(f"                NOTE - Wrong variable type, expected int, float, bool or string\n")
+            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} {inst.arg2.text}\n")
+            raise InterpretError(53)
+
+        # interactive input -> the output has to be written before the user answers
+        if self.input_reader.interactive:
+            self.output.flush()
+
+        # read and convert the line (end of the input -> nil)
+        new_type, new_data = self.input_reader.read_value(data_type)
+        self.frame_data.symt_update_var(inst.arg1, new_type, new_data)
+
+        return pc + 1
     
     # execute_write():
     # - writes the symb to stdout
-    #
-    # return error codes:
-    # = 32 - Too many arguments -> expected - WRITE <symb>
-    def execute_write(self, inst):
-
-        # check if inst has only <symb> argument
-        if inst.arg2_type != None or inst.arg2_text != None or inst.arg3_type != None or inst.arg3_text != None:
-            sys.stderr.write(f"[interpret.py]: ERROR (32) - ExecuteInstruction - execute_write()\n")
-            sys.stderr.write(f"                NOTE - Too many arguments, expected - WRITE <symb>\n")
-            sys.exit(32)
+    def execute_write(self, inst, pc):
 
         # get variable data
-        _, var_data = self.frame_data.symt_get_symb(inst, "universal", "arg1", "decoded")
+        var_type, var_data = self.frame_data.symt_get_symb(inst.arg1, "universal")
 
         # print variable
-        print(var_data, end="")
+        self.output.write(self.inspect.format_value(var_type, var_data))
+
+        return pc + 1
 
 
     # - STRING-OPERATIONS - #
 
     # execute_concat():
     # - concatenates two strings and updates the variable with the result
-    def execute_concat(self, inst):
-            
-        # get the variables
-        _, var_data_1, _, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "string_string", "same", "raw")
+    # - CONCAT var var symb with the long string -> symb is appended to the rope of the var (StringRope), nothing is copied
+    def execute_concat(self, inst, pc):
+
+        # append the string to the rope of the same variable
+        append = inst.arg2.kind == "var" and inst.arg2.scope == inst.arg1.scope and inst.arg2.name == inst.arg1.name
+        if append and (inst.arg3.kind != "var" or inst.arg3.scope != inst.arg1.scope or inst.arg3.name != inst.arg1.name):
+            rope = self.frame_data.symt_gather_lazy(inst.arg1, "rope")
+            if rope is not None:
+                if inst.arg3.kind == "var":
+                    var_type_2, var_data_2 = self.frame_data.symt_gather_var(inst.arg3)
+                else:
+                    var_type_2, var_data_2 = inst.arg3.type, inst.arg3.value
+                if var_type_2 == "string":
+                    rope.append(var_data_2)
+                    return pc + 1
+
+        # get the variables (wrong types -> the error is reported)
+        _, var_data_1, _, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "string_string", "same")
+
+        # long string is appended to the same variable -> the rope is created
+        if append and len(var_data_1) >= StringRope.MIN_LENGTH:
+            self.frame_data.symt_update_var(inst.arg1, "rope", StringRope([var_data_1, var_data_2]))
 
         # concatenate strings
-        self.frame_data.symt_update_var(inst.arg1_text, "string", var_data_1 + var_data_2)
+        else:
+            self.frame_data.symt_update_var(inst.arg1, "string", var_data_1 + var_data_2)
+
+        return pc + 1
 
     # execute_strlen():
     # - gets the length of the string and updates the variable with the result
-    #
-    # return error codes:
-    # = 32 - Too many arguments -> expected - STRLEN <var> <symb>
-    def execute_strlen(self, inst):
+    def execute_strlen(self, inst, pc):
 
-        # check if inst has only <var> <symb> arguments
-        if inst.arg3_type != None or inst.arg3_text != None:
-            sys.stderr.write(f"[interpret.py]: ERROR (32) - ExecuteInstruction - execute_strlen()\n")
-            sys.stderr.write(f"                NOTE - Too many arguments, expected - STRLEN <var> <symb>\n")
-            sys.exit(32)
+        # string buffer (SETCHAR) -> length of the buffer, it isn't joined
+        if inst.arg2.kind == "var":
+            buffer = self.frame_data.symt_gather_lazy(inst.arg2, "chars")
+            if buffer is not None:
+                self.frame_data.symt_update_var(inst.arg1, "int", len(buffer.chars))
+                return pc + 1
 
         # get the variables
-        _, var_data = self.frame_data.symt_get_symb(inst, "string", "arg2", "decoded")
+        _, var_data = self.frame_data.symt_get_symb(inst.arg2, "string")
 
         # get the string length
-        self.frame_data.symt_update_var(inst.arg1_text, "int", str(len(var_data)))
+        self.frame_data.symt_update_var(inst.arg1, "int", len(var_data))
+
+        return pc + 1
+
+    # buffer_char():
+    # - returns the char of the string buffer (StringBuffer) for GETCHAR, STRI2INT var symb1 symb2
+    # - None if symb1 isn't the buffer or symb2 isn't its index -> the instruction reads its operands (errors are reported)
+    def __buffer_char(self, inst):
+
+        # symb1 has to be the buffer
+        if inst.arg2.kind != "var":
+            return None
+        buffer = self.frame_data.symt_gather_lazy(inst.arg2, "chars")
+        if buffer is None:
+            return None
+
+        # symb2 has to be the index of the buffer (symb2 can be the same variable -> it is joined, type isn't int)
+        if inst.arg3.kind == "var":
+            var_type, var_data = self.frame_data.symt_gather_var(inst.arg3)
+        else:
+            var_type, var_data = inst.arg3.type, inst.arg3.value
+        if var_type != "int" or var_data < 0 or var_data >= len(buffer.chars):
+            return None
+
+        return buffer.chars[var_data]
 
     # execute_getchar():
     # - gets the char from the string at the given index and updates the variable with the char
     #
     # return error codes:
     # = 58 - String index out of range
-    def execute_getchar(self, inst):
+    def execute_getchar(self, inst, pc):
+
+        # char of the string buffer (SETCHAR)
+        char = self.__buffer_char(inst)
+        if char is not None:
+            self.frame_data.symt_update_var(inst.arg1, "string", char)
+            return pc + 1
         
         # get the variables
-        _, var_string, _, var_int = self.frame_data.symt_get_symb1_symb2(inst, "string_int", "different", "decoded")
+        _, var_string, _, var_int = self.frame_data.symt_get_symb1_symb2(inst, "string_int", "different")
 
         # check the string index with char_pos position
-        if len(var_string) < int(var_int) or int(var_int) < 0:
+        if len(var_string) <= var_int or var_int < 0:
             sys.stderr.write(f"[interpret.py]: ERROR (58) - ExecuteInstruction - execute_getchar()\n")
             sys.stderr.write(f"                NOTE - String index out of range\n")
             sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} {var_string} {var_int}\n")
-            sys.exit(58)
+            raise InterpretError(58)
 
         # get the char
-        try:
-            char = var_string[int(var_int)]
-            char = re.sub(r"([\W\s])", lambda m: fr"\{ord(m.group(1)):03d}", str(char))
-        except IndexError:
-            sys.stderr.write(f"[interpret.py]: ERROR (58) - ExecuteInstruction - execute_getchar()\n")
-            sys.stderr.write(f"                NOTE - String index out of range\n")
-            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} {var_string} {var_int}\n")
-            sys.exit(58)
+        char = var_string[var_int]
 
         # update value
-        self.frame_data.symt_update_var(inst.arg1_text, "string", char)
+        self.frame_data.symt_update_var(inst.arg1, "string", char)
+
+        return pc + 1
 
     # execute_setchar():
     # - sets the char at the given index in the string to the given char
+    # - long string is copied into the buffer (StringBuffer), then the char is changed in place
     #
     # return error codes:
     # = 53 - Wrong variable type
     # = 58 - String index out of range
-    def execute_setchar(self, inst):
+    def execute_setchar(self, inst, pc):
 
         # get the variables
-        _, var_int, _, var_string = self.frame_data.symt_get_symb1_symb2(inst, "int_string", "different", "decoded")
+        _, var_int, _, var_string = self.frame_data.symt_get_symb1_symb2(inst, "int_string", "different")
+
+        # string buffer of the variable -> the char is changed in place (wrong index -> the error is reported)
+        buffer = self.frame_data.symt_gather_lazy(inst.arg1, "chars")
+        if buffer is not None and 0 <= var_int < len(buffer.chars) and var_string != "":
+            buffer.chars[var_int] = var_string[0]
+            return pc + 1
 
         # check the var and get the data
-        var_type, var_data = self.frame_data.symt_gather_var(inst.arg1_text)
+        var_type, var_data = self.frame_data.symt_gather_var(inst.arg1)
 
         # check the var type
         if var_type != "string":
             sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_setchar()\n")
             sys.stderr.write(f"                NOTE - Wrong variable type\n")
-            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} {inst.arg1_text} {var_int} {var_string}\n")
-            sys.exit(53)
+            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} {inst.arg1.text} {var_int} {var_string}\n")
+            raise InterpretError(53)
 
         # check var_string, var_data and var_int
-        if len(var_data) <= int(var_int) or int(var_int) < 0 or var_data == "" or var_string == "":
+        if len(var_data) <= var_int or var_int < 0 or var_data == "" or var_string == "":
             sys.stderr.write(f"[interpret.py]: ERROR (58) - ExecuteInstruction - execute_setchar()\n")
             sys.stderr.write(f"                NOTE - String index out of range\n")
-            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} {inst.arg1_text} {var_int} {var_string}\n")
-            sys.exit(58)
+            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} {inst.arg1.text} {var_int} {var_string}\n")
+            raise InterpretError(58)
+
+        # long string -> copied into the buffer, the char is changed in place
+        if len(var_data) >= StringBuffer.MIN_LENGTH:
+            buffer = StringBuffer(var_data)
+            buffer.chars[var_int] = var_string[0]
+            self.frame_data.symt_update_var(inst.arg1, "chars", buffer)
+            return pc + 1
 
         # modify the var data string
-        var_data = var_data[:int(var_int)] + var_string[0] + var_data[int(var_int)+1:]
-        var_data = re.sub(r"([\W\s])", lambda m: fr"\{ord(m.group(1)):03d}", str(var_data))
+        var_data = var_data[:var_int] + var_string[0] + var_data[var_int+1:]
 
         # update values
-        self.frame_data.symt_update_var(inst.arg1_text, "string", var_data)
+        self.frame_data.symt_update_var(inst.arg1, "string", var_data)
+
+        return pc + 1
 
 
     # - TYPES - #
@@ -1352,330 +3168,471 @@ class ExecuteInstruction:
     # - gets the type of the variable and updates the variable with the result type in string format
     #
     # return error codes:
-    # = 32 - Too many arguments -> expected - TYPE <var> <symb>
     # = 53 - Invalid variable type as second argument
-    def execute_type(self, inst):
-
-        # check if inst has only <label> argument
-        if inst.arg3_type != None or inst.arg3_text != None:
-            sys.stderr.write(f"[interpret.py]: ERROR (32) - ExecuteInstruction - execute_type()\n")
-            sys.stderr.write(f"                NOTE - Too many arguments, expected - TYPE <var> <symb>\n")
-            sys.exit(32)
+    def execute_type(self, inst, pc):
 
         # get variable data
-        if inst.arg2_type == "var":
-            var_type = self.frame_data.symt_gather_type(inst.arg2_text)   
+        if inst.arg2.kind == "var":
+            var_type = self.frame_data.symt_gather_type(inst.arg2)
         else:
-            var_type = inst.arg2_type
+            var_type = inst.arg2.type
 
         # none variable type
         if var_type is None:
-            self.frame_data.symt_update_var(inst.arg1_text, "string", "")
+            self.frame_data.symt_update_var(inst.arg1, "string", "")
 
         # right variable type
-        elif var_type == "int" or var_type == "bool" or var_type == "string" or var_type == "nil":
-            self.frame_data.symt_update_var(inst.arg1_text, "string", var_type)
+        elif var_type in ("int", "float", "bool", "string", "nil"):
+            self.frame_data.symt_update_var(inst.arg1, "string", var_type)
         
         # wrong variable type
         else:
             sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_type()\n")
             sys.stderr.write(f"                NOTE - Invalid type as second argument\n")
-            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} {inst.arg1_text} {inst.arg2_text}\n")
-            sys.exit(53)
+            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} {inst.arg1.text} {inst.arg2.text}\n")
+            raise InterpretError(53)
+
+        return pc + 1
 
 
     # - PROGRAM-FLOW - #
 
     # execute_label():
-    # - does nothing, just checks if the label is defined correctly
-    #
-    # return error codes:
-    # = 32 - Too many arguments -> expected - LABEL <label>
-    def execute_label(self, inst):
-
-        # check if inst has only <label> argument
-        if inst.arg2_type != None or inst.arg2_text != None or inst.arg3_type != None or inst.arg3_text != None:
-            sys.stderr.write(f"[interpret.py]: ERROR (32) - ExecuteInstruction - execute_label()\n")
-            sys.stderr.write(f"                NOTE - Too many arguments, expected - LABEL <label>\n")
-            sys.exit(32)
+    # - does nothing, the label is checked and saved while compiling
+    def execute_label(self, inst, pc):
+        return pc + 1
 
     # execute_jump():
     # - jumps to the given label
-    #
-    # return error codes:
-    # = 32 - Too many arguments -> expected - JUMP <label>
-    def execute_jump(self, inst, symt_jump):
+    def execute_jump(self, inst, pc):
         
-        # check if inst has only <label> argument
-        if inst.arg2_type != None or inst.arg2_text != None or inst.arg3_type != None or inst.arg3_text != None:
-            sys.stderr.write(f"[interpret.py]: ERROR (32) - ExecuteInstruction - execute_jump()\n")
-            sys.stderr.write(f"                NOTE - Too many arguments, expected - JUMP <label>\n")
-            sys.exit(32)
-
-        # return the opcode order
-        return symt_jump.get_label(inst.arg1_text)
-    
+        # return the pre-resolved label position
+        return inst.arg1.target
+
     # execute_jumpifeq():
     # - jumps to the given label if the two variables are equal
     #
     # return error codes:
     # = 53 - Invalid variable type as second argument
-    def execute_jumpifeq(self, inst, symt_jump):
+    def execute_jumpifeq(self, inst, pc):
 
         # get the variables
-        var_type_1, var_data_1, var_type_2, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "relational", "different", "decoded")
+        var_type_1, var_data_1, var_type_2, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "relational", "different")
 
-        # check if label exists
-        symt_jump.check_label(inst.arg1_text)
+        # get the pre-resolved label position
+        inst_order = inst.arg1.target
 
         # if var_data_1 or var_data_2 is nil
         if var_type_1 == "nil" or var_type_2 == "nil":
             
             # compare the nil variables
             if var_type_1 == var_type_2:
-                return symt_jump.get_label(inst.arg1_text)
+                return inst_order
             else:
-                return -1
+                return pc + 1
 
         # compare other types
         else:
-            # compare the int variables
-            if var_type_1 == "int" and var_type_2 == "int":
-                if int(var_data_1) == int(var_data_2):
-                    return symt_jump.get_label(inst.arg1_text)
+            # compare the int/float variables
+            if var_type_1 == var_type_2 and var_type_1 in ("int", "float"):
+                if var_data_1 == var_data_2:
+                    return inst_order
                 else:
-                    return -1
+                    return pc + 1
 
             # compare the string variables
             elif var_type_1 == "string" and var_type_2 == "string":
                 if var_data_1 == var_data_2:
-                    return symt_jump.get_label(inst.arg1_text)
+                    return inst_order
                 else:
-                    return -1
+                    return pc + 1
 
             # compare the bool variables
             elif var_type_1 == "bool" and var_type_2 == "bool":
                 if var_data_1 == var_data_2:
-                    return symt_jump.get_label(inst.arg1_text)
+                    return inst_order
                 else:
-                    return -1
+                    return pc + 1
             
             # wrong types
             else:
-                sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_jumpifneq()\n")
+                sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_jumpifeq()\n")
                 sys.stderr.write(f"                NOTE - Wrong variable types, expected two same types as second and third argument\n")
-                sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {inst.arg2_type} {inst.arg3_type}\n")
-                sys.exit(53)   
+                sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {inst.arg2.type} {inst.arg3.type}\n")
+                raise InterpretError(53)   
 
     # execute_jumpifneq():
     # - jumps to the given label if the two variables are not equal
     #
     # return error codes:
     # = 53 - Invalid variable type as second argument
-    def execute_jumpifneq(self, inst, symt_jump):
+    def execute_jumpifneq(self, inst, pc):
 
         # get the variables
-        var_type_1, var_data_1, var_type_2, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "relational", "different", "decoded")
+        var_type_1, var_data_1, var_type_2, var_data_2 = self.frame_data.symt_get_symb1_symb2(inst, "relational", "different")
 
-        # check if label exists
-        symt_jump.check_label(inst.arg1_text)
+        # get the pre-resolved label position
+        inst_order = inst.arg1.target
 
         # if var_data_1 or var_data_2 is nil
         if var_type_1 == "nil" or var_type_2 == "nil":
             
             # compare the nil variables
             if var_type_1 != var_type_2:
-                return symt_jump.get_label(inst.arg1_text)
+                return inst_order
             else:
-                return -1
+                return pc + 1
 
         # compare other types
         else:
-            # compare the int variables
-            if var_type_1 == "int" and var_type_2 == "int":
-                if int(var_data_1) != int(var_data_2):
-                    return symt_jump.get_label(inst.arg1_text)
+            # compare the int/float variables
+            if var_type_1 == var_type_2 and var_type_1 in ("int", "float"):
+                if var_data_1 != var_data_2:
+                    return inst_order
                 else:
-                    return -1
+                    return pc + 1
 
             # compare the string variables
             elif var_type_1 == "string" and var_type_2 == "string":
                 if var_data_1 != var_data_2:
-                    return symt_jump.get_label(inst.arg1_text)
+                    return inst_order
                 else:
-                    return -1
+                    return pc + 1
 
             # compare the bool variables
             elif var_type_1 == "bool" and var_type_2 == "bool":
                 if var_data_1 != var_data_2:
-                    return symt_jump.get_label(inst.arg1_text)
+                    return inst_order
                 else:
-                    return -1
+                    return pc + 1
             
             # wrong types
             else:
                 sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_jumpifneq()\n")
                 sys.stderr.write(f"                NOTE - Wrong variable types, expected two same types as second and third argument\n")
-                sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {inst.arg2_type} {inst.arg3_type}\n")
-                sys.exit(53)   
+                sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {inst.arg2.type} {inst.arg3.type}\n")
+                raise InterpretError(53)   
 
     # execute_exit():
     # - exits the program with the given exit code
     #
     # return error codes:
-    # = 32 - Too many arguments, expected - EXIT <symb>
     # = 57 - Wrong value of the exit code, expected - <0,49>
-    def execute_exit(self, inst):
-
-        # check if inst has only <symb> argument
-        if inst.arg2_type != None or inst.arg2_text != None or inst.arg3_type != None or inst.arg3_text != None:
-            sys.stderr.write(f"[interpret.py]: ERROR (32) - ExecuteInstruction - execute_exit()\n")
-            sys.stderr.write(f"                NOTE - Too many arguments, expected - EXIT <symb>\n")
-            sys.exit(32)
+    def execute_exit(self, inst, pc):
 
         # get the variables
-        _, var_data = self.frame_data.symt_get_symb(inst, "integer", "arg1", "decoded")
+        _, var_data = self.frame_data.symt_get_symb(inst.arg1, "integer")
 
         # check if the integer is in interval <0,49>
-        if int(var_data) < 0 or int(var_data) > 49:
+        if var_data < 0 or var_data > 49:
             sys.stderr.write(f"[interpret.py]: ERROR (57) - ExecuteInstruction - execute_exit()\n")
             sys.stderr.write(f"                NOTE - Wrong value of the exit code, return value has to be in <0,49>\n")
-            sys.stderr.write(f"                VAR  - <{inst.arg2_type}>, {inst.arg2_text}\n")
+            sys.stderr.write(f"                VAR  - <{inst.arg1.type}>, {inst.arg1.text}\n")
             sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} {var_data}\n")
-            sys.exit(57)
+            raise InterpretError(57)
 
         # exit the program
-        exit(int(var_data))
+        raise InterpretExit(var_data)
+
+
+    # - UNRESOLVED-LABELS - #
+    # - jumps/calls to the label which doesn't exist (bound by InstructionCompiler.bind_handlers)
+    # - operands are read first like by the original instruction, so the error codes are the same
+
+    # execute_unresolved_jump():
+    # - JUMP, CALL -> reports the label which doesn't exist
+    #
+    # return error codes:
+    # = 52 - Label doesn't exist
+    def execute_unresolved_jump(self, inst, pc):
+
+        # report the label
+        self.symt_jump.check_label(inst.arg1.value)
+
+        return pc + 1
+
+    # execute_unresolved_jumpif():
+    # - JUMPIFEQ, JUMPIFNEQ -> reads the operands and reports the label which doesn't exist
+    #
+    # return error codes:
+    # = 52 - Label doesn't exist
+    def execute_unresolved_jumpif(self, inst, pc):
+
+        # get the variables
+        self.frame_data.symt_get_symb1_symb2(inst, "relational", "different")
+
+        # report the label
+        self.symt_jump.check_label(inst.arg1.value)
+
+        return pc + 1
+
+    # execute_unresolved_jumpifs():
+    # - JUMPIFEQS, JUMPIFNEQS -> pops the operands and reports the label which doesn't exist
+    #
+    # return error codes:
+    # = 52 - Label doesn't exist
+    def execute_unresolved_jumpifs(self, inst, pc):
+
+        # get the variables
+        self.data_stack.pop()
+        self.data_stack.pop()
+
+        # report the label
+        self.symt_jump.check_label(inst.arg1.value)
+
+        return pc + 1
 
 
     # - DEBUGING - #
 
     # execute_dprint():
     # - prints the value of the given variable to the stderr
-    #
-    # return error codes:
-    # = 32 - Too many arguments, expected - DPRINT <symb>
-    def execute_dprint(self, inst):
-
-        # check if inst has only <symb> argument
-        if inst.arg2_type != None or inst.arg2_text != None or inst.arg3_type != None or inst.arg3_text != None:
-            sys.stderr.write(f"[interpret.py]: ERROR (32) - ExecuteInstruction - execute_dprint()\n")
-            sys.stderr.write(f"                NOTE - Too many arguments, expected - DPRINT <symb>\n")
-            sys.exit(32)
-        
+    def execute_dprint(self, inst, pc):
+
         # get variable data
-        _, var_data = self.frame_data.symt_get_symb(inst, "universal", "arg1", "decoded")
+        var_type, var_data = self.frame_data.symt_get_symb(inst.arg1, "universal")
 
-        # print variable data    
-        sys.stderr.write(var_data)
+        # print variable data (after the buffered output)
+        self.output.flush()
+        sys.stderr.write(self.inspect.format_value(var_type, var_data))
+
+        return pc + 1
 
     # execute_break():
     # - prints information about the current state of the program
-    #
-    # return error codes:
-    # = 32 - Too many arguments, expected - BREAK
-    def execute_break(self, inst):
+    def execute_break(self, inst, pc):
         
-        # check if inst has no arguments
-        if inst.arg1_type != None or inst.arg1_text != None or inst.arg2_type != None or inst.arg2_text != None or inst.arg3_type != None or inst.arg3_text != None:
-            sys.stderr.write(f"[interpret.py]: ERROR (32) - ExecuteInstruction - execute_break()\n")
-            sys.stderr.write(f"                NOTE - Too many arguments, expected - BREAK\n")
-            sys.exit(32)
-        
-        # print information about the current state of the program
+        # print information about the current state of the program (after the buffered output)
+        self.output.flush()
         sys.stderr.write(f"------------------ BREAK ------------------\n")
         sys.stderr.write(f"INST - [{inst.order}] {inst.opcode}\n")
+
+        return pc + 1
     
 
+    # - SUPERINSTRUCTIONS - #
+    # - inst is the superinstruction created by InstructionFusion, inst.fused are the original instructions
+    # - every method returns the position after the fused sequence (or the jump target)
+
+    # fused_stack_operands():
+    # - reads symb1 and symb2 of PUSHS, PUSHS and checks their types like ADDS/SUBS/MULS/IDIVS
+    # - types are the allowed types -> (int, float) for ADDS/SUBS/MULS, (int) for IDIVS
+    # - returns the type and the values of symb1 and symb2
+    #
+    # return error codes:
+    # = 53 - Wrong variable types, expected two same types
+    def __fused_stack_operands(self, inst, types):
+
+        # get the variables in the order of the PUSHS instructions
+        var_type_1, var_data_1 = self.frame_data.symt_get_symb(inst.arg2, "universal")
+        var_type_2, var_data_2 = self.frame_data.symt_get_symb(inst.arg3, "universal")
+
+        # check if the variables have the same allowed type
+        if var_type_1 != var_type_2 or var_type_1 not in types:
+            sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - fused_stack_operands()\n")
+            sys.stderr.write(f"                NOTE - Wrong variable types, expected two same types as second and third argument\n")
+            sys.stderr.write(f"                INST - [{inst.fused[2].order}] {inst.fused[2].opcode} - {var_type_1} {var_type_2}\n")
+            raise InterpretError(53)
+
+        return var_type_1, var_data_1, var_data_2
+
+    # execute_fused_adds():
+    # - PUSHS symb1, PUSHS symb2, ADDS, POPS var -> var = symb1 + symb2
+    def execute_fused_adds(self, inst, pc):
+        var_type, var_data_1, var_data_2 = self.__fused_stack_operands(inst, ("int", "float"))
+        self.frame_data.symt_update_var(inst.arg1, var_type, var_data_1 + var_data_2)
+        return pc + 4
+
+    # execute_fused_subs():
+    # - PUSHS symb1, PUSHS symb2, SUBS, POPS var -> var = symb1 - symb2
+    def execute_fused_subs(self, inst, pc):
+        var_type, var_data_1, var_data_2 = self.__fused_stack_operands(inst, ("int", "float"))
+        self.frame_data.symt_update_var(inst.arg1, var_type, var_data_1 - var_data_2)
+        return pc + 4
+
+    # execute_fused_muls():
+    # - PUSHS symb1, PUSHS symb2, MULS, POPS var -> var = symb1 * symb2
+    def execute_fused_muls(self, inst, pc):
+        var_type, var_data_1, var_data_2 = self.__fused_stack_operands(inst, ("int", "float"))
+        self.frame_data.symt_update_var(inst.arg1, var_type, var_data_1 * var_data_2)
+        return pc + 4
+
+    # execute_fused_idivs():
+    # - PUSHS symb1, PUSHS symb2, IDIVS, POPS var -> var = symb1 // symb2
+    #
+    # return error codes:
+    # = 57 - Illegal division by zero
+    def execute_fused_idivs(self, inst, pc):
+        _, var_data_1, var_data_2 = self.__fused_stack_operands(inst, ("int",))
+
+        # catch division by zero
+        if var_data_2 == 0:
+            sys.stderr.write(f"[interpret.py]: ERROR (57) - ExecuteInstruction - execute_fused_idivs()\n")
+            sys.stderr.write(f"                NOTE - Illegal division by zero\n")
+            sys.stderr.write(f"                INST - [{inst.fused[2].order}] {inst.fused[2].opcode} - {var_data_1} int\n")
+            raise InterpretError(57)
+
+        self.frame_data.symt_update_var(inst.arg1, "int", var_data_1 // var_data_2)
+        return pc + 4
+
+    # execute_fused_compare_jump():
+    # - LT/GT/EQ var symb1 symb2, JUMPIFEQ/JUMPIFNEQ label var bool -> the compare instruction is executed by its handler
+    # - jumps to the label if the result is the jump value (inst.arg3)
+    def execute_fused_compare_jump(self, inst, pc):
+
+        # compare the symbols -> saves the result into the var
+        compare = inst.fused[0]
+        compare.handler(compare, pc)
+
+        # jump by the result
+        _, var_data = self.frame_data.symt_gather_var(inst.arg2)
+        if var_data == inst.arg3.value:
+            return inst.arg1.target
+        return pc + 2
+
+    # execute_fused_defvar_move():
+    # - DEFVAR var1, MOVE var2 symb
+    def execute_fused_defvar_move(self, inst, pc):
+
+        # define the variable
+        self.frame_data.symt_insert_var(inst.arg1)
+
+        # move the value of the symb into the variable
+        var_type, var_data = self.frame_data.symt_get_symb(inst.arg3, "universal")
+        self.frame_data.symt_update_var(inst.arg2, var_type, var_data)
+
+        return pc + 2
+
+    # execute_fused_createframe_pushframe():
+    # - CREATEFRAME, PUSHFRAME -> the new frame is pushed onto the frame-stack
+    def execute_fused_createframe_pushframe(self, inst, pc):
+        self.frame_data.frame_stack_create()
+        self.frame_data.frame_stack_push()
+        return pc + 2
+
+    # execute_fused_type_switch():
+    # - TYPE var symb, JUMPIFEQ/JUMPIFNEQ label var string, ... -> the type name is saved into the var (like TYPE)
+    # - jumps by the switch (inst.arg3) to the target of the type name, other types continue after the fused jumps
+    def execute_fused_type_switch(self, inst, pc):
+
+        # get the type name
+        if inst.arg2.kind == "var":
+            var_type = self.frame_data.symt_gather_type(inst.arg2)
+            if var_type is None:
+                var_type = ""
+        else:
+            var_type = inst.arg2.type
+
+        # wrong type -> reported by TYPE
+        if var_type not in ("int", "float", "bool", "string", "nil", ""):
+            type_inst = inst.fused[0]
+            return type_inst.handler(type_inst, pc)
+
+        # save the type and jump
+        self.frame_data.symt_update_var(inst.arg1, "string", var_type)
+        return inst.arg3.value.get(var_type, pc + len(inst.fused))
+
+
     # - STACK EXTENSION - #
 
     # clears():
     # - clears the stack
-    #
-    # return error codes:
-    # = 32 - Too many arguments, expected - CLEAR
-    def execute_clears(self, inst):
+    def execute_clears(self, inst, pc):
             
-            # check if inst has no arguments
-            if inst.arg1_type != None or inst.arg1_text != None or inst.arg2_type != None or inst.arg2_text != None or inst.arg3_type != None or inst.arg3_text != None:
-                sys.stderr.write(f"[interpret.py]: ERROR (32) - ExecuteInstruction - execute_clears()\n")
-                sys.stderr.write(f"                NOTE - Too many arguments, expected - CLEAR\n")
-                sys.exit(32)
-    
             # clear the stack
             self.data_stack.clear()
 
+            return pc + 1
+
     # adds():
-    # - takes two variables from the stack and adds them together then pushes the result back to the stack
+    # - takes two variables (int, float) from the stack and adds them together then pushes the result back to the stack
     #
     # return error codes:
     # = 53 - Wrong variable types, expected two same types as second and third argument
-    def execute_adds(self, inst):
+    def execute_adds(self, inst, pc):
 
-        # get the variables
+        # int/float items are added in place
+        if self.data_stack.apply_number(operator.add, STACK_NUMBERS):
+            return pc + 1
+
+        # get the variables (wrong types or empty stack -> the error is reported)
         var_data_2, var_type_2 = self.data_stack.pop() 
         var_data_1, var_type_1 = self.data_stack.pop()  
 
-        # check if the variables are integers
-        if var_type_1 != "int" or var_type_2 != "int":
+        # check if the variables are integers or floats
+        if var_type_1 != var_type_2 or var_type_1 not in ("int", "float"):
             sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_adds()\n")
             sys.stderr.write(f"                NOTE - Wrong variable types, expected two same types as second and third argument\n")
             sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {var_type_1} {var_type_2}\n")
-            sys.exit(53)
+            raise InterpretError(53)
 
         # add the variables
-        var_adds = int(var_data_1) + int(var_data_2)
+        var_adds = var_data_1 + var_data_2
 
         # save the result to the stack
-        self.data_stack.push(str(var_adds), "int")
+        self.data_stack.push(var_adds, var_type_1)
+
+        return pc + 1
 
     # execute_subs():
-    # - takes two variables from the stack and subs them together then pushes the result back to the stack
+    # - takes two variables (int, float) from the stack and subs them together then pushes the result back to the stack
     #
     # return error codes:
     # = 53 - Wrong variable types, expected two same types as second and third argument
-    def execute_subs(self, inst):
+    def execute_subs(self, inst, pc):
 
-        # get the variables
+        # int/float items are subtracted in place
+        if self.data_stack.apply_number(operator.sub, STACK_NUMBERS):
+            return pc + 1
+
+        # get the variables (wrong types or empty stack -> the error is reported)
         var_data_2, var_type_2 = self.data_stack.pop() 
         var_data_1, var_type_1 = self.data_stack.pop()
 
-        # check if the variables are integers
-        if var_type_1 != "int" or var_type_2 != "int":
+        # check if the variables are integers or floats
+        if var_type_1 != var_type_2 or var_type_1 not in ("int", "float"):
             sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_subs()\n")
             sys.stderr.write(f"                NOTE - Wrong variable types, expected two same types as second and third argument\n")
             sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {var_type_1} {var_type_2}\n")
-            sys.exit(53)
+            raise InterpretError(53)
 
         # add the variables
-        var_subs = int(var_data_1) - int(var_data_2)
+        var_subs = var_data_1 - var_data_2
 
         # update the variable
-        self.data_stack.push(str(var_subs), "int")
+        self.data_stack.push(var_subs, var_type_1)
+
+        return pc + 1
 
     # execute_muls():
-    # takes two variables from the stack and muls them together then pushes the result back to the stack
+    # takes two variables (int, float) from the stack and muls them together then pushes the result back to the stack
     #
     # return error codes:
     # = 53 - Wrong variable types, expected two same types as second and third argument
-    def execute_muls(self, inst):
+    def execute_muls(self, inst, pc):
 
-        # get the variables
+        # int/float items are multiplied in place
+        if self.data_stack.apply_number(operator.mul, STACK_NUMBERS):
+            return pc + 1
+
+        # get the variables (wrong types or empty stack -> the error is reported)
         var_data_2, var_type_2 = self.data_stack.pop()
         var_data_1, var_type_1 = self.data_stack.pop()
 
-        # check if the variables are integers
-        if var_type_1 != "int" or var_type_2 != "int":
+        # check if the variables are integers or floats
+        if var_type_1 != var_type_2 or var_type_1 not in ("int", "float"):
             sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_muls()\n")
             sys.stderr.write(f"                NOTE - Wrong variable types, expected two same types as second and third argument\n")
             sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {var_type_1} {var_type_2}\n")
-            sys.exit(53)
+            raise InterpretError(53)
 
         # add the variables
-        var_muls = int(var_data_1) * int(var_data_2)
+        var_muls = var_data_1 * var_data_2
 
         # update the variable
-        self.data_stack.push(str(var_muls), "int")
+        self.data_stack.push(var_muls, var_type_1)
+
+        return pc + 1
 
     # execute_idivs():
     # takes two variables from the stack and idivs them together then pushes the result back to the stack
@@ -1683,9 +3640,13 @@ class ExecuteInstruction:
     # return error codes:
     # = 53 - Wrong variable types, expected two same types as second and third argument
     # = 57 - Illegal division by zero
-    def execute_idivs(self, inst):
+    def execute_idivs(self, inst, pc):
 
-        # get the variables
+        # int items are divided in place (not by zero)
+        if self.data_stack.apply_number(operator.floordiv, (STACK_INT,), True):
+            return pc + 1
+
+        # get the variables (wrong types or empty stack -> the error is reported)
         var_data_2, var_type_2 = self.data_stack.pop()
         var_data_1, var_type_1 = self.data_stack.pop()
 
@@ -1694,106 +3655,124 @@ class ExecuteInstruction:
             sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_idivs()\n")
             sys.stderr.write(f"                NOTE - Wrong variable types, expected two same types as second and third argument\n")
             sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {var_type_1} {var_type_2}\n")
-            sys.exit(53)
+            raise InterpretError(53)
 
         # catch division by zero
-        if var_data_2 == "0":
+        if var_data_2 == 0:
             sys.stderr.write(f"[interpret.py]: ERROR (57) - ExecuteInstruction - execute_idivs()\n")
             sys.stderr.write(f"                NOTE - Illegal division by zero\n")
             sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {var_data_1} {var_type_2}\n")
-            sys.exit(57)
+            raise InterpretError(57)
 
         else:
             # add the variables
-            var_idivs = int(var_data_1) // int(var_data_2)
+            var_idivs = var_data_1 // var_data_2
             
             # update the variable
-            self.data_stack.push(str(var_idivs), "int")
+            self.data_stack.push(var_idivs, "int")
+
+        return pc + 1
 
     # execute_lts():
     # - takes two variables from the stack and compares with operator (lesser than), var result = (bool) -> goes to stack
     #
     # return error codes:
     # = 53 - Invalid operand type -> expected - symb1 and symb2 to be the same type
-    def execute_lts(self, inst):
+    def execute_lts(self, inst, pc):
         
-        # get the variables
+        # items of the same type are compared in place
+        if self.data_stack.apply_compare(operator.lt):
+            return pc + 1
+
+        # get the variables (wrong types or empty stack -> the error is reported)
         var_data_2, var_type_2 = self.data_stack.pop()
         var_data_1, var_type_1 = self.data_stack.pop()
 
-        # compare the int variables
-        if var_type_1 == "int" and var_type_2 == "int":
-            if int(var_data_1) < int(var_data_2):
-                self.data_stack.push("true", "bool")
+        # compare the int/float variables
+        if var_type_1 == var_type_2 and var_type_1 in ("int", "float"):
+            if var_data_1 < var_data_2:
+                self.data_stack.push(True, "bool")
             else:
-                self.data_stack.push("false", "bool")
+                self.data_stack.push(False, "bool")
 
         # compare the string variables
         elif var_type_1 == "string" and var_type_2 == "string":
             if var_data_1 < var_data_2:
-                self.data_stack.push("true", "bool")
+                self.data_stack.push(True, "bool")
             else:
-                self.data_stack.push("false", "bool")
+                self.data_stack.push(False, "bool")
 
         # compare the bool variables
         elif var_type_1 == "bool" and var_type_2 == "bool":
-            if var_data_1 == "false" and var_data_2 == "true":
-                self.data_stack.push("true", "bool")
+            if not var_data_1 and var_data_2:
+                self.data_stack.push(True, "bool")
             else:
-                self.data_stack.push("false", "bool")
+                self.data_stack.push(False, "bool")
         else:
             sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_lts()\n")
-            sys.stderr.write(f"                NOTE - Wrong variable types, expected <int, bool, string>\n")
+            sys.stderr.write(f"                NOTE - Wrong variable types, expected <int, float, bool, string>\n")
             sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {var_type_1} {var_type_2}\n")
-            sys.exit(53)   
+            raise InterpretError(53)   
+
+        return pc + 1
 
     # execute_gts():
     # - takes two variables from the stack and compares with operator (greater than), var result = (bool) -> goes to stack
     #
     # return error codes:
     # = 53 - Invalid operand type -> expected - symb1 and symb2 to be the same type
-    def execute_gts(self, inst):
+    def execute_gts(self, inst, pc):
     
-        # get the variables
+        # items of the same type are compared in place
+        if self.data_stack.apply_compare(operator.gt):
+            return pc + 1
+
+        # get the variables (wrong types or empty stack -> the error is reported)
         var_data_2, var_type_2 = self.data_stack.pop()
         var_data_1, var_type_1 = self.data_stack.pop()
 
-        # compare the int variables
-        if var_type_1 == "int" and var_type_2 == "int":
-            if int(var_data_1) > int(var_data_2):
-                self.data_stack.push("true", "bool")
+        # compare the int/float variables
+        if var_type_1 == var_type_2 and var_type_1 in ("int", "float"):
+            if var_data_1 > var_data_2:
+                self.data_stack.push(True, "bool")
             else:
-                self.data_stack.push("false", "bool")
+                self.data_stack.push(False, "bool")
 
         # compare the string variables
         elif var_type_1 == "string" and var_type_2 == "string":
             if var_data_1 > var_data_2:
-                self.data_stack.push("true", "bool")
+                self.data_stack.push(True, "bool")
             else:
-                self.data_stack.push("false", "bool")
+                self.data_stack.push(False, "bool")
 
         # compare the bool variables
         elif var_type_1 == "bool" and var_type_2 == "bool":
-            if var_data_1 == "true" and var_data_2 == "false":
-                self.data_stack.push("true", "bool")
+            if var_data_1 and not var_data_2:
+                self.data_stack.push(True, "bool")
             else:
-                self.data_stack.push("false", "bool")
+                self.data_stack.push(False, "bool")
         
         # compare the nil variables
         else:
             sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_gts()\n")
-            sys.stderr.write(f"                NOTE - Wrong variable types, expected <int, bool, string>\n")
+            sys.stderr.write(f"                NOTE - Wrong variable types, expected <int, float, bool, string>\n")
             sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {var_type_1} {var_type_2}\n")
-            sys.exit(53)   
+            raise InterpretError(53)   
+
+        return pc + 1
 
     # execute_eqs():
     # - takes two variables from the stack and compares with operator (eaqual), var result = (bool) -> goes to stack
     #
     # return error codes:
     # = 53 - Invalid operand type -> expected - symb1 and symb2 to be the same type
-    def execute_eqs(self, inst):
+    def execute_eqs(self, inst, pc):
         
-        # get the variables
+        # items are compared in place
+        if self.data_stack.equal(False) is not None:
+            return pc + 1
+
+        # get the variables (wrong types or empty stack -> the error is reported)
         var_data_2, var_type_2 = self.data_stack.pop()
         var_data_1, var_type_1 = self.data_stack.pop()
 
@@ -1802,49 +3781,55 @@ class ExecuteInstruction:
 
             # compare the nil variables
             if var_type_1 == var_type_2:
-                self.data_stack.push("true", "bool")
+                self.data_stack.push(True, "bool")
             else:
-                self.data_stack.push("false", "bool")
+                self.data_stack.push(False, "bool")
 
         # compare other types
         else:
 
-            # compare the int variables
-            if var_type_1 == "int" and var_type_2 == "int":
-                if int(var_data_1) == int(var_data_2):
-                    self.data_stack.push("true", "bool")
+            # compare the int/float variables
+            if var_type_1 == var_type_2 and var_type_1 in ("int", "float"):
+                if var_data_1 == var_data_2:
+                    self.data_stack.push(True, "bool")
                 else:
-                    self.data_stack.push("false", "bool")
+                    self.data_stack.push(False, "bool")
 
             # compare the string variables
             elif var_type_1 == "string" and var_type_2 == "string":
                 if var_data_1 == var_data_2:
-                    self.data_stack.push("true", "bool")
+                    self.data_stack.push(True, "bool")
                 else:
-                    self.data_stack.push("false", "bool")
+                    self.data_stack.push(False, "bool")
 
             # compare the bool variables
             elif var_type_1 == "bool" and var_type_2 == "bool":
                 if var_data_1 == var_data_2:
-                    self.data_stack.push("true", "bool")
+                    self.data_stack.push(True, "bool")
                 else:
-                    self.data_stack.push("false", "bool")
+                    self.data_stack.push(False, "bool")
             
             # wrong types
             else:
                 sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_eqs()\n")
                 sys.stderr.write(f"                NOTE - Wrong variable types, expected same data types or nil\n")
                 sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {var_type_1} {var_type_2}\n")
-                sys.exit(53)                
+                raise InterpretError(53)                
+
+        return pc + 1
 
     # execute_ands():
     # - takes two variables from the stack and appliest operator (and) on them, var result = (bool) -> goes to stack
     #
     # return error codes:
     # = 53 - Wrong variable types, expected both to be <bool>
-    def execute_ands(self, inst):
+    def execute_ands(self, inst, pc):
         
-        # get the variables
+        # bool items are compared in place
+        if self.data_stack.apply_bool(operator.and_):
+            return pc + 1
+
+        # get the variables (wrong types or empty stack -> the error is reported)
         var_data_2, var_type_2 = self.data_stack.pop()
         var_data_1, var_type_1 = self.data_stack.pop()
 
@@ -1853,22 +3838,28 @@ class ExecuteInstruction:
             sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_ands()\n")
             sys.stderr.write(f"                NOTE - Wrong variable types, expected both to be <bool>\n")
             sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {var_type_1} {var_type_2}\n")
-            sys.exit(53)
+            raise InterpretError(53)
 
         # compare the bool variables
-        if var_data_1 == "true" and var_data_2 == "true":
-            self.data_stack.push("true", "bool")
+        if var_data_1 and var_data_2:
+            self.data_stack.push(True, "bool")
         else:
-            self.data_stack.push("false", "bool")
+            self.data_stack.push(False, "bool")
+
+        return pc + 1
 
     # execute_or():
     # - takes two variables from the stack and appliest operator (and) on them, var result = (bool) -> goes to stack
     #
     # return error codes:
     # = 53 - Wrong variable types, expected both to be <bool>
-    def execute_ors(self, inst):
+    def execute_ors(self, inst, pc):
 
-        # get the variables
+        # bool items are compared in place
+        if self.data_stack.apply_bool(operator.or_):
+            return pc + 1
+
+        # get the variables (wrong types or empty stack -> the error is reported)
         var_data_2, var_type_2 = self.data_stack.pop()
         var_data_1, var_type_1 = self.data_stack.pop()
 
@@ -1877,34 +3868,41 @@ class ExecuteInstruction:
             sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_ors()\n")
             sys.stderr.write(f"                NOTE - Wrong variable types, expected both to be <bool>\n")
             sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {var_type_1} {var_type_2}\n")
-            sys.exit(53)
+            raise InterpretError(53)
 
         # compare the bool variables
-        if var_data_1 == "false" and var_data_2 == "false":
-            self.data_stack.push("false", "bool")
+        if not var_data_1 and not var_data_2:
+            self.data_stack.push(False, "bool")
         else:
-            self.data_stack.push("true", "bool")
+            self.data_stack.push(True, "bool")
+
+        return pc + 1
 
     # execute_not():
     # - take bool variable from the stack and negates them, result (bool) -> goes to stack
-    def execute_nots(self, inst):
+    def execute_nots(self, inst, pc):
         
-        # get the variable
+        # bool item is negated in place
+        if self.data_stack.apply_not():
+            return pc + 1
+
+        # get the variable (wrong types or empty stack -> the error is reported)
         var_data, var_type = self.data_stack.pop()
 
-        # check the variable types
         # check the variable types
         if var_type != "bool":
             sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_nots()\n")
             sys.stderr.write(f"                NOTE - Wrong variable types, expected <bool>\n")
             sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {var_type}\n")
-            sys.exit(53)
+            raise InterpretError(53)
 
         # compare the bool variables
-        if var_data == "true":
-            self.data_stack.push("false", "bool")
+        if var_data:
+            self.data_stack.push(False, "bool")
         else:
-            self.data_stack.push("true", "bool")
+            self.data_stack.push(True, "bool")
+
+        return pc + 1
 
     # execute_int2chars():
     # - converts the int from stack to char wchich is then pushed back to stack
@@ -1912,7 +3910,7 @@ class ExecuteInstruction:
     # return error codes:
     # = 53 - Wrong variable types, expected <int>
     # = 58 - Invalid operand value -> expected - int can't be converted to char
-    def execute_int2chars(self, inst):
+    def execute_int2chars(self, inst, pc):
 
         # get the variable
         var_data, var_type = self.data_stack.pop()
@@ -1922,40 +3920,41 @@ class ExecuteInstruction:
             sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_int2chars()\n")
             sys.stderr.write(f"                NOTE - Wrong variable types, expected <int>\n")
             sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {var_type}\n")
-            sys.exit(53)
+            raise InterpretError(53)
 
         # convert the int to char
         try:
-            char = chr(int(var_data))
-            char = re.sub(r"([\W\s])", lambda m: fr"\{ord(m.group(1)):03d}", str(char))
-        except ValueError:
+            char = chr(var_data)
+        except (ValueError, OverflowError):
             sys.stderr.write(f"[interpret.py]: ERROR (58) - ExecuteInstruction - execute_int2chars()\n")
             sys.stderr.write(f"                NOTE - Int can't be converted into chat\n")
-            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} {inst.arg2_text}\n")
-            sys.exit(58)
+            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} {var_data}\n")
+            raise InterpretError(58)
 
         # update value
         self.data_stack.push(char, "string")
 
+        return pc + 1
+
     # execute_stri2ints():
     # - converts the string from stack to int and the result pushes back
     #
     # return error codes:
     # = 53 - Wrong variable types, expected <string> and <int>
     # = 58 - String index out of range
-    def execute_stri2ints(self, inst):
+    def execute_stri2ints(self, inst, pc):
 
         # get the variables
         var_data_2, var_type_2 = self.data_stack.pop()
         var_data_1, var_type_1 = self.data_stack.pop()
-        char_pos = int(var_data_2)
 
         # check the variable types - string and int
         if var_type_1 != "string" or var_type_2 != "int":
             sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_stri2ints()\n")
             sys.stderr.write(f"                NOTE - Wrong variable types, expected <string> and <int>\n")
             sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {var_type_1} {var_type_2}\n")
-            sys.exit(53)
+            raise InterpretError(53)
+        char_pos = var_data_2
 
         # check the string index with char_pos position
         if char_pos < len(var_data_1) and char_pos > -1:
@@ -1963,117 +3962,212 @@ class ExecuteInstruction:
         else:
             sys.stderr.write(f"[interpret.py]: ERROR (58) - ExecuteInstruction - execute_stri2ints()\n")
             sys.stderr.write(f"                NOTE - String index out of range\n")
-            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} {inst.arg2_text}\n")
-            sys.exit(58)
+            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} {char_pos}\n")
+            raise InterpretError(58)
 
         # update value
-        self.data_stack.push(str(ord(char)), "int")
+        self.data_stack.push(ord(char), "int")
+
+        return pc + 1
+
+    # execute_divs():
+    # - takes two float variables from the stack and divides them then pushes the result back to the stack
+    #
+    # return error codes:
+    # = 53 - Wrong variable types, expected two float
+    # = 57 - Illegal division by zero
+    def execute_divs(self, inst, pc):
+
+        # float items are divided in place (not by zero)
+        if self.data_stack.apply_number(operator.truediv, (STACK_FLOAT,), True):
+            return pc + 1
+
+        # get the variables (wrong types or empty stack -> the error is reported)
+        var_data_2, var_type_2 = self.data_stack.pop()
+        var_data_1, var_type_1 = self.data_stack.pop()
+
+        # check if the variables are floats
+        if var_type_1 != "float" or var_type_2 != "float":
+            sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_divs()\n")
+            sys.stderr.write(f"                NOTE - Wrong variable types, expected two float\n")
+            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {var_type_1} {var_type_2}\n")
+            raise InterpretError(53)
+
+        # catch division by zero
+        sys.stderr.write(f"[interpret.py]: ERROR (57) - ExecuteInstruction - execute_divs()\n")
+        sys.stderr.write(f"                NOTE - Illegal division by zero\n")
+        sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {var_data_1} {var_type_2}\n")
+        raise InterpretError(57)
+
+    # execute_int2floats():
+    # - converts the int from stack to float which is then pushed back to stack
+    #
+    # return error codes:
+    # = 53 - Wrong variable types, expected <int>
+    # = 57 - Invalid operand value -> int is too big for float
+    def execute_int2floats(self, inst, pc):
+
+        # int item is converted in place
+        if self.data_stack.apply_convert(float, STACK_INT, STACK_FLOAT):
+            return pc + 1
+
+        # get the variable (wrong type, too big int or empty stack -> the error is reported)
+        var_data, var_type = self.data_stack.pop()
+
+        # check the variable types - int
+        if var_type != "int":
+            sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_int2floats()\n")
+            sys.stderr.write(f"                NOTE - Wrong variable types, expected <int>\n")
+            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {var_type}\n")
+            raise InterpretError(53)
+
+        sys.stderr.write(f"[interpret.py]: ERROR (57) - ExecuteInstruction - execute_int2floats()\n")
+        sys.stderr.write(f"                NOTE - Int can't be converted into float\n")
+        sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} {var_data}\n")
+        raise InterpretError(57)
+
+    # execute_float2ints():
+    # - converts the float from stack to int (truncated) which is then pushed back to stack
+    #
+    # return error codes:
+    # = 53 - Wrong variable types, expected <float>
+    # = 57 - Invalid operand value -> inf or nan can't be converted to int
+    def execute_float2ints(self, inst, pc):
+
+        # float item is converted in place
+        if self.data_stack.apply_convert(int, STACK_FLOAT, STACK_INT):
+            return pc + 1
+
+        # get the variable (wrong type, inf/nan or empty stack -> the error is reported)
+        var_data, var_type = self.data_stack.pop()
+
+        # check the variable types - float
+        if var_type != "float":
+            sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_float2ints()\n")
+            sys.stderr.write(f"                NOTE - Wrong variable types, expected <float>\n")
+            sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {var_type}\n")
+            raise InterpretError(53)
+
+        sys.stderr.write(f"[interpret.py]: ERROR (57) - ExecuteInstruction - execute_float2ints()\n")
+        sys.stderr.write(f"                NOTE - Float can't be converted into int\n")
+        sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} {var_data}\n")
+        raise InterpretError(57)
 
     # execute_jumpifeqs():
     # - jumps to the given label if the two variables are equal
     #
     # return error codes:
-    # = 53 - Wrong variable types, expected same types <int, bool, string>
-    def execute_jumpifeqs(self, inst, symt_jump):
+    # = 53 - Wrong variable types, expected same types <int, float, bool, string>
+    def execute_jumpifeqs(self, inst, pc):
 
-        # get the variables
+        # items are compared and popped
+        equal = self.data_stack.equal(True)
+        if equal is not None:
+            return inst.arg1.target if equal else pc + 1
+
+        # get the variables (wrong types or empty stack -> the error is reported)
         var_data_2, var_type_2 = self.data_stack.pop()
         var_data_1, var_type_1 = self.data_stack.pop()
 
-        # check if label exists
-        symt_jump.check_label(inst.arg1_text)
+        # get the pre-resolved label position
+        inst_order = inst.arg1.target
 
         # if var_data_1 or var_data_2 is nil
         if var_type_1 == "nil" or var_type_2 == "nil":
             
             # compare the nil variables
             if var_type_1 == var_type_2:
-                return symt_jump.get_label(inst.arg1_text)
+                return inst_order
             else:
-                return -1
+                return pc + 1
 
         # compare other types
         else:
-            # compare the int variables
-            if var_type_1 == "int" and var_type_2 == "int":
-                if int(var_data_1) == int(var_data_2):
-                    return symt_jump.get_label(inst.arg1_text)
+            # compare the int/float variables
+            if var_type_1 == var_type_2 and var_type_1 in ("int", "float"):
+                if var_data_1 == var_data_2:
+                    return inst_order
                 else:
-                    return -1
+                    return pc + 1
 
             # compare the string variables
             elif var_type_1 == "string" and var_type_2 == "string":
                 if var_data_1 == var_data_2:
-                    return symt_jump.get_label(inst.arg1_text)
+                    return inst_order
                 else:
-                    return -1
+                    return pc + 1
 
             # compare the bool variables
             elif var_type_1 == "bool" and var_type_2 == "bool":
                 if var_data_1 == var_data_2:
-                    return symt_jump.get_label(inst.arg1_text)
+                    return inst_order
                 else:
-                    return -1
+                    return pc + 1
             
             # wrong types
             else:
-                sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_jumpifneqs()\n")
-                sys.stderr.write(f"                NOTE - Wrong variable types, expected same types <int, bool, string>\n")
+                sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_jumpifeqs()\n")
+                sys.stderr.write(f"                NOTE - Wrong variable types, expected same types <int, float, bool, string>\n")
                 sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {var_data_1} {var_data_2}\n")
-                sys.exit(53)   
+                raise InterpretError(53)   
 
     # execute_jumpifneqs():
     # - jumps to the given label if the two variables are not equal
     #
     # return error codes:
-    # = 53 - Wrong variable types, expected same types <int, bool, string>
-    def execute_jumpifneqs(self, inst, symt_jump):
+    # = 53 - Wrong variable types, expected same types <int, float, bool, string>
+    def execute_jumpifneqs(self, inst, pc):
 
-        # get the variables
+        # items are compared and popped
+        equal = self.data_stack.equal(True)
+        if equal is not None:
+            return pc + 1 if equal else inst.arg1.target
+
+        # get the variables (wrong types or empty stack -> the error is reported)
         var_data_2, var_type_2 = self.data_stack.pop()
         var_data_1, var_type_1 = self.data_stack.pop()
 
-        # check if label exists
-        symt_jump.check_label(inst.arg1_text)
+        # get the pre-resolved label position
+        inst_order = inst.arg1.target
 
         # if var_data_1 or var_data_2 is nil
         if var_type_1 == "nil" or var_type_2 == "nil":
             
             # compare the nil variables
             if var_type_1 != var_type_2:
-                return symt_jump.get_label(inst.arg1_text)
+                return inst_order
             else:
-                return -1
+                return pc + 1
 
         # compare other types
         else:
-            # compare the int variables
-            if var_type_1 == "int" and var_type_2 == "int":
-                if int(var_data_1) != int(var_data_2):
-                    return symt_jump.get_label(inst.arg1_text)
+            # compare the int/float variables
+            if var_type_1 == var_type_2 and var_type_1 in ("int", "float"):
+                if var_data_1 != var_data_2:
+                    return inst_order
                 else:
-                    return -1
+                    return pc + 1
 
             # compare the string variables
             elif var_type_1 == "string" and var_type_2 == "string":
                 if var_data_1 != var_data_2:
-                    return symt_jump.get_label(inst.arg1_text)
+                    return inst_order
                 else:
-                    return -1
+                    return pc + 1
 
             # compare the bool variables
             elif var_type_1 == "bool" and var_type_2 == "bool":
                 if var_data_1 != var_data_2:
-                    return symt_jump.get_label(inst.arg1_text)
+                    return inst_order
                 else:
-                    return -1
+                    return pc + 1
             
             # wrong types
             else:
                 sys.stderr.write(f"[interpret.py]: ERROR (53) - ExecuteInstruction - execute_jumpifneqs()\n")
-                sys.stderr.write(f"                NOTE - Wrong variable types, expected same types <int, bool, string>\n")
+                sys.stderr.write(f"                NOTE - Wrong variable types, expected same types <int, float, bool, string>\n")
                 sys.stderr.write(f"                INST - [{inst.order}] {inst.opcode} - {var_data_1} {var_data_2}\n")
-                sys.exit(53)   
+                raise InterpretError(53)   
 
 
 
@@ -2092,20 +4186,34 @@ class FrameStackProtocol:
 
     def __init__(self):
         self.frame_stack = FrameStack()     # frame-stack
-        self.symt_gf = SymbolTableData()    # global frame
+        self.symt_gf = SymbolTableData([])  # global frame
         self.symt_tf = None                 # temporary frame
         self.symt_lf = None                 # local frame
+        self.frame_names = []               # names of the LF/TF slots
+        self.frame_class = SymbolTableData  # storage of the LF/TF frames (list or dict)
         self.inspect = VariableAnalysis()   # variable analysis class
 
 
     # - FRAME-STACK - #
 
+    # frame_layout():
+    # - creates the global frame and sets up the LF/TF frames by the slots of the compiled program
+    # - gf_names, frame_names are the variable names of the slots (InstructionCompiler.frame_layout())
+    # - frames with too many slots use the dict storage (most of the slots would be unused)
+    def frame_layout(self, gf_names, frame_names):
+        self.symt_gf = SymbolTableData(gf_names)
+        self.frame_names = frame_names
+        if len(frame_names) > SymbolTableData.MAX_SLOTS:
+            self.frame_class = SymbolTableDict
+        else:
+            self.frame_class = SymbolTableData
+
     # frame_stack_create():
     # - creates temporary frame
     def frame_stack_create(self):
 
         # create temporary frame
-        self.symt_tf = SymbolTableData()
+        self.symt_tf = self.frame_class(self.frame_names)
 
     # frame_stack_push():
     # - pushes temporary frame into the frame-stack
@@ -2125,99 +4233,110 @@ class FrameStackProtocol:
         self.symt_lf, self.symt_tf = self.frame_stack.pop_frame()
 
 
+    # symt_count_init():
+    # - returns the number of initialized variables in all valid frames (GF, frame-stack, TF)
+    def symt_count_init(self):
+        count = self.symt_gf.count_init() + self.frame_stack.count_init()
+        if self.symt_tf != None:
+            count += self.symt_tf.count_init()
+        return count
+
+    # symt_is_init():
+    # - returns True if the variable (var operand) exists and is initialized, doesn't report any error
+    def symt_is_init(self, var):
+        if var.scope == "GF":
+            frame = self.symt_gf
+        elif var.scope == "TF":
+            frame = self.symt_tf
+        else:
+            frame = self.symt_lf
+        return frame != None and frame.is_init(var.slot)
+
+
     # - SET/GET-SYMT - #
 
     # symt_insert_var():
-    # - inserts the variable into the symbol table
+    # - inserts the variable (var operand) into the symbol table
     #
     # return error codes:
-    # = 32 - Variable doesn't exists
     # = 55 - Variable is not accessible from the variable given scope
-    def symt_insert_var(self, var_text):
-        
-        if var_text == None:
-            sys.stderr.write(f"[interpret.py]: ERROR (32) - FrameStackProtocol - symt_insert_var()\n")
-            sys.stderr.write(f"                NOTE  - Variable doesn't exists\n")
-            sys.stderr.write(f"                VAR   - {var_text}\n")
-            sys.exit(32)
+    def symt_insert_var(self, var):
 
-        # get variable scope and name
-        var_scope, var_name = self.inspect.analyze_var(var_text)
+        # get variable scope
+        var_scope, var_text = var.scope, var.text
 
         # insert variable into the symbol table depening on the scope
         if var_scope == "GF" and self.symt_gf != None:
-            self.symt_gf.insert_key(var_name)
+            self.symt_gf.insert_key(var.slot)
         elif var_scope == "TF" and self.symt_tf != None:
-            self.symt_tf.insert_key(var_name)
+            self.symt_tf.insert_key(var.slot)
         elif var_scope == "LF" and self.symt_lf != None:
-            self.symt_lf.insert_key(var_name)
+            self.symt_lf.insert_key(var.slot)
         else:
             sys.stderr.write(f"[interpret.py]: ERROR (55) - FrameStackProtocol - symt_insert_var()\n")
             sys.stderr.write(f"                NOTE  - Variable isn't accesable in the frame\n")
             sys.stderr.write(f"                VAR   - {var_text}\n")
             sys.stderr.write(f"                FRAME - {var_scope} - Doesn't exists \n")
-            sys.exit(55)   
+            raise InterpretError(55)   
 
     # symt_update_var():
-    # - updates variable in the symbol table
+    # - updates variable (var operand) in the symbol table
+    # - var_value is a native value of the var_type -> no decoding is needed
     #
     # return error codes:
-    # = 32 - Variable doesn't exists
     # = 55 - Variable is not accessible from the variable given scope
-    def symt_update_var(self, var_text, var_type, var_value):
+    def symt_update_var(self, var, var_type, var_value):
 
-        if var_text == None:
-            sys.stderr.write(f"[interpret.py]: ERROR (32) - FrameStackProtocol - symt_update_var()\n")
-            sys.stderr.write(f"                NOTE  - Variable doesn't exists\n")
-            sys.stderr.write(f"                VAR   - {var_text}\n")
-            sys.exit(32)
-        
-        # decodes string var type and value
-        var_scope, var_name = self.inspect.analyze_var(var_text)
-        var_value, _ = self.inspect.analyze_arg(var_value, var_type)
+        # get variable scope
+        var_scope, var_text = var.scope, var.text
 
         # move value and type onto existing frame symtable
         if var_scope == "GF" and self.symt_gf != None:
-            self.symt_gf.set_var(var_name, var_value, var_type)
+            self.symt_gf.set_var(var.slot, var_value, var_type)
         elif var_scope == "TF" and self.symt_tf != None:
-            self.symt_tf.set_var(var_name, var_value, var_type)
+            self.symt_tf.set_var(var.slot, var_value, var_type)
         elif var_scope == "LF" and self.symt_lf != None:
-            self.symt_lf.set_var(var_name, var_value, var_type)
+            self.symt_lf.set_var(var.slot, var_value, var_type)
         else:
             sys.stderr.write(f"[interpret.py]: ERROR (55) - FrameStackProtocol - symt_update_var()\n")
             sys.stderr.write(f"                NOTE  - Variable isn't accesable in the frame\n")
             sys.stderr.write(f"                VAR   - {var_text} - <{var_type}>, {var_value}\n")
             sys.stderr.write(f"                FRAME - {var_scope} - Doesn't exists \n")
-            sys.exit(55)   
+            raise InterpretError(55)   
     
     # symt_gather_var():
-    # - gets variable from the symbol table and returns its value and type
+    # - gets variable (var operand) from the symbol table and returns its value and type
     #
     # return error codes:
     # = 55 - Variable is not accessible from the variable given scope
     # = 56 - Variable has not been initialized
-    def symt_gather_var(self, var_text):
+    def symt_gather_var(self, var):
 
         # return var defalut initalization
         var_type = None 
         var_data = None                            
 
-        # get variable scope and name
-        var_scope, var_name = self.inspect.analyze_var(var_text)
+        # get variable scope
+        var_scope, var_text = var.scope, var.text
 
         # go accoring to scope
         if var_scope == "GF" and self.symt_gf != None:
-            var_data, var_type = self.symt_gf.get_var(var_name)
+            var_data, var_type = self.symt_gf.get_var(var.slot)
         elif var_scope == "TF" and self.symt_tf != None:
-            var_data, var_type = self.symt_tf.get_var(var_name)
+            var_data, var_type = self.symt_tf.get_var(var.slot)
         elif var_scope == "LF" and self.symt_lf != None:
-            var_data, var_type = self.symt_lf.get_var(var_name)
+            var_data, var_type = self.symt_lf.get_var(var.slot)
         else:
             sys.stderr.write(f"[interpret.py]: ERROR (55) - FrameStackProtocol - symt_gather_var()\n")
             sys.stderr.write(f"                NOTE  - Variable isn't accesable in the frame\n")
             sys.stderr.write(f"                VAR   - {var_text} - <{var_type}>, {var_data}\n")
             sys.stderr.write(f"                FRAME - {var_scope} - Doesn't exists \n")
-            sys.exit(55)   
+            raise InterpretError(55)   
+
+        # rope (CONCAT), string buffer (SETCHAR) -> joined and saved back as the string
+        if var_type == "rope" or var_type == "chars":
+            var_type, var_data = "string", str(var_data)
+            self.symt_update_var(var, var_type, var_data)
 
         # check if the var is not none
         if var_type is None:
@@ -2225,61 +4344,82 @@ class FrameStackProtocol:
             sys.stderr.write(f"                NOTE  - Variable has no data_type\n")
             sys.stderr.write(f"                VAR   - {var_text} - <{var_type}>, {var_data}\n")
             sys.stderr.write(f"                FRAME - {var_scope} - Doesn't exists \n")
-            sys.exit(56)
+            raise InterpretError(56)
 
         # return the variable data
         return var_type, var_data
 
     # symt_gather_type():
-    # - gets variable type from the symbol table and returns its type (doesn't do any type checking)
+    # - gets variable (var operand) type from the symbol table and returns its type (doesn't do any type checking)
     #
     # return error codes:
     # = 55 - Variable is not accessible from the variable given scope
-    def symt_gather_type(self, var_text):
+    def symt_gather_type(self, var):
         
         var_type = None
 
-        # get variable scope and name
-        var_scope, var_name = self.inspect.analyze_var(var_text)
+        # get variable scope
+        var_scope, var_text = var.scope, var.text
 
         # go accoring to scope
         if var_scope == "GF" and self.symt_gf != None:
-            _, var_type = self.symt_gf.get_var(var_name)
+            _, var_type = self.symt_gf.get_var(var.slot)
         elif var_scope == "TF" and self.symt_tf != None:
-            _, var_type = self.symt_tf.get_var(var_name)
+            _, var_type = self.symt_tf.get_var(var.slot)
         elif var_scope == "LF" and self.symt_lf != None:
-            _, var_type = self.symt_lf.get_var(var_name)
+            _, var_type = self.symt_lf.get_var(var.slot)
         else:
             sys.stderr.write(f"[interpret.py]: ERROR (55) - FrameStackProtocol - symt_gather_type()\n")
             sys.stderr.write(f"                NOTE  - Variable isn't accesable in the frame\n")
             sys.stderr.write(f"                VAR   - {var_text} - <{var_type}> \n")
             sys.stderr.write(f"                FRAME - {var_scope} - Doesn't exists \n")
-            sys.exit(55)   
+            raise InterpretError(55)   
+
+        # rope (CONCAT) and string buffer (SETCHAR) are the string
+        if var_type == "rope" or var_type == "chars":
+            return "string"
 
         return var_type
 
+    # symt_gather_lazy():
+    # - returns the value of the variable with the lazy string type ("rope" - StringRope, "chars" - StringBuffer)
+    # - None if the variable has the other type (or it doesn't exist)
+    # - used by CONCAT, SETCHAR, GETCHAR, ..., which change or read the value without joining it
+    def symt_gather_lazy(self, var, lazy_type):
+
+        # get the frame of the variable
+        if var.scope == "GF":
+            frame = self.symt_gf
+        elif var.scope == "TF":
+            frame = self.symt_tf
+        else:
+            frame = self.symt_lf
+
+        # only the initialized variable can have the lazy string
+        if frame is None or not frame.is_init(var.slot):
+            return None
+        var_data, var_type = frame.get_var(var.slot)
+        return var_data if var_type == lazy_type else None
+
 
     #  - INSTRUCTION SYMT METHODS - #
     
     # symt_get_symb():
-    # - gets symb from the symbol table or instruction and returns its value and type
+    # - gets symb from the symbol table or operand and returns its value and type
     # - used for easy access to the symbol table and instruction
     #
     # type_options
     # - WRITE, DPRINT, PUSHS      - type_option =  "universal" - any 
     # - STRLEN,                   - type_option =  "string" - str
-    # - EXIT, STRLEN              - type_option =  "integer" - int
+    # - EXIT, STRLEN, INT2FLOAT   - type_option =  "integer" - int
+    # - FLOAT2INT                 - type_option =  "float" - float
     # - NOT,                      - type_option =  "boolean" - bool
     #
-    # arg_num
-    # - arg2 - second argument
-    # - arg1 - first argument
-    # - arg3 - third argument
+    # symb
+    # - operand of the instruction -> inst.arg1, inst.arg2, inst.arg3
     #
-    # output_type
-    # - raw -> returns the orginal data -> <string> = "/065/032/066"
-    # - decoded -> returns the decoded data -> <string> = "A B"
-    def symt_get_symb(self, inst, type_option, arg_num, output_type):
+    # returned data are native values -> <int> = 42, <float> = 0.5, <bool> = True, <string> = "A B", <nil> = NIL
+    def symt_get_symb(self, symb, type_option):
         
         # saving the var_type
         var_type = ""
@@ -2287,74 +4427,50 @@ class FrameStackProtocol:
         
         # get type options
         check_type_dict = {
-            "universal":        (["int", "bool", "string", "nil"]),
+            "universal":        (["int", "float", "bool", "string", "nil"]),
             "string":           (["string"]),
             "integer":          (["int"]),
+            "float":            (["float"]),
             "boolean":          (["bool"]),
         }
 
-        # arg_num options
-        arg_num_dict = {
-            "arg1":             (inst.arg1_type, inst.arg1_text),
-            "arg2":             (inst.arg2_type, inst.arg2_text),
-            "arg3":             (inst.arg3_type, inst.arg3_text),
-        }
-
         # internal error check
         try:
             check_type = check_type_dict[type_option]
-            arg_type, arg_text = arg_num_dict[arg_num]
         except KeyError:
             sys.stderr.write(f"[interpret.py]: ERROR (99) - FrameStackProtocol - symt_get_symb()\n")
             sys.stderr.write(f"                NOTE - (Internal error), invalid type_option argument  \n")
-            sys.exit(99)
+            raise InterpretError(99)
 
         # get the second var data from the symbol table
-        if arg_type == "var":
-            var_type, var_data = self.symt_gather_var(arg_text)
+        if symb.kind == "var":
+            var_type, var_data = self.symt_gather_var(symb)
 
             # check if the variable is not None
             if var_type is None:
                 sys.stderr.write(f"[interpret.py]: ERROR (56) - FrameStackProtocol - symt_get_symb()\n")
                 sys.stderr.write(f"                NOTE - Variable <symb> has no data_type\n")
-                sys.stderr.write(f"                VAR  - {inst.arg2_text} - <{var_type}>, {var_data}\n")
-                sys.exit(56)
+                sys.stderr.write(f"                VAR  - {symb.text} - <{var_type}>, {var_data}\n")
+                raise InterpretError(56)
             
             # check if the variable is in the correct type
             if var_type not in check_type:
                 sys.stderr.write(f"[interpret.py]: ERROR (53) - FrameStackProtocol - symt_get_symb()\n")
                 sys.stderr.write(f"                NOTE - Invalid <symb> variable type\n")
-                sys.stderr.write(f"                VAR  - {arg_text} - <{var_type}>, {var_data}\n")
-                sys.exit(53)
+                sys.stderr.write(f"                VAR  - {symb.text} - <{var_type}>, {var_data}\n")
+                raise InterpretError(53)
 
-        # get the var data from the instruction
-        elif arg_type in check_type:
-            var_data, _ = self.inspect.analyze_arg(arg_text, arg_type)
-            var_type = arg_type
-        
-        # no type was given
-        elif arg_type is None:
-            sys.stderr.write(f"[interpret.py]: ERROR (32) - FrameStackProtocol - symt_get_symb()\n")
-            sys.stderr.write(f"                NOTE - Variable doesn't exist\n")
-            sys.stderr.write(f"                VAR  - {arg_text} - <{var_type}>, {var_data}\n")
-            sys.exit(32)
+        # get the var data from the operand (decoded by the InstructionCompiler)
+        elif symb.type in check_type:
+            var_data = symb.value
+            var_type = symb.type
 
         # invalid type
         else:
             sys.stderr.write(f"[interpret.py]: ERROR (53) - FrameStackProtocol - symt_get_symb()\n")
             sys.stderr.write(f"                NOTE - Invalid <symb> variable type\n")
-            sys.stderr.write(f"                VAR  - {arg_text} - <{var_type}>, {var_data}\n")
-            sys.exit(53)
-
-        # return the var data in the correct type
-        # raw
-        if output_type == "raw":
-            if var_type == "string":
-                var_data = re.sub(r"([\W\s])", lambda m: fr"\{ord(m.group(1)):03d}", str(var_data))
-        
-        # decoded
-        elif output_type == "decoded":
-            pass
+            sys.stderr.write(f"                VAR  - {symb.text} - <{var_type}>, {var_data}\n")
+            raise InterpretError(53)
 
         # return the var data and type
         return var_type, var_data
@@ -2365,22 +4481,22 @@ class FrameStackProtocol:
     # - used for easy access to the symbol table and instruction
     #
     # type_options
-    # - ADD, SUB, MUL, IDIV   - type_check =  "arithmetic" - int, int
+    # - ADD, SUB, MUL         - type_check =  "arithmetic" - int or float, int or float
+    # - IDIV                  - type_check =  "integer" - int, int
+    # - DIV                   - type_check =  "float" - float, float
     # - AND, OR, NOT          - type_check =  "logical" - bool, bool
-    # - LT, GT, EQ            - type_check =  "relational" - string or int or bool, string or int or bool
-    # - JUMPIFEQ, JUMPIFNEQ   - type_check =  "jump" - string or int or bool
+    # - LT, GT, EQ            - type_check =  "relational" - string or int or float or bool, string or int or float or bool
+    # - JUMPIFEQ, JUMPIFNEQ   - type_check =  "jump" - string or int or float or bool
     # - STR2INT, GETCHAR      - type_check =  "string_int" - string, int
     # - SETCHAR               - type_check =  "int_string" - int, string
     # - CONCAT                - type_check =  "concat" - string, string
     #
     # type_similarity
-    # - "same" -> ADD, SUB, MUL, IDIV, AND, OR, NOT, LT, GT, EQ, JUMPIFEQ, JUMPIFNEQ, CONCAT  p
+    # - "same" -> ADD, SUB, MUL, IDIV, DIV, AND, OR, NOT, LT, GT, EQ, JUMPIFEQ, JUMPIFNEQ, CONCAT  p
     # - "different" -> STR2INT, GETCHAR, SETCHAR          
     #
-    # output_type
-    # - "raw" -> returns the orginal data -> <string> = "/065/032/066"
-    # - "decoded" -> returns the decoded data -> <string> = "A B"
-    def symt_get_symb1_symb2(self, inst, type_option, type_similarity, output_type):
+    # returned data are native values -> <int> = 42, <float> = 0.5, <bool> = True, <string> = "A B", <nil> = NIL
+    def symt_get_symb1_symb2(self, inst, type_option, type_similarity):
 
         # [0] - parse function arguments
         # saving the var_type
@@ -2391,10 +4507,12 @@ class FrameStackProtocol:
         
         # get type option
         check_type_dict = {
-            "arithmetic":       (["int"], ["int"]),
+            "arithmetic":       (["int", "float"], ["int", "float"]),
+            "integer":          (["int"], ["int"]),
+            "float":            (["float"], ["float"]),
             "logical":          (["bool"], ["bool"]),
-            "relational":       (["string", "int", "bool", "nil"], ["string", "int", "bool", "nil"]),
-            "jump":             (["string", "int", "bool"], ["string", "int", "bool"]),
+            "relational":       (["string", "int", "float", "bool", "nil"], ["string", "int", "float", "bool", "nil"]),
+            "jump":             (["string", "int", "float", "bool"], ["string", "int", "float", "bool"]),
             "string_int":       (["string"], ["int"]),
             "int_string":       (["int"], ["string"]),
             "string_string":    (["string"], ["string"])
@@ -2405,159 +4523,116 @@ class FrameStackProtocol:
         except KeyError:
             sys.stderr.write(f"[interpret.py]: ERROR (99) - FrameStackProtocol - symt_get_symb1_symb2()\n")
             sys.stderr.write(f"                NOTE - (Internal error), invalid type_option argument  \n")
-            sys.exit(99)
+            raise InterpretError(99)
 
 
         # [1] - get the second var data from the symbol table
-        if inst.arg2_type == "var":
-            var_type_1, var_data_1 = self.symt_gather_var(inst.arg2_text)
+        if inst.arg2.kind == "var":
+            var_type_1, var_data_1 = self.symt_gather_var(inst.arg2)
 
             # check if the variable has a data type
             if var_type_1 is None:
                 sys.stderr.write(f"[interpret.py]: ERROR (56) - FrameStackProtocol - symt_get_symb1_symb2()\n")
                 sys.stderr.write(f"                NOTE - Variable <symb1> has no data_type\n")
-                sys.stderr.write(f"                VAR  - {inst.arg2_text} - <{var_type_1}>, {var_data_1}\n")
-                sys.stderr.write(f"                INST - [{inst.order}] - {inst.opcode} <{var_type_1}> <{inst.arg3_type}>\n")
-                sys.exit(56)
+                sys.stderr.write(f"                VAR  - {inst.arg2.text} - <{var_type_1}>, {var_data_1}\n")
+                sys.stderr.write(f"                INST - [{inst.order}] - {inst.opcode} <{var_type_1}> <{inst.arg3.type}>\n")
+                raise InterpretError(56)
             
             # check if the variable is int
             if var_type_1 not in check_type_1:
                 sys.stderr.write(f"[interpret.py]: ERROR (53) - FrameStackProtocol -> symt_get_symb1_symb2()\n")
                 sys.stderr.write(f"                NOTE - Invalid <symb1> variable type\n")
-                sys.stderr.write(f"                VAR  - {inst.arg2_text} - <{var_type_1}>, {var_data_1}\n")
-                sys.stderr.write(f"                INST - {inst.order}. - {inst.opcode} <{var_type_1}> <{inst.arg3_type}>\n")
-                sys.exit(53)
+                sys.stderr.write(f"                VAR  - {inst.arg2.text} - <{var_type_1}>, {var_data_1}\n")
+                sys.stderr.write(f"                INST - {inst.order}. - {inst.opcode} <{var_type_1}> <{inst.arg3.type}>\n")
+                raise InterpretError(53)
 
-        # [2] - get the var data from the instruction
-        elif inst.arg2_type in check_type_1:
+        # [2] - get the var data from the operand (decoded by the InstructionCompiler)
+        elif inst.arg2.type in check_type_1:
+            var_data_1 = inst.arg2.value
+            var_type_1 = inst.arg2.type
 
-            # analyze the the text variable
-            var_data_1, _ = self.inspect.analyze_arg(inst.arg2_text, inst.arg2_type)
-            var_type_1 = inst.arg2_type
-        
-        # no type was given
-        elif inst.arg2_type is None:
-            sys.stderr.write(f"[interpret.py]: ERROR (32) - FrameStackProtocol - symt_get_symb1_symb2()\n")
-            sys.stderr.write(f"                NOTE - No type was given\n")
-            sys.stderr.write(f"                VAR  - {inst.arg2_text} - <{var_type_1}>, {var_data_1}\n")
-            sys.stderr.write(f"                INST - {inst.order}. - {inst.opcode} <{var_type_1}> <{inst.arg3_type}>\n")
-            sys.exit(32)
-        
         else:
             sys.stderr.write(f"[interpret.py]: ERROR (53) - FrameStackProtocol - symt_get_symb1_symb2()\n")
             sys.stderr.write(f"                NOTE - Invalid <symb1> variable type\n")
-            sys.stderr.write(f"                VAR  - {inst.arg2_text} - <{var_type_1}>, {var_data_1}\n")
-            sys.stderr.write(f"                INST - {inst.order}. - {inst.opcode} <{var_type_1}> <{inst.arg3_type}>\n")
-            sys.exit(53)
+            sys.stderr.write(f"                VAR  - {inst.arg2.text} - <{var_type_1}>, {var_data_1}\n")
+            sys.stderr.write(f"                INST - {inst.order}. - {inst.opcode} <{var_type_1}> <{inst.arg3.type}>\n")
+            raise InterpretError(53)
 
 
         # [3] - get the third var data from the symbol table
-        if inst.arg3_type == "var":
-            var_type_2, var_data_2 = self.symt_gather_var(inst.arg3_text)
+        if inst.arg3.kind == "var":
+            var_type_2, var_data_2 = self.symt_gather_var(inst.arg3)
 
             # check if the variable has a data type
             if var_type_2 is None:
                 sys.stderr.write(f"[interpret.py]: ERROR (56) - FrameStackProtocol - symt_get_symb1_symb2()\n")
                 sys.stderr.write(f"                NOTE - Variable <symb2> has no data_type\n")
-                sys.stderr.write(f"                VAR  - {inst.arg3_text} - <{var_type_2}>, {var_data_2}\n")
+                sys.stderr.write(f"                VAR  - {inst.arg3.text} - <{var_type_2}>, {var_data_2}\n")
                 sys.stderr.write(f"                INST - [{inst.order}] - {inst.opcode} <{var_type_1}> <{var_type_2}>\n")
-                sys.exit(56)
+                raise InterpretError(56)
             
             # they should be the same type  
             if type_similarity == "same":
                 if var_type_2 != var_type_1:
                     sys.stderr.write(f"[interpret.py]: ERROR (53) - FrameStackProtocol - symt_get_symb1_symb2()\n")
                     sys.stderr.write(f"                NOTE - Invalid <symb2> variable type\n")
-                    sys.stderr.write(f"                VAR  - {inst.arg3_text} - <{var_type_2}>, {var_data_2}\n")
+                    sys.stderr.write(f"                VAR  - {inst.arg3.text} - <{var_type_2}>, {var_data_2}\n")
                     sys.stderr.write(f"                INST - [{inst.order}] - {inst.opcode} <{var_type_1}> <{var_type_2}>\n")
-                    sys.exit(53)
+                    raise InterpretError(53)
         
             # they can be different types
             elif type_similarity == "different":
                 if var_type_2 not in check_type_2:
                     sys.stderr.write(f"[interpret.py]: ERROR (53) - FrameStackProtocol - symt_get_symb1_symb2()\n")
                     sys.stderr.write(f"                NOTE - Invalid <symb2> variable type\n")
-                    sys.stderr.write(f"                VAR  - {inst.arg3_text} - <{var_type_2}>, {var_data_2}\n")
+                    sys.stderr.write(f"                VAR  - {inst.arg3.text} - <{var_type_2}>, {var_data_2}\n")
                     sys.stderr.write(f"                INST - [{inst.order}] - {inst.opcode} <{var_type_1}> <{var_type_2}>\n")
-                    sys.exit(53)
+                    raise InterpretError(53)
             
             # internal error wrong type_similarity
             else:
                 sys.stderr.write(f"[interpret.py]: ERROR (99) - FrameStackProtocol - symt_get_symb1_symb2()\n")
                 sys.stderr.write(f"                NOTE - (Internal error), invalid type_similarity argument  \n")
-                sys.exit(99)
+                raise InterpretError(99)
 
 
-        # [4] - get the third var data from the instruction
+        # [4] - get the third var data from the operand (decoded by the InstructionCompiler)
         else:
             # they should be the same type
             if type_similarity == "same":
-                if inst.arg3_type == var_type_1:
-
-                    # analyze the the text variable
-                    var_data_2, _ = self.inspect.analyze_arg(inst.arg3_text, var_type_1)
+                if inst.arg3.type == var_type_1:
+                    var_data_2 = inst.arg3.value
                     var_type_2 = var_type_1
-                
-                # no type was given
-                elif inst.arg3_type is None:
-                    sys.stderr.write(f"[interpret.py]: ERROR (32) - FrameStackProtocol - symt_get_symb1_symb2()\n")
-                    sys.stderr.write(f"                NOTE - No type was given\n")
-                    sys.stderr.write(f"                VAR  - {inst.arg3_text} - <{var_type_2}>, {var_data_2}\n")
-                    sys.stderr.write(f"                INST - [{inst.order}] - {inst.opcode} <{var_type_1}> <{var_type_2}>\n")
-                    sys.exit(32)
 
                 # invalid type
                 else:
                     sys.stderr.write(f"[interpret.py]: ERROR (53) - FrameStackProtocol - symt_get_symb1_symb2()\n")
                     sys.stderr.write(f"                NOTE - Invalid <symb2> variable type\n")
-                    sys.stderr.write(f"                VAR  - {inst.arg3_text} - <{var_type_2}>, {var_data_2}\n")
+                    sys.stderr.write(f"                VAR  - {inst.arg3.text} - <{var_type_2}>, {var_data_2}\n")
                     sys.stderr.write(f"                INST - [{inst.order}] - {inst.opcode} <{var_type_1}> <{var_type_2}>\n")
-                    sys.exit(53)
+                    raise InterpretError(53)
             
             # they can be different types
             elif type_similarity == "different":
-                if inst.arg3_type in check_type_2:
-
-                    # analyze the the text variable
-                    var_data_2, _ = self.inspect.analyze_arg(inst.arg3_text, inst.arg3_type)
-                    var_type_2 = inst.arg3_type
-                
-                # no type was given
-                elif inst.arg3_type is None:
-                    sys.stderr.write(f"[interpret.py]: ERROR (32) - FrameStackProtocol - symt_get_symb1_symb2()\n")
-                    sys.stderr.write(f"                NOTE - No type was given\n")
-                    sys.stderr.write(f"                VAR  - {inst.arg3_text} - <{var_type_2}>, {var_data_2}\n")
-                    sys.stderr.write(f"                INST - [{inst.order}] - {inst.opcode} <{var_type_1}> <{var_type_2}>\n")
-                    sys.exit(32)
-                
+                if inst.arg3.type in check_type_2:
+                    var_data_2 = inst.arg3.value
+                    var_type_2 = inst.arg3.type
+
                 # invalid type
                 else:
                     sys.stderr.write(f"[interpret.py]: ERROR (53) - FrameStackProtocol - symt_get_symb1_symb2()\n")
                     sys.stderr.write(f"                NOTE - invalid <symb2> variable type\n")
-                    sys.stderr.write(f"                VAR  - {inst.arg3_text} - <{var_type_2}>, {var_data_2}\n")
+                    sys.stderr.write(f"                VAR  - {inst.arg3.text} - <{var_type_2}>, {var_data_2}\n")
                     sys.stderr.write(f"                INST - [{inst.order}] - {inst.opcode} <{var_type_1}> <{var_type_2}>\n")
-                    sys.exit(53)
+                    raise InterpretError(53)
             
             # internal error wrong type_similarity
             else:
                 sys.stderr.write(f"[interpret.py]: ERROR (99) - FrameStackProtocol - symt_get_symb1_symb2()\n")
                 sys.stderr.write(f"                NOTE - (Internal error), invalid type_similarity argument  \n")
-                sys.exit(99)
-
-        # [5] - change the data in the correct form
-        # raw output
-        if output_type == "raw":
-            if var_type_1 == "string":
-                var_data_1 = re.sub(r"([\W\s])", lambda m: fr"\{ord(m.group(1)):03d}", str(var_data_1))
-
-            if var_type_2 == "string":
-                var_data_2 = re.sub(r"([\W\s])", lambda m: fr"\{ord(m.group(1)):03d}", str(var_data_2))
-        
-        # decoded output
-        elif output_type == "decoded":
-            pass
+                raise InterpretError(99)
 
-        # [6] - return the variables    
+        # [5] - return the variables    
         return var_type_1, var_data_1, var_type_2, var_data_2 
         
 
@@ -2585,7 +4660,7 @@ class FrameStack:
         else:
             sys.stderr.write(f"[interpret.py]: ERROR (55) - FrameStack - push_frame()\n")
             sys.stderr.write(f"                NOTE - Temporary frame doesn't exists, (nothing to push)\n")
-            sys.exit(55)
+            raise InterpretError(55)
 
         # returns symt_lf -> new local frame
         return symt_lf
@@ -2608,11 +4683,16 @@ class FrameStack:
         else:
             sys.stderr.write(f"[interpret.py]: ERROR (55) - FrameStack - pop_frame()\n")
             sys.stderr.write(f"                NOTE - Frame stack is empty, (nothing to pop)\n")
-            sys.exit(55)
+            raise InterpretError(55)
 
         # returns symt_lf -> new local frame, symt_tf -> popped frame
         return symt_lf, symt_tf        
 
+    # count_init():
+    # - returns the number of initialized variables in all frames of the stack
+    def count_init(self):
+        return sum(frame.count_init() for frame in self.__frame_stack)
+
 
 
 # -   # - - - - - - - - - - - - - - - - - #
@@ -2621,51 +4701,143 @@ class FrameStack:
 #
 # usage:
 # - Implements the symbol table data which is used to store variables and their values
-# - Implemented as python dictionary with the following structure: {key: (value, type)}
+# - Variables are resolved into slots while compiling (InstructionCompiler), the frame is a list indexed by the slot
+# - Implemented as python list with the following structure: [None -> not defined, (value, type) -> defined]
+# - names are the variable names of the slots, used only for error messages
 class SymbolTableData:
+    __slots__ = ("__table", "__names")
 
-    def __init__(self):
-        self.__table = {}                # symbol table data
+    MAX_SLOTS = 256                     # max. number of LF/TF slots for the list storage
+
+    def __init__(self, names):
+        self.__table = [None] * len(names)      # symbol table data
+        self.__names = names                    # variable names of the slots
     
     # insert_key():
-    # - insert the key and nothing else
+    # - insert the key (slot) and nothing else
     def insert_key(self, key):
 
         # check if the key is already in the table
-        if key not in self.__table:
+        if self.__table[key] is None:
             self.__table[key] = (None, None)
         else:
             sys.stderr.write(f"[interpret.py]: ERROR (52) - SymbolTableData - insert_key()\n")
             sys.stderr.write(f"                NOTE - Variable already exists in the data-frame\n")
-            sys.stderr.write(f"                VAR  - {key}\n")
-            sys.exit(52)
+            sys.stderr.write(f"                VAR  - {self.__names[key]}\n")
+            raise InterpretError(52)
 
     # set_var():
-    # inserts or replaces the value and the type of the key
+    # inserts or replaces the value and the type of the key (slot)
     def set_var(self, key, data, data_type):
-        if key in self.__table:
+        if self.__table[key] is not None:
             self.__table[key] = (data, data_type)
         else:
             # raise an error or handle the case where the key is not found
             sys.stderr.write(f"[interpret.py]: ERROR (54) - SymbolTableData - set_var()\n")
             sys.stderr.write(f"                NOTE - Variable not found in the data-frame\n")
-            sys.stderr.write(f"                VAR  - {key} - <{data_type}>, {data}\n")
-            sys.exit(54)    
+            sys.stderr.write(f"                VAR  - {self.__names[key]} - <{data_type}>, {data}\n")
+            raise InterpretError(54)    
     
     # get_var():
-    # return the value and the type of the key
+    # return the value and the type of the key (slot)
     def get_var(self, key):
         
-        if key in self.__table:
-            var_data, var_value = self.__table.get(key)
-            return var_data, var_value
+        var = self.__table[key]
+        if var is not None:
+            return var
         else:
             # raise an error or handle the case where the key is not found
             sys.stderr.write(f"[interpret.py]: ERROR (54) - SymbolTableData - set_var()\n")
             sys.stderr.write(f"                NOTE - Variable not found in the data-frame\n")
-            sys.stderr.write(f"                VAR  - {key}\n")
-            sys.exit(54)
+            sys.stderr.write(f"                VAR  - {self.__names[key]}\n")
+            raise InterpretError(54)
     
+    # is_init():
+    # - returns True if the key (slot) exists and has a value
+    def is_init(self, key):
+        var = self.__table[key]
+        return var is not None and var[1] is not None
+
+    # get_table():
+    # - returns the list of the slots -> (data, type), (None, None) for the defined variable, None for the undefined
+    # - used by the compiled blocks (BlockCompiler), which access the slots directly
+    def get_table(self):
+        return self.__table
+
+    # count_init():
+    # - returns the number of keys which have a value
+    def count_init(self):
+        return sum(1 for var in self.__table if var is not None and var[1] is not None)
+
+    # empty_table():
+    # clears the hash table
+    def empty_table(self):
+        self.__table = [None] * len(self.__names)
+
+
+
+# -   # - - - - - - - - - - - - - - - - - #
+# -   #      SYMBOL-TABLE-DICT CLASS      #
+# -   # - - - - - - - - - - - - - - - - - #
+#
+# usage:
+# - Same interface as SymbolTableData, used for LF/TF frames when the program has too many LF/TF slots
+# - Implemented as python dictionary with the following structure: {slot: (value, type)}
+class SymbolTableDict:
+    __slots__ = ("__table", "__names")
+
+    def __init__(self, names):
+        self.__table = {}                       # symbol table data
+        self.__names = names                    # variable names of the slots
+
+    # insert_key():
+    # - insert the key (slot) and nothing else
+    def insert_key(self, key):
+
+        # check if the key is already in the table
+        if key not in self.__table:
+            self.__table[key] = (None, None)
+        else:
+            sys.stderr.write(f"[interpret.py]: ERROR (52) - SymbolTableDict - insert_key()\n")
+            sys.stderr.write(f"                NOTE - Variable already exists in the data-frame\n")
+            sys.stderr.write(f"                VAR  - {self.__names[key]}\n")
+            raise InterpretError(52)
+
+    # set_var():
+    # inserts or replaces the value and the type of the key (slot)
+    def set_var(self, key, data, data_type):
+        if key in self.__table:
+            self.__table[key] = (data, data_type)
+        else:
+            sys.stderr.write(f"[interpret.py]: ERROR (54) - SymbolTableDict - set_var()\n")
+            sys.stderr.write(f"                NOTE - Variable not found in the data-frame\n")
+            sys.stderr.write(f"                VAR  - {self.__names[key]} - <{data_type}>, {data}\n")
+            raise InterpretError(54)
+
+    # get_var():
+    # return the value and the type of the key (slot)
+    def get_var(self, key):
+
+        var = self.__table.get(key)
+        if var is not None:
+            return var
+        else:
+            sys.stderr.write(f"[interpret.py]: ERROR (54) - SymbolTableDict - get_var()\n")
+            sys.stderr.write(f"                NOTE - Variable not found in the data-frame\n")
+            sys.stderr.write(f"                VAR  - {self.__names[key]}\n")
+            raise InterpretError(54)
+
+    # is_init():
+    # - returns True if the key (slot) exists and has a value
+    def is_init(self, key):
+        var = self.__table.get(key)
+        return var is not None and var[1] is not None
+
+    # count_init():
+    # - returns the number of keys which have a value
+    def count_init(self):
+        return sum(1 for _, var_type in self.__table.values() if var_type is not None)
+
     # empty_table():
     # clears the hash table
     def empty_table(self):
@@ -2679,41 +4851,300 @@ class SymbolTableData:
 #
 # usage:
 # - Implements the data stack which is used by stack instructions
-# - Implemented as python list with the following structure: [(data, type)]
+# - Implemented as two parallel preallocated python lists -> values [data] and tags [type tag], top is the number of items
+#   = type of the item is saved as the small int tag (STACK_TAGS), pop() returns the type name (STACK_TYPES)
+#   = lists are doubled when they are full (grow()), they are never replaced -> compiled blocks keep their references
+# - stack-extension instructions (ADDS, LTS, EQS, JUMPIFEQS, ...) use the apply methods, which change the items in place
+#   = no (data, type) pair is created, the result replaces the first operand
+#   = method returns False (None) and doesn't change the stack when the operation can't be done -> instruction reports the error
+
+# type tags of the data stack items
+STACK_INT, STACK_BOOL, STACK_STRING, STACK_NIL, STACK_FLOAT = 0, 1, 2, 3, 4
+STACK_TYPES = ("int", "bool", "string", "nil", "float")                            # tag -> type
+STACK_TAGS = {"int": STACK_INT, "bool": STACK_BOOL, "string": STACK_STRING, "nil": STACK_NIL, "float": STACK_FLOAT}  # type -> tag
+STACK_NUMBERS = (STACK_INT, STACK_FLOAT)                                            # tags of ADDS, SUBS, MULS
+
 class DataStack:
 
-    def __init__(self):
-        self.__stack = []             # data stack
+    def __init__(self, capacity=64):
+        self.values = [None] * capacity         # data of the items
+        self.tags = [STACK_NIL] * capacity      # type tags of the items
+        self.top = 0                            # number of items (position of the next item)
+
+    # grow():
+    # - doubles the size of the lists (in place)
+    def grow(self):
+        size = len(self.values)
+        self.values.extend([None] * size)
+        self.tags.extend([STACK_NIL] * size)
 
     # push():
     # - pushes the data and the type to the stack
     def push(self, data, data_type):
-        self.__stack.append((data, data_type))
+        top = self.top
+        if top == len(self.values):
+            self.grow()
+        self.values[top] = data
+        self.tags[top] = STACK_TAGS[data_type]
+        self.top = top + 1
 
     # pop():
     # - pops the data and the type from the stack
     def pop(self):
-        if not self.is_empty():
-            return self.__stack.pop()
+        top = self.top - 1
+        if top >= 0:
+            self.top = top
+            data = self.values[top]
+            self.values[top] = None
+            return data, STACK_TYPES[self.tags[top]]
         else:
             sys.stderr.write(f"[interpret.py]: ERROR (56) - DataStack - pop()\n")
             sys.stderr.write(f"                NOTE - Stack is empty, (nothing to pop)\n")
-            sys.exit(56)
+            raise InterpretError(56)
+
+    # apply_number():
+    # - ADDS, SUBS, MULS, IDIVS, DIVS -> replaces the two items of the same type by function(symb1, symb2)
+    # - number_tags are the allowed tags -> STACK_NUMBERS (int, float), (STACK_INT,) for IDIVS, (STACK_FLOAT,) for DIVS
+    # - divide -> zero divisor isn't replaced (IDIVS, DIVS report it)
+    def apply_number(self, function, number_tags, divide=False):
+        top = self.top - 1
+        tags = self.tags
+        if top < 1 or tags[top] != tags[top - 1] or tags[top] not in number_tags:
+            return False
+        values = self.values
+        if divide and values[top] == 0:
+            return False
+        values[top - 1] = function(values[top - 1], values[top])
+        values[top] = None
+        self.top = top
+        return True
+
+    # apply_compare():
+    # - LTS, GTS -> replaces the two items of the same type <int, float, bool, string> by the bool function(symb1, symb2)
+    def apply_compare(self, function):
+        top = self.top - 1
+        tags = self.tags
+        if top < 1 or tags[top] != tags[top - 1] or tags[top] == STACK_NIL:
+            return False
+        values = self.values
+        values[top - 1] = function(values[top - 1], values[top])
+        values[top] = None
+        tags[top - 1] = STACK_BOOL
+        self.top = top
+        return True
+
+    # apply_bool():
+    # - ANDS, ORS -> replaces the two bool items by function(symb1, symb2)
+    def apply_bool(self, function):
+        top = self.top - 1
+        tags = self.tags
+        if top < 1 or tags[top] != STACK_BOOL or tags[top - 1] != STACK_BOOL:
+            return False
+        values = self.values
+        values[top - 1] = function(values[top - 1], values[top])
+        values[top] = None
+        self.top = top
+        return True
+
+    # apply_convert():
+    # - INT2FLOATS, FLOAT2INTS -> replaces the item on the top (tag from_tag) by function(symb) with the tag to_tag
+    # - value which can't be converted (inf, nan, too big int) isn't replaced (the instruction reports it)
+    def apply_convert(self, function, from_tag, to_tag):
+        top = self.top - 1
+        if top < 0 or self.tags[top] != from_tag:
+            return False
+        try:
+            self.values[top] = function(self.values[top])
+        except (ValueError, OverflowError):
+            return False
+        self.tags[top] = to_tag
+        return True
+
+    # apply_not():
+    # - NOTS -> negates the bool item on the top
+    def apply_not(self):
+        top = self.top - 1
+        if top < 0 or self.tags[top] != STACK_BOOL:
+            return False
+        self.values[top] = not self.values[top]
+        return True
+
+    # equal():
+    # - returns True if the two items on the top are equal (nil is equal only to nil), False if not
+    # - returns None if the items can't be compared (different types, less than two items) -> stack isn't changed
+    # - pop -> the items are popped (JUMPIFEQS, JUMPIFNEQS), otherwise they are replaced by the result (EQS)
+    def equal(self, pop):
+        top = self.top - 1
+        tags = self.tags
+        if top < 1:
+            return None
+        tag_1, tag_2 = tags[top - 1], tags[top]
+        if tag_1 == STACK_NIL or tag_2 == STACK_NIL:
+            result = tag_1 == tag_2
+        elif tag_1 == tag_2:
+            result = self.values[top - 1] == self.values[top]
+        else:
+            return None
+
+        values = self.values
+        values[top] = None
+        if pop:
+            values[top - 1] = None
+            self.top = top - 1
+        else:
+            values[top - 1] = result
+            tags[top - 1] = STACK_BOOL
+            self.top = top
+        return result
 
     # is_empty():
     # - returns True if the stack is empty
     def is_empty(self):
-        return len(self.__stack) == 0
+        return self.top == 0
 
     # size():
     # - returns the size of the stack
     def size(self):
-        return len(self.__stack)
-    
+        return self.top
+
     # clear():
-    # - clears the stack
+    # - clears the stack (the same lists -> compiled blocks keep their references)
     def clear(self):
-        self.__stack = []
+        self.values[:self.top] = [None] * self.top
+        self.top = 0
+
+
+
+# -   # - - - - - - - - - - - - - - - #
+# -   #      OUTPUT-BUFFER CLASS      #
+# -   # - - - - - - - - - - - - - - - #
+#
+# usage:
+# - Buffers the output of the WRITE instruction, the output is written when the buffer is bigger than size
+# - flush() writes the buffer and flushes the output -> before DPRINT, BREAK, READ from stdin and at the end of the program
+class OutputBuffer:
+
+    def __init__(self, output, size=65536):
+        self.output = output            # output stream
+        self.size = size                # max. size of the buffer (characters)
+        self.__buffer = []              # buffered strings
+        self.__length = 0               # number of buffered characters
+
+    # write():
+    # - saves the text into the buffer, writes the buffer if it's full
+    def write(self, text):
+        self.__buffer.append(text)
+        self.__length += len(text)
+        if self.__length >= self.size:
+            self.output.write("".join(self.__buffer))
+            self.__buffer = []
+            self.__length = 0
+
+    # flush():
+    # - writes the buffer and flushes the output stream
+    def flush(self):
+        if self.__buffer:
+            self.output.write("".join(self.__buffer))
+            self.__buffer = []
+            self.__length = 0
+        self.output.flush()
+
+
+
+# -   # - - - - - - - - - - - - - - #
+# -   #      INPUT-READER CLASS      #
+# -   # - - - - - - - - - - - - - - #
+#
+# usage:
+# - Reads the input of the READ instruction (--input file or stdin)
+# - The input is read in blocks, which are split into lines -> READ only takes the next line from the list
+# - Interactive input (terminal) is read line by line, so the user doesn't have to write the whole block
+# - read_value() converts the line -> <int> "42" = 42 or nil, <bool> "TRUE" = True, other = False, <string> as it is
+# - end of the input is always nil
+class InputReader:
+
+    def __init__(self, source, block_size=65536):
+        self.source = source                                            # input stream (None -> no input)
+        self.block_size = block_size                                    # size of the read block (characters)
+        self.interactive = source is not None and source.isatty()       # input is read line by line
+        self.__lines = []                                               # lines of the read blocks
+        self.__index = 0                                                # next line in the lines
+        self.__rest = ""                                                # unfinished line of the last block
+        self.__eof = source is None                                     # end of the input
+
+    # read_line():
+    # - returns the next line without the new line character or None at the end of the input
+    def read_line(self):
+
+        # interactive input
+        if self.interactive:
+            line = self.source.readline()
+            if line == "":
+                return None
+            return line[:-1] if line[-1] == "\n" else line
+
+        # line from the read blocks
+        if self.__index == len(self.__lines) and not self.__read_block():
+            return None
+        line = self.__lines[self.__index]
+        self.__index += 1
+        return line
+
+    # read_value():
+    # - reads the next line and converts it into the given type (int, float, bool, string)
+    # - returns (type, value), end of the input or invalid int/float -> ("nil", NIL)
+    def read_value(self, data_type):
+
+        # end of the input
+        line = self.read_line()
+        if line is None:
+            return "nil", NIL
+
+        # string
+        if data_type == "string":
+            return "string", line
+
+        # int -> [-+]?[0-9]+
+        elif data_type == "int":
+            digits = line[1:] if line[:1] in ("+", "-") else line
+            if digits.isascii() and digits.isdigit():
+                return "int", int(line)
+            return "nil", NIL
+
+        # float -> hexadecimal format (float.hex())
+        elif data_type == "float":
+            try:
+                return "float", float.fromhex(line)
+            except ValueError:
+                return "nil", NIL
+
+        # bool
+        else:
+            return "bool", line.lower() == "true"
+
+    # read_block():
+    # - reads the next block and splits it into lines
+    # - returns False if there are no more lines
+    def __read_block(self):
+        while not self.__eof:
+            block = self.source.read(self.block_size)
+
+            # end of the input -> the last line doesn't have to end with new line
+            if block == "":
+                self.__eof = True
+                lines = [self.__rest] if self.__rest != "" else []
+                self.__rest = ""
+
+            # the last part of the block is an unfinished line
+            else:
+                lines = (self.__rest + block).split("\n")
+                self.__rest = lines.pop()
+
+            if lines:
+                self.__lines = lines
+                self.__index = 0
+                return True
+        return False
 
 
 
@@ -2742,7 +5173,7 @@ class FuncCallStack:
         else:
             sys.stderr.write(f"[interpret.py]: ERROR (56) - FuncCallStack - pop()\n")
             sys.stderr.write(f"                NOTE - Stack is empty, (nothing to pop)\n")
-            sys.exit(56)
+            raise InterpretError(56)
 
     # is_empty():
     # - check if the stack is empty
@@ -2777,7 +5208,7 @@ class SymbolTableJump:
             sys.stderr.write(f"[interpret.py]: ERROR (52) - SymbolTableJump - add_label()\n")
             sys.stderr.write(f"                NOTE  - Label already exists, can't add new label\n")
             sys.stderr.write(f"                LABEL - {label}, {inst_order}\n")
-            sys.exit(52)
+            raise InterpretError(52)
 
         # add the label to the table
         else:
@@ -2792,12 +5223,27 @@ class SymbolTableJump:
             sys.stderr.write(f"[interpret.py]: ERROR (52) - SymbolTableJump - get_label()\n")
             sys.stderr.write(f"                NOTE  - Label not found, nowhere to jump to\n")
             sys.stderr.write(f"                LABEL - {label}, None\n")
-            sys.exit(52)
+            raise InterpretError(52)
         
         # return the label inst_order
         else:
             return self.__table[label]
     
+    # get_table():
+    # - returns the table (saved into the program cache)
+    def get_table(self):
+        return self.__table
+
+    # set_table():
+    # - replaces the table (loaded from the program cache)
+    def set_table(self, table):
+        self.__table = table
+
+    # find_label():
+    # - get label inst_order from the table or None if the label doesn't exist
+    def find_label(self, label):
+        return self.__table.get(label)
+
     # check_label():
     # - check if label exists in the table
     def check_label(self, label):
@@ -2805,7 +5251,7 @@ class SymbolTableJump:
             sys.stderr.write(f"[interpret.py]: ERROR (52) - SymbolTableJump - get_label()\n")
             sys.stderr.write(f"                NOTE  - Label not found, nowhere to jump to\n")
             sys.stderr.write(f"                LABEL - {label}, None\n")
-            sys.exit(52)
+            raise InterpretError(52)
 
     # empty_table():
     # - clears the table
@@ -2814,6 +5260,386 @@ class SymbolTableJump:
 
 
 
+# -   # - - - - - - - - - - - - - #
+# -   #      STATISTICS CLASS     #
+# -   # - - - - - - - - - - - - - #
+#
+# usage:
+# - Collects the statistics of the interpretation (STATI extension), used only by the instrumented loop
+# - counts are number of executions of every instruction (indexed by the instruction position)
+# - LABEL, DPRINT and BREAK instructions are not counted in insts, hot and frequent
+class Statistics:
+
+    def __init__(self, inst):
+        self.inst = inst                        # compiled instructions
+        self.counts = [0] * len(inst)           # executions of every instruction
+        self.vars = 0                           # max. number of initialized variables
+        self.ignored = ("LABEL", "DPRINT", "BREAK")
+
+    # update_vars():
+    # - saves the current number of initialized variables if it's the maximum
+    def update_vars(self, count):
+        if count > self.vars:
+            self.vars = count
+
+    # insts():
+    # - returns the number of executed instructions
+    def insts(self):
+        return sum(count for instruction, count in zip(self.inst, self.counts) if instruction.opcode not in self.ignored)
+
+    # hot():
+    # - returns the order of the most executed instruction, the smallest order if there are more of them
+    def hot(self):
+        hot_order, hot_count = None, 0
+        for instruction, count in zip(self.inst, self.counts):
+            if instruction.opcode in self.ignored or count == 0:
+                continue
+            if count > hot_count or (count == hot_count and instruction.order < hot_order):
+                hot_order, hot_count = instruction.order, count
+        return "" if hot_order == None else str(hot_order)
+
+    # opcode_counts():
+    # - returns the number of executions of every opcode (in the order of the source code)
+    def opcode_counts(self):
+        opcodes = {}
+        for instruction, count in zip(self.inst, self.counts):
+            if instruction.opcode not in self.ignored:
+                opcodes[instruction.opcode] = opcodes.get(instruction.opcode, 0) + count
+        return opcodes
+
+    # frequent():
+    # - returns the most executed opcodes separated by comma
+    def frequent(self):
+        opcodes = self.opcode_counts()
+        max_count = max(opcodes.values(), default=0)
+        if max_count == 0:
+            return ""
+        return ",".join(opcode for opcode, count in opcodes.items() if count == max_count)
+
+    # write():
+    # - writes the statistics into the stati file in the order of the stati arguments
+    def write(self, stati_file, stati_args):
+        for arg in stati_args:
+            if arg == "insts":
+                stati_file.write(f"{self.insts()}\n")
+            elif arg == "hot":
+                stati_file.write(f"{self.hot()}\n")
+            elif arg == "vars":
+                stati_file.write(f"{self.vars}\n")
+            elif arg == "frequent":
+                stati_file.write(f"{self.frequent()}\n")
+            elif arg == "eol":
+                stati_file.write("\n")
+        stati_file.flush()
+
+
+
+# -   # - - - - - - - - - - - - - #
+# -   #       PROFILER CLASS      #
+# -   # - - - - - - - - - - - - - #
+#
+# usage:
+# - Collects the wall time and the count of executed instructions (--profile), used only by the profiling loop
+# - samples are saved as {(stack, instruction position): [count, time in ns]}
+# - stack is the path of called functions (CALL targets) -> "main;foo;bar"
+# - output are collapsed stacks (flame graph tools) -> "main;foo;block loop;12 ADD 3400"
+#   = stack of functions, label-delimited basic block, instruction order and opcode, time in ns (or count)
+class Profiler:
+
+    def __init__(self, inst):
+        self.inst = inst                        # compiled instructions
+        self.samples = {}                       # {(stack, pc): [count, time]}
+        self.functions = ["main"]               # called functions
+        self.stack = "main"                     # called functions joined by ;
+        self.blocks = []                        # basic block name of every instruction
+
+        # every label starts a new basic block
+        block = "block main"
+        for instruction in inst:
+            if instruction.opcode == "LABEL":
+                block = "block " + self.frame_name(instruction.arg1.value)
+            self.blocks.append(block)
+
+    # frame_name():
+    # - returns the name which can be used in the collapsed stack (without ;)
+    def frame_name(self, name):
+        return name.replace(";", "_")
+
+    # add_sample():
+    # - adds one execution of the instruction (pc) with the given stack and time
+    def add_sample(self, stack, pc, elapsed):
+        sample = self.samples.setdefault((stack, pc), [0, 0])
+        sample[0] += 1
+        sample[1] += elapsed
+
+    # update_stack():
+    # - updates the stack of called functions after CALL (depth grows) or RETURN (depth falls)
+    # - returns the new stack
+    def update_stack(self, instruction, depth):
+        if depth >= len(self.functions):
+            self.functions.append(self.frame_name(instruction.arg1.value))
+        else:
+            del self.functions[depth + 1:]
+        self.stack = ";".join(self.functions)
+        return self.stack
+
+    # write():
+    # - writes the collapsed stacks into the profile file, weighted by time (ns) or by count
+    def write(self, profile_file, counts):
+        for (stack, pc), (count, elapsed) in sorted(self.samples.items()):
+            instruction = self.inst[pc]
+            value = count if counts else elapsed
+            profile_file.write(f"{stack};{self.blocks[pc]};{instruction.order} {instruction.opcode} {value}\n")
+
+        profile_file.flush()
+
+
+
+# -   # - - - - - - - - - - - - - - - #
+# -   #      PROGRAM-CACHE CLASS      #
+# -   # - - - - - - - - - - - - - - - #
+#
+# usage:
+# - Saves the compiled programs (instructions and labels) into the cache directory (--cache)
+# - Program is saved as <key>.pickle, key is the hash of the source and the interpret version
+# - Instructions are saved as tuples (opcode, order, arg1, arg2, arg3), operands as tuples -> fast pickling
+# - Least recently used programs are removed when the cache is bigger than max_size
+# - Cache is only an optimization -> unreadable/unwritable cache files are ignored
+# - Cache directory has to be trusted -> pickle.load() can run any code from the cache file
+class ProgramCache:
+
+    def __init__(self, cache_dir, max_size_mb):
+        self.cache_dir = cache_dir                      # cache directory
+        self.max_size = max_size_mb * 1024 * 1024       # max. size of the cache in bytes
+
+    # source_key():
+    # - computes the cache key of the source file
+    # - returns the key and the source which can be read again (stdin is read into the memory)
+    def source_key(self, source):
+
+        # key -> interpret version, python version and the source content
+        key = hashlib.sha256(f"{INTERPRET_VERSION}:{sys.version_info[0]}.{sys.version_info[1]}:".encode())
+
+        # source which can't be read again (stdin)
+        if not source.seekable():
+            source = io.StringIO(source.read())
+
+        # hash the source and read it again from the start
+        start = source.tell()
+        for chunk in iter(lambda: source.read(1024 * 1024), ""):
+            key.update(chunk.encode("utf-8", "surrogateescape"))
+        source.seek(start)
+
+        return key.hexdigest(), source
+
+    # load():
+    # - loads the compiled program from the cache
+    # - returns (instructions, labels, frame layout) or None if the program isn't in the cache
+    # - missing, unreadable and damaged cache files are a miss, errors of the unpacking aren't hidden
+    def load(self, key):
+        path = os.path.join(self.cache_dir, key + ".pickle")
+        try:
+            with open(path, "rb") as cache_file:
+                packed_inst, labels, layout = pickle.load(cache_file)
+            os.utime(path)                                  # mark as recently used
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError):
+            return None
+        return self.__unpack(packed_inst), labels, layout
+
+    # store():
+    # - saves the compiled program (without handlers) into the cache and removes the least recently used programs
+    def store(self, key, inst, labels, layout):
+        path = os.path.join(self.cache_dir, key + ".pickle")
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(path + ".tmp", "wb") as cache_file:
+                pickle.dump((self.__pack(inst), labels, layout), cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(path + ".tmp", path)
+            self.__evict()
+        except (OSError, pickle.PicklingError, RecursionError):
+            return
+
+    # pack():
+    # - converts the compiled instructions into tuples
+    def __pack(self, inst):
+        packed_inst = []
+        for instruction in inst:
+            args = []
+            for arg in (instruction.arg1, instruction.arg2, instruction.arg3):
+                if arg is None:
+                    args.append(None)
+                else:
+                    args.append((arg.kind, arg.type, arg.text, arg.value, arg.scope, arg.name, arg.slot, arg.target))
+            packed_inst.append((instruction.opcode, instruction.order, args[0], args[1], args[2]))
+        return packed_inst
+
+    # unpack():
+    # - converts the tuples back into the compiled instructions
+    def __unpack(self, packed_inst):
+        inst = []
+        for opcode, order, *packed_args in packed_inst:
+            args = []
+            for packed_arg in packed_args:
+                if packed_arg is None:
+                    args.append(None)
+                    continue
+                kind, arg_type, text, value, scope, name, slot, target = packed_arg
+                arg = InstructionCompiler.Operand(kind, arg_type, text)
+                arg.value, arg.scope, arg.name, arg.slot, arg.target = value, scope, name, slot, target
+                args.append(arg)
+            inst.append(InstructionCompiler.CompiledInstruction(opcode, order, args[0], args[1], args[2]))
+        return inst
+
+    # evict():
+    # - removes the least recently used programs until the cache size is smaller than max_size
+    def __evict(self):
+
+        # programs in the cache -> (last use, size, path)
+        programs = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".pickle"):
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                programs.append((stat.st_mtime, stat.st_size, path))
+
+        # remove the oldest programs
+        cache_size = sum(size for _, size, _ in programs)
+        for _, size, path in sorted(programs):
+            if cache_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            cache_size -= size
+
+
+
+# -   # - - - - - - - - - - - - - - - - - #
+# -   #       INTERPRET-SERVER CLASS        #
+# -   # - - - - - - - - - - - - - - - - - - #
+#
+# usage:
+# - Keeps the interpret warm (python started, modules imported) and runs the programs of the clients (--serve)
+# - Server listens on the unix socket, every request is run in a forked process -> requests don't share any state
+# - request  -> json line {"cwd", "args", "stdin_size"} and the stdin data (source or input which is read from stdin)
+# - response -> json line {"rc", "stdout_size", "stderr_size"} and the stdout and stderr data
+# - args are the interpret.py arguments of the client, relative paths are relative to the cwd of the client
+#
+# dependencies:
+# - Interpret class
+class InterpretServer:
+
+    # RequestHandler class:
+    # - handles one connection of the client, one connection is one run of the interpret
+    class RequestHandler(socketserver.StreamRequestHandler):
+
+        def handle(self):
+            self.server.interpret_server.handle(self.rfile, self.wfile)
+
+    # UnixServer class:
+    # - unix socket server which forks for every request
+    class UnixServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+        pass
+
+    def __init__(self, socket_path):
+        self.socket_path = socket_path          # path of the unix socket
+
+    # serve():
+    # - creates the socket and handles the requests until the server is interrupted (SIGINT, SIGTERM)
+    #
+    # return error codes:
+    #  = 99 - can't create the socket
+    def serve(self):
+
+        # socket file left by the previous server
+        if os.path.exists(self.socket_path):
+            try:
+                socket.socket(socket.AF_UNIX).connect(self.socket_path)
+            except OSError:
+                os.remove(self.socket_path)
+
+        try:
+            server = self.UnixServer(self.socket_path, self.RequestHandler)
+        except OSError as error:
+            sys.stderr.write(f"[interpret.py]: ERROR (99) - InterpretServer - serve()\n")
+            sys.stderr.write(f"                NOTE - Can't create the socket {self.socket_path}, {error}\n")
+            raise InterpretError(99)
+
+        # handle the requests, SIGTERM stops the server like the keyboard interrupt
+        server.interpret_server = self
+        signal.signal(signal.SIGTERM, self.stop)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            os.remove(self.socket_path)
+
+    # stop():
+    # - SIGTERM handler, stops the server
+    def stop(self, signum, frame):
+        raise KeyboardInterrupt()
+
+    # handle():
+    # - reads the request of the client, runs the interpret and writes the response
+    def handle(self, rfile, wfile):
+
+        # request -> json line and the stdin data
+        request = json.loads(rfile.readline())
+        stdin_data = rfile.read(request["stdin_size"]).decode("utf-8", "surrogateescape")
+
+        # run the interpret
+        stdout, stderr = io.StringIO(), io.StringIO()
+        rc = self.execute(request["cwd"], request["args"], stdin_data, stdout, stderr)
+
+        # response -> json line, stdout and stderr data
+        stdout_data = stdout.getvalue().encode("utf-8", "surrogateescape")
+        stderr_data = stderr.getvalue().encode("utf-8", "surrogateescape")
+        response = {"rc": rc, "stdout_size": len(stdout_data), "stderr_size": len(stderr_data)}
+        wfile.write(json.dumps(response).encode() + b"\n" + stdout_data + stderr_data)
+
+    # execute():
+    # - runs the interpret with the arguments of the client in the forked process
+    # - returns the exit code of the interpret
+    #
+    # return error codes:
+    #  = 10 - --serve is given by the client
+    #  = 99 - unexpected exception of the interpret -> traceback is written into the stderr of the client
+    def execute(self, cwd, args, stdin_data, stdout, stderr):
+
+        # forked process -> working directory and stdin of the client
+        os.chdir(cwd)
+        sys.stdin = io.StringIO(stdin_data)
+
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            interpret = Interpret()
+            try:
+                interpret.read_args(args)
+                if interpret.serve != None:
+                    sys.stderr.write("[interpret.py]: ERROR (10) - InterpretServer - execute()\n")
+                    sys.stderr.write("                NOTE - Argument --serve can't be used by the client\n")
+                    return 10
+                interpret.run_script()
+                return 0
+            except InterpretExit as exit_code:
+                return exit_code.code
+            # wrong arguments (argparse)
+            except SystemExit as exit_code:
+                return exit_code.code if isinstance(exit_code.code, int) else 1
+            # bug of the interpret -> the client gets the response instead of the closed connection
+            except Exception:
+                sys.stderr.write("[interpret.py]: ERROR (99) - InterpretServer - execute()\n")
+                sys.stderr.write("                NOTE - Unexpected exception of the interpret\n")
+                sys.stderr.write(traceback.format_exc())
+                return 99
+
+
+
 # -   # - - - - - - - - - #
 # -   #        MAIN       #
 # -   # - - - - - - - - - #
@@ -2827,7 +5653,12 @@ if __name__ == "__main__":
 
     # read arguments -> optional for the user -> if not given the program will run with default values
     # to note instructions READ won't work because of the missing arguments
-    interpret.read_args()
-
-    # runs the given code the code
-    interpret.run_script()
\ No newline at end of file
+    # runs the given code the code, EXIT and errors end the script with their code
+    try:
+        interpret.read_args()
+        if interpret.serve != None:
+            InterpretServer(interpret.serve).serve()
+        else:
+            interpret.run_script()
+    except InterpretExit as exit_code:
+        sys.exit(exit_code.code)
\ No newline at end of file
@@ -0,0 +1,103 @@
+# Client of the interpret.py server (interpret.py --serve=<socket>)
+# Autor: Nikolas Nosál - xnosal01 - xnosal01@stud.fit.vutbr.cz
+
+# - - - - - - - - - - - #
+#        USAGE          #
+# - - - - - - - - - - - #
+#
+# - drop-in replacement of interpret.py -> same arguments (--source, --input, --stati, ...), output and exit code
+# - socket of the server is given by --socket=<path> or by the INTERPRET_SOCKET environment variable
+# - program is run by the warm server, so python startup and imports of interpret.py are paid only once
+# - stdin (source or input) is read whole and sent to the server
+# - interpret.py is run locally when the server isn't running or the input is interactive (terminal)
+# - the program is never run again after the request was sent -> broken response of the server ends with the error 99
+#
+# example:
+# - python3 interpret.py --serve=/tmp/interpret.sock &
+# - INTERPRET_SOCKET=/tmp/interpret.sock python3 interpret_client.py --source=code.xml --input=input.txt
+
+# - - - - - - - - - - - #
+#       LIBRARIES       #
+# - - - - - - - - - - - #
+#   -   -   -   -   -   -   -   -
+import os
+import sys
+import json
+import socket
+
+INTERPRET = os.path.join(os.path.dirname(os.path.abspath(__file__)), "interpret.py")
+
+
+# has_argument():
+# - returns True if the argument is given (--source=file or --source file)
+def has_argument(args, name):
+    return any(arg == name or arg.startswith(name + "=") for arg in args)
+
+# run_local():
+# - runs interpret.py in this process (replaces the client), already read stdin is given to the new process
+def run_local(args, stdin_data=None):
+    if stdin_data == None:
+        os.execv(sys.executable, [sys.executable, INTERPRET] + args)
+
+    import subprocess
+    sys.exit(subprocess.run([sys.executable, INTERPRET] + args, input=stdin_data).returncode)
+
+# read_exact():
+# - reads size bytes from the socket file
+def read_exact(sock_file, size):
+    data = sock_file.read(size)
+    if len(data) != size:
+        raise ConnectionError("incomplete response of the server")
+    return data
+
+# main():
+# - sends the arguments and stdin to the server, writes the output and exits with the exit code of the interpret
+def main():
+
+    # socket of the server -> --socket argument or INTERPRET_SOCKET
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--socket=")]
+    socket_path = os.environ.get("INTERPRET_SOCKET")
+    for arg in sys.argv[1:]:
+        if arg.startswith("--socket="):
+            socket_path = arg[len("--socket="):]
+    if not socket_path:
+        run_local(args)
+
+    # stdin is the source or the input -> read it whole, interactive input is run locally
+    stdin_data = None
+    if has_argument(args, "--source") != has_argument(args, "--input"):
+        if sys.stdin.isatty():
+            run_local(args)
+        stdin_data = sys.stdin.buffer.read()
+
+    # connect to the server, server isn't running -> run the interpret locally (stdin was already read)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        run_local(args, stdin_data)
+    stdin_data = b"" if stdin_data == None else stdin_data
+
+    # send the request and read the response, the program isn't run again after the request was sent
+    try:
+        with sock:
+            request = {"cwd": os.getcwd(), "args": args, "stdin_size": len(stdin_data)}
+            sock.sendall(json.dumps(request).encode() + b"\n" + stdin_data)
+            with sock.makefile("rb") as sock_file:
+                response = json.loads(sock_file.readline())
+                stdout_data = read_exact(sock_file, response["stdout_size"])
+                stderr_data = read_exact(sock_file, response["stderr_size"])
+    except (OSError, ValueError, KeyError) as error:
+        sys.stderr.write("[interpret_client.py]: ERROR (99) - main()\n")
+        sys.stderr.write(f"                       NOTE - Server {socket_path} didn't answer the request, {error}\n")
+        sys.exit(99)
+
+    sys.stdout.buffer.write(stdout_data)
+    sys.stdout.flush()
+    sys.stderr.buffer.write(stderr_data)
+    sys.stderr.flush()
+    sys.exit(response["rc"])
+
+if __name__ == "__main__":
+    main()
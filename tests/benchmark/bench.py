@@ -0,0 +1,330 @@
+# Benchmark suite of interpret.py built from the koule and ipp-2023-tests corpora
+#
+# usage:
+# - python3 bench.py [--corpus NAME ...] [--repeat R] [--opcodes] [--engine E] [--json FILE] [--baseline FILE] [--threshold P] [interpret.py]
+# - corpora: loop (generated loop program), koule (koule programs), ipp (interpret-only tests),
+#   ipp-both (both tests, needs php and parse.php to translate the sources)
+# - every benchmark is run in its own worker process, the programs are executed in-process by the Interpret class
+#   = wall time -> best of R runs (parse, compile and execution), instructions -> executed instructions
+#   = peak rss  -> max. resident memory of the worker process
+#   = opcodes   -> executed instructions and time of every opcode (--opcodes, profiling runs)
+#   = engine    -> execution engine of the timed runs (--engine=compiled), profiling runs use the reference engine
+# - results are written as JSON (--json), a saved result can be used as the baseline (--baseline)
+#   = benchmark is a regression if its speed (inst/s, wall time if unknown) is lower than baseline by more than threshold %, exit code is then 1
+#
+# example (baseline/change):
+# - python3 tests/benchmark/bench.py --json /tmp/base.json
+# - python3 tests/benchmark/bench.py --baseline /tmp/base.json --threshold 5
+# - python3 tests/benchmark/bench.py --engine compiled --baseline /tmp/base.json
+
+# - - - - - - - - - - - #
+#       LIBRARIES       #
+# - - - - - - - - - - - #
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import datetime
+import tempfile
+import subprocess
+import contextlib
+import importlib.util
+
+from dispatch_bench import loop_program
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+INTERPRET = os.path.join(ROOT, "src", "interpret.py")
+TESTS = os.path.join(ROOT, "tests", "inpret-test", "ipp-2023-tests")
+PARSER = os.path.join(ROOT, "tests", "inpret-test", "parse.php")
+CORPORA = ("loop", "koule", "ipp", "ipp-both")
+
+
+
+# - - - - - - - - - - - #
+#        WORKER         #
+# - - - - - - - - - - - #
+
+# load_interpret():
+# - imports the interpret.py file as a module
+def load_interpret(path):
+    spec = importlib.util.spec_from_file_location("interpret_bench", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# run_case():
+# - runs one program in-process, output of the program is thrown away
+# - profile -> None (timed run), "counts" or "time" (profiling run, collapsed stacks are returned)
+# - engine -> execution engine of the timed run (None -> default engine of the interpret)
+# - returns the return code, wall time and the collapsed stacks
+def run_case(module, case, profile=None, engine=None):
+
+    collapsed = io.StringIO()
+    with open(os.devnull, "w") as null, open(case["source"], "r") as source, \
+         (open(case["input"], "r") if case["input"] else io.StringIO()) as input, \
+         contextlib.redirect_stdout(null), contextlib.redirect_stderr(null):
+
+        start = time.perf_counter()
+        interpret = module.Interpret()
+        interpret.source = source
+        interpret.input = input
+        if profile != None:
+            interpret.profile = collapsed
+            interpret.profile_counts = profile == "counts"
+        elif engine != None:
+            interpret.engine = engine
+
+        # Interpret.run() returns the exit code, older versions of the interpret exit
+        try:
+            if hasattr(interpret, "reset"):
+                rc = interpret.run(source, input, null, null)
+            else:
+                interpret.run_script()
+                rc = 0
+        except SystemExit as exit_code:
+            rc = exit_code.code if isinstance(exit_code.code, int) else 1
+        elapsed = time.perf_counter() - start
+
+    return rc, elapsed, collapsed.getvalue()
+
+# add_opcodes():
+# - adds the values of the collapsed stacks ("main;block l;12 ADD 3400") into the opcode dictionary
+def add_opcodes(opcodes, collapsed, key):
+    for line in collapsed.splitlines():
+        _, opcode, value = line.rsplit(" ", 2)
+        opcode_data = opcodes.setdefault(opcode, {"count": 0, "ns": 0})
+        opcode_data[key] += int(value)
+
+# peak_rss():
+# - returns the max. resident memory of the process in KiB
+def peak_rss():
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+# worker():
+# - runs the cases of one benchmark (JSON list from stdin) and prints the result as JSON
+def worker(interpret, repeat, opcodes, engine):
+
+    cases = json.load(sys.stdin)
+    module = load_interpret(interpret)
+    profiling = hasattr(module.Interpret(), "profile")
+
+    # timed runs -> best wall time of every case
+    wall, failed = 0.0, 0
+    for case in cases:
+        best = None
+        for _ in range(repeat):
+            rc, elapsed, _ = run_case(module, case, engine=engine)
+            best = elapsed if best is None else min(best, elapsed)
+        wall += best
+        if rc != case["rc"]:
+            failed += 1
+
+    # profiling runs -> executed instructions of every opcode and their time
+    opcode_data = {}
+    if profiling:
+        for case in cases:
+            add_opcodes(opcode_data, run_case(module, case, "counts")[2], "count")
+            if opcodes:
+                add_opcodes(opcode_data, run_case(module, case, "time")[2], "ns")
+
+    insts = sum(data["count"] for data in opcode_data.values()) if profiling else None
+    result = {
+        "cases": len(cases),
+        "failed": failed,
+        "wall": wall,
+        "insts": insts,
+        "inst_per_s": insts / wall if insts and wall > 0 else None,
+        "peak_rss_kb": peak_rss(),
+    }
+    if opcodes and profiling:
+        for data in opcode_data.values():
+            data["ns_per_inst"] = data["ns"] / data["count"] if data["count"] else 0.0
+        result["opcodes"] = dict(sorted(opcode_data.items(), key=lambda item: -item[1]["ns"]))
+
+    json.dump(result, sys.stdout)
+
+
+
+# - - - - - - - - - - - #
+#       BENCHMARKS      #
+# - - - - - - - - - - - #
+
+# expected_rc():
+# - returns the expected return code of the test (.rc file), 0 if there is no .rc file
+def expected_rc(base):
+    if not os.path.isfile(base + ".rc"):
+        return 0
+    with open(base + ".rc", "r") as rc_file:
+        return int(rc_file.read().strip() or 0)
+
+# test_cases():
+# - returns the cases (.src, .in, .rc) of the test directory
+def test_cases(directory):
+    cases = []
+    for path, _, files in sorted(os.walk(directory)):
+        for name in sorted(files):
+            if name.endswith(".src"):
+                base = os.path.join(path, name[:-4])
+                input = base + ".in" if os.path.isfile(base + ".in") else None
+                cases.append({"source": base + ".src", "input": input, "rc": expected_rc(base)})
+    return cases
+
+# translate_cases():
+# - translates the IPPcode23 sources into xml by parse.php, tests of the parser errors (21-23) are left out
+def translate_cases(cases, tmp_dir):
+    translated = []
+    for i, case in enumerate(cases):
+        if 21 <= case["rc"] <= 23:
+            continue
+        with open(case["source"], "r") as source:
+            result = subprocess.run(["php", PARSER], stdin=source, capture_output=True)
+        if result.returncode != 0:
+            continue
+        xml_source = os.path.join(tmp_dir, f"{i}.xml")
+        with open(xml_source, "wb") as xml_file:
+            xml_file.write(result.stdout)
+        translated.append(dict(case, source=xml_source))
+    return translated
+
+# benchmarks():
+# - returns the benchmarks of the given corpora as {name: cases}
+def benchmarks(corpora, iterations, tmp_dir):
+
+    result = {}
+    if "loop" in corpora:
+        source, _ = loop_program(iterations)
+        loop = os.path.join(tmp_dir, "loop.xml")
+        with open(loop, "w") as loop_file:
+            loop_file.write(source)
+        result["loop"] = [{"source": loop, "input": None, "rc": 0}]
+
+    if "koule" in corpora:
+        for name in sorted(os.listdir(os.path.join(TESTS, "koule"))):
+            koule = os.path.join(TESTS, "koule", name, f"koule_{name}.xml")
+            if os.path.isfile(koule):
+                result[f"koule/{name}"] = [{"source": koule, "input": None, "rc": 0}]
+
+    if "ipp" in corpora:
+        result["ipp-2023-tests/interpret-only"] = test_cases(os.path.join(TESTS, "interpret-only"))
+
+    if "ipp-both" in corpora:
+        if shutil.which("php") == None:
+            print("ipp-2023-tests/both skipped (php not found)")
+        else:
+            result["ipp-2023-tests/both"] = translate_cases(test_cases(os.path.join(TESTS, "both")), tmp_dir)
+
+    return result
+
+# run_benchmark():
+# - runs the benchmark in the worker process, returns the result or None if the worker failed
+def run_benchmark(interpret, cases, repeat, opcodes, engine):
+    args = [sys.executable, os.path.abspath(__file__), "--worker", "--repeat", str(repeat), interpret]
+    if opcodes:
+        args.append("--opcodes")
+    if engine != None:
+        args.append(f"--engine={engine}")
+    result = subprocess.run(args, input=json.dumps(cases), capture_output=True, text=True)
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        return None
+    return json.loads(result.stdout)
+
+# print_result():
+# - prints one benchmark result (and its opcodes)
+def print_result(name, result):
+    speed = "-" if result["inst_per_s"] is None else f"{result['inst_per_s']:.0f} inst/s"
+    insts = "-" if result["insts"] is None else str(result["insts"])
+    print(f"{name:32} {result['wall']:9.3f} s  {insts:>10} inst  {speed:>16}  {result['peak_rss_kb'] / 1024:7.1f} MiB"
+          f"  ({result['cases']} cases, {result['failed']} failed)")
+    for opcode, data in result.get("opcodes", {}).items():
+        print(f"    {opcode:12} {data['count']:10} inst  {data['ns'] / 1e6:10.1f} ms  {data['ns_per_inst']:8.1f} ns/inst")
+
+# speedup():
+# - returns the speedup of the result against the base result -> by inst/s, or by wall time if the instructions are unknown
+def speedup(result, base):
+    if result["inst_per_s"] and base["inst_per_s"]:
+        return result["inst_per_s"] / base["inst_per_s"]
+    if result["wall"] > 0 and base["wall"] > 0:
+        return base["wall"] / result["wall"]
+    return None
+
+# compare():
+# - compares the results with the baseline, returns the names of the regressed benchmarks
+def compare(results, baseline, threshold):
+
+    regressions = []
+    print(f"\ncompared with the baseline ({baseline['interpret']}, threshold {threshold} %)")
+    for name, result in results.items():
+        base = baseline["benchmarks"].get(name)
+        ratio = None if base is None else speedup(result, base)
+        if ratio is None:
+            print(f"  {name:32} no baseline")
+            continue
+
+        change = (ratio - 1) * 100
+        status = "ok"
+        if change < -threshold:
+            status = "REGRESSION"
+            regressions.append(name)
+        print(f"  {name:32} {change:+7.1f} %  {status}")
+
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark suite of interpret.py")
+    parser.add_argument("interpret", nargs="?", default=INTERPRET, help="interpret.py file (default src/interpret.py)")
+    parser.add_argument("--corpus", action="append", choices=CORPORA, help="benchmarked corpus (default loop, koule, ipp)")
+    parser.add_argument("--iterations", type=int, default=20000, help="loop iterations of the generated program")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed runs, the best one is reported")
+    parser.add_argument("--opcodes", action="store_true", help="measure the time of every opcode")
+    parser.add_argument("--engine", help="execution engine of the interpret (reference, compiled)")
+    parser.add_argument("--json", help="file for the results")
+    parser.add_argument("--baseline", help="results used as the baseline")
+    parser.add_argument("--threshold", type=float, default=5.0, help="allowed slowdown against the baseline in %%")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    interpret = os.path.abspath(args.interpret)
+    if args.worker:
+        worker(interpret, args.repeat, args.opcodes, args.engine)
+        return 0
+
+    # run every benchmark in its own worker
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, cases in benchmarks(args.corpus or ("loop", "koule", "ipp"), args.iterations, tmp_dir).items():
+            result = run_benchmark(interpret, cases, args.repeat, args.opcodes, args.engine)
+            if result is None:
+                print(f"{name:32} failed")
+                continue
+            results[name] = result
+            print_result(name, result)
+
+    report = {
+        "interpret": interpret,
+        "python": sys.version.split()[0],
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "repeat": args.repeat,
+        "engine": args.engine,
+        "benchmarks": results,
+    }
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump(report, json_file, indent=2)
+
+    # compare with the baseline
+    if args.baseline:
+        with open(args.baseline, "r") as baseline_file:
+            baseline = json.load(baseline_file)
+        if compare(results, baseline, args.threshold):
+            return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
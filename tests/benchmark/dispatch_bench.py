@@ -0,0 +1,113 @@
+# Micro-benchmark of the instruction dispatch in interpret.py
+#
+# usage:
+# - python3 dispatch_bench.py [--iterations N] [--repeat R] interpret.py [other_interpret.py ...]
+# - runs a generated loop program (known number of executed instructions) with every given interpret
+# - prints the best wall time and the executed instructions per second
+# - koule programs from ipp-2023-tests are run too, programs which can't be interpreted are reported as skipped
+#
+# example (before/after):
+# - git show HEAD~1:src/interpret.py > /tmp/interpret_old.py
+# - python3 tests/benchmark/dispatch_bench.py /tmp/interpret_old.py src/interpret.py
+
+# - - - - - - - - - - - #
+#       LIBRARIES       #
+# - - - - - - - - - - - #
+import os
+import sys
+import time
+import argparse
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+KOULE = os.path.join(ROOT, "tests", "inpret-test", "ipp-2023-tests", "koule")
+
+
+# loop_program():
+# - generates the loop program, every iteration executes 11 instructions
+# - returns the xml source and the number of executed instructions
+def loop_program(iterations):
+
+    body = [
+        ("DEFVAR", [("var", "GF@i")]),
+        ("DEFVAR", [("var", "GF@c")]),
+        ("DEFVAR", [("var", "GF@s")]),
+        ("MOVE", [("var", "GF@i"), ("int", "0")]),
+        ("MOVE", [("var", "GF@s"), ("string", "")]),
+        ("LABEL", [("label", "loop")]),
+        ("ADD", [("var", "GF@i"), ("var", "GF@i"), ("int", "1")]),
+        ("LT", [("var", "GF@c"), ("var", "GF@i"), ("int", str(iterations))]),
+        ("CREATEFRAME", []),
+        ("DEFVAR", [("var", "TF@x")]),
+        ("MOVE", [("var", "TF@x"), ("var", "GF@i")]),
+        ("PUSHS", [("var", "TF@x")]),
+        ("PUSHS", [("int", "2")]),
+        ("MULS", []),
+        ("POPS", [("var", "TF@x")]),
+        ("JUMPIFEQ", [("label", "loop"), ("var", "GF@c"), ("bool", "true")]),
+        ("WRITE", [("var", "GF@i")]),
+    ]
+
+    xml = ['<?xml version="1.0" encoding="UTF-8"?>', '<program language="IPPcode23">']
+    for order, (opcode, args) in enumerate(body, 1):
+        xml_args = "".join(f'<arg{i} type="{t}">{v}</arg{i}>' for i, (t, v) in enumerate(args, 1))
+        xml.append(f'<instruction order="{order}" opcode="{opcode}">{xml_args}</instruction>')
+    xml.append("</program>")
+
+    return "\n".join(xml) + "\n", 6 + 11 * iterations
+
+# run():
+# - runs the interpret with the given source file, returns the best time and the return code
+def run(interpret, source, repeat):
+
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, interpret, f"--source={source}"],
+                                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        elapsed = time.perf_counter() - start
+        if result.returncode != 0:
+            return None, result.returncode
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best, 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Instruction dispatch micro-benchmark for interpret.py")
+    parser.add_argument("interprets", nargs="+", help="interpret.py files to compare")
+    parser.add_argument("--iterations", type=int, default=20000, help="loop iterations of the generated program")
+    parser.add_argument("--repeat", type=int, default=3, help="number of runs, the best one is reported")
+    args = parser.parse_args()
+
+    # generated loop program
+    source, executed = loop_program(args.iterations)
+    with tempfile.NamedTemporaryFile("w", suffix=".xml", delete=False) as tmp:
+        tmp.write(source)
+
+    try:
+        print(f"loop program - {executed} executed instructions")
+        for interpret in args.interprets:
+            elapsed, rc = run(interpret, tmp.name, args.repeat)
+            if elapsed is None:
+                print(f"  {interpret:40} failed (rc {rc})")
+            else:
+                print(f"  {interpret:40} {elapsed:8.3f} s  {executed / elapsed:12.0f} inst/s")
+    finally:
+        os.unlink(tmp.name)
+
+    # koule programs
+    for name in sorted(os.listdir(KOULE)):
+        koule = os.path.join(KOULE, name, f"koule_{name}.xml")
+        if not os.path.isfile(koule):
+            continue
+        print(f"koule_{name}")
+        for interpret in args.interprets:
+            elapsed, rc = run(interpret, koule, args.repeat)
+            if elapsed is None:
+                print(f"  {interpret:40} skipped (rc {rc})")
+            else:
+                print(f"  {interpret:40} {elapsed:8.3f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+# Micro-benchmark of the strings in interpret.py -> string literals (escape sequences \ddd) and CONCAT
+#
+# usage:
+# - python3 string_bench.py [--literals N] [--length L] [--concat C] [--repeat R] [--engine E] interpret.py [other_interpret.py ...]
+# - literals are long strings with many spaces and punctuation -> most of the characters are escape sequences
+# - decoding of the literals is timed in-process
+#   = regex   -> re.sub with the lambda for every escape sequence (decoding before StringCodec)
+#   = codec   -> StringCodec.decode() of the interpret, every literal is new (empty cache)
+#   = cached  -> StringCodec.decode() of the already decoded literals
+# - generated program (WRITE of every literal) is run with every given interpret, the best wall time is printed
+# - concat programs build the string by CONCAT var var string@c (C characters, C/4 and C/16) -> the times should grow linearly
+# - reverse programs build the string and reverse it in place by GETCHAR and SETCHAR (C/16, C/64 and C/256 characters)
+#
+# example (before/after):
+# - git show HEAD~1:src/interpret.py > /tmp/interpret_old.py
+# - python3 tests/benchmark/string_bench.py /tmp/interpret_old.py src/interpret.py
+
+# - - - - - - - - - - - #
+#       LIBRARIES       #
+# - - - - - - - - - - - #
+import os
+import re
+import sys
+import time
+import random
+import argparse
+import tempfile
+import subprocess
+import importlib.util
+
+
+# literals():
+# - generates the literals with many spaces and punctuation, every literal is different
+def literals(count, length):
+
+    rng = random.Random(23)
+    chars = "abcdefgh    .,;:!?-#\\\n"
+    result = []
+    for index in range(count):
+        text = str(index) + "".join(rng.choice(chars) for _ in range(length))
+        result.append("".join(f"\\{ord(char):03}" if char in " #\\\n" or ord(char) < 33 else char for char in text))
+    return result
+
+# string_program():
+# - generates the program which writes every literal
+def string_program(literals):
+    xml = ['<?xml version="1.0" encoding="UTF-8"?>', '<program language="IPPcode23">']
+    for order, literal in enumerate(literals, 1):
+        xml.append(f'<instruction order="{order}" opcode="WRITE"><arg1 type="string">{literal}</arg1></instruction>')
+    xml.append("</program>")
+    return "\n".join(xml) + "\n"
+
+# concat_program():
+# - generates the program which appends one character to the string in every iteration and writes its length
+def concat_program(length):
+    return program(concat_body(length) + [
+        ("STRLEN", [("var", "GF@i"), ("var", "GF@s")]),
+        ("WRITE", [("var", "GF@i")]),
+    ])
+
+# reverse_program():
+# - generates the program which builds the string and reverses it in place (GETCHAR, SETCHAR) and writes it
+def reverse_program(length):
+    return program(concat_body(length) + [
+        ("DEFVAR", [("var", "GF@j")]),
+        ("DEFVAR", [("var", "GF@a")]),
+        ("DEFVAR", [("var", "GF@b")]),
+        ("DEFVAR", [("var", "GF@c")]),
+        ("MOVE", [("var", "GF@i"), ("int", "0")]),
+        ("STRLEN", [("var", "GF@j"), ("var", "GF@s")]),
+        ("SUB", [("var", "GF@j"), ("var", "GF@j"), ("int", "1")]),
+        ("LABEL", [("label", "reverse")]),
+        ("GETCHAR", [("var", "GF@a"), ("var", "GF@s"), ("var", "GF@i")]),
+        ("GETCHAR", [("var", "GF@b"), ("var", "GF@s"), ("var", "GF@j")]),
+        ("SETCHAR", [("var", "GF@s"), ("var", "GF@i"), ("var", "GF@b")]),
+        ("SETCHAR", [("var", "GF@s"), ("var", "GF@j"), ("var", "GF@a")]),
+        ("ADD", [("var", "GF@i"), ("var", "GF@i"), ("int", "1")]),
+        ("SUB", [("var", "GF@j"), ("var", "GF@j"), ("int", "1")]),
+        ("LT", [("var", "GF@c"), ("var", "GF@i"), ("var", "GF@j")]),
+        ("JUMPIFEQ", [("label", "reverse"), ("var", "GF@c"), ("bool", "true")]),
+        ("WRITE", [("var", "GF@s")]),
+    ])
+
+# concat_body():
+# - instructions which build the string GF@s of the length by CONCAT (string@c in every iteration)
+def concat_body(length):
+    return [
+        ("DEFVAR", [("var", "GF@i")]),
+        ("DEFVAR", [("var", "GF@s")]),
+        ("MOVE", [("var", "GF@i"), ("int", "0")]),
+        ("MOVE", [("var", "GF@s"), ("string", "")]),
+        ("LABEL", [("label", "loop")]),
+        ("CONCAT", [("var", "GF@s"), ("var", "GF@s"), ("string", "c")]),
+        ("ADD", [("var", "GF@i"), ("var", "GF@i"), ("int", "1")]),
+        ("JUMPIFNEQ", [("label", "loop"), ("var", "GF@i"), ("int", str(length))]),
+    ]
+
+# program():
+# - returns the xml source of the instructions
+def program(body):
+    xml = ['<?xml version="1.0" encoding="UTF-8"?>', '<program language="IPPcode23">']
+    for order, (opcode, args) in enumerate(body, 1):
+        xml_args = "".join(f'<arg{i} type="{t}">{v}</arg{i}>' for i, (t, v) in enumerate(args, 1))
+        xml.append(f'<instruction order="{order}" opcode="{opcode}">{xml_args}</instruction>')
+    xml.append("</program>")
+    return "\n".join(xml) + "\n"
+
+# run():
+# - runs the interpret with the given source file, returns the best time and the return code
+def run(interpret, source, repeat, extra=()):
+
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, interpret, f"--source={source}", *extra],
+                                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        elapsed = time.perf_counter() - start
+        if result.returncode != 0:
+            return None, result.returncode
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best, 0
+
+# run_program():
+# - writes the program into the temporary file and prints the time of every interpret
+def run_program(title, source, interprets, repeat, extra=()):
+    with tempfile.NamedTemporaryFile("w", suffix=".xml", delete=False) as tmp:
+        tmp.write(source)
+
+    try:
+        print(title)
+        for interpret in interprets:
+            elapsed, rc = run(interpret, tmp.name, repeat, extra)
+            if elapsed is None:
+                print(f"  {interpret:40} failed (rc {rc})")
+            else:
+                print(f"  {interpret:40} {elapsed:8.3f} s")
+    finally:
+        os.unlink(tmp.name)
+
+# regex_decode():
+# - decoding of the literal before StringCodec
+def regex_decode(literal):
+    return re.sub(r"\\([0-9]{3})", lambda x: chr(int(x.group(1))), literal)
+
+# best_time():
+# - returns the best time of the function run with every literal
+def best_time(function, literals, repeat, setup=None):
+    best = None
+    for _ in range(repeat):
+        if setup != None:
+            setup()
+        start = time.perf_counter()
+        for literal in literals:
+            function(literal)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+# load_interpret():
+# - imports the interpret.py file as a module
+def load_interpret(path):
+    spec = importlib.util.spec_from_file_location("interpret_string_bench", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def main():
+    parser = argparse.ArgumentParser(description="String literal micro-benchmark for interpret.py")
+    parser.add_argument("interprets", nargs="+", help="interpret.py files to compare")
+    parser.add_argument("--literals", type=int, default=2000, help="number of the generated literals")
+    parser.add_argument("--length", type=int, default=2000, help="characters of every literal")
+    parser.add_argument("--concat", type=int, default=1000000, help="characters of the string built by CONCAT")
+    parser.add_argument("--repeat", type=int, default=3, help="number of runs, the best one is reported")
+    parser.add_argument("--engine", default="reference", help="execution engine of the programs (reference, compiled)")
+    args = parser.parse_args()
+    extra = [f"--engine={args.engine}"]
+
+    strings = literals(args.literals, args.length)
+    size = sum(len(literal) for literal in strings)
+    print(f"decoding - {args.literals} literals, {size} characters")
+    print(f"  {'regex':40} {best_time(regex_decode, strings, args.repeat):8.3f} s")
+
+    # decoding by the codec of every interpret (interprets without StringCodec are skipped)
+    for interpret in args.interprets:
+        module = load_interpret(interpret)
+        codec = getattr(module, "STRING_CODEC", None)
+        if codec is None:
+            print(f"  {interpret:40} skipped (no StringCodec)")
+            continue
+        codec.cache_size = max(codec.cache_size, len(strings))
+        print(f"  {interpret + ' codec':40} {best_time(codec.decode, strings, args.repeat, codec.cache.clear):8.3f} s")
+        print(f"  {interpret + ' cached':40} {best_time(codec.decode, strings, args.repeat):8.3f} s")
+
+    # generated programs
+    run_program(f"string program - {args.literals} WRITE instructions", string_program(strings), args.interprets, args.repeat, extra)
+    for length in (args.concat // 16, args.concat // 4, args.concat):
+        run_program(f"concat program - {length} characters", concat_program(length), args.interprets, args.repeat, extra)
+    for length in (args.concat // 256, args.concat // 64, args.concat // 16):
+        run_program(f"reverse program - {length} characters", reverse_program(length), args.interprets, args.repeat, extra)
+
+if __name__ == "__main__":
+    main()
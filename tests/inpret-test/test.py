@@ -0,0 +1,276 @@
+# Parallel conformance test runner of interpret.py (replaces the serial loop of test.php)
+#
+# usage:
+# - python3 test.py [--directory=path] [--recursive] [--int-only] [--int-script=file] [--parse-script=file]
+#                   [--jobs=N] [--timeout=S] [--html=file] [--json=file] [--int-args="--engine=compiled --no-fusion ..."]
+# - tests are the .src/.in/.out/.rc quadruples, missing .in/.out are empty and missing .rc is 0 (files aren't created)
+# - tests are run by a pool of worker processes, every worker imports the interpret once and runs the tests in-process
+#   = every worker has one Interpret instance, Interpret.run() resets it before every test
+#   = --int-only -> .src is the xml source, otherwise .src is translated by the parse script (php) first
+#   = --int-args -> run mode arguments of the interpret (--engine, --no-fusion, --no-optimize), read once by Interpret.read_args() in every worker
+# - test is passed if the return code is the expected one and the output is the same (compared only for rc 0)
+# - html report (same as test.php) is printed into stdout or written into --html, json report is written into --json
+# - parse-only tests (JExamXML) are still run by test.php
+#
+# example:
+# - python3 tests/inpret-test/test.py --directory=tests/inpret-test/ipp-2023-tests/interpret-only --recursive --int-only --json=out.json > out.html
+# - python3 tests/inpret-test/test.py --directory=tests/inpret-test/ipp-2023-tests/interpret-only --recursive --int-only --int-args="--engine=compiled" > out.html
+
+# - - - - - - - - - - - #
+#       LIBRARIES       #
+# - - - - - - - - - - - #
+import io
+import os
+import sys
+import html
+import json
+import time
+import shlex
+import signal
+import shutil
+import argparse
+import subprocess
+import importlib.util
+import multiprocessing
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+INTERPRET = os.path.join(os.path.dirname(os.path.dirname(DIRECTORY)), "src", "interpret.py")
+
+
+
+# - - - - - - - - - - - #
+#        WORKER         #
+# - - - - - - - - - - - #
+
+# state of the worker process -> imported interpret module, parse script and timeout
+worker_state = {}
+
+# TestTimeout exception:
+# - raised by the alarm signal when the test runs for too long
+class TestTimeout(Exception):
+    pass
+
+# timeout_handler():
+# - alarm signal handler, stops the running test
+def timeout_handler(signum, frame):
+    raise TestTimeout()
+
+# load_interpret():
+# - imports the interpret.py file as a module
+def load_interpret(int_script):
+    spec = importlib.util.spec_from_file_location("interpret_test", int_script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# init_worker():
+# - imports the interpret and creates it, done only once in every worker process
+# - run mode arguments are read by the interpret (source is a placeholder), Interpret.run() keeps them for every test
+def init_worker(int_script, parse_script, int_only, timeout, int_args):
+    interpret = load_interpret(int_script).Interpret()
+    if len(int_args) > 0:
+        interpret.read_args([f"--source={os.devnull}", *int_args])
+        interpret.source.close()
+
+    worker_state.update(interpret=interpret, parse_script=parse_script, int_only=int_only, timeout=timeout)
+    if hasattr(signal, "SIGALRM"):
+        signal.signal(signal.SIGALRM, timeout_handler)
+
+# read_file():
+# - returns the content of the file or the default value if the file doesn't exist
+def read_file(path, default):
+    if not os.path.isfile(path):
+        return default
+    with open(path, "r", encoding="utf-8", errors="surrogateescape") as file:
+        return file.read()
+
+# run_interpret():
+# - runs the xml source by the warm interpret (Interpret.run() resets it), returns the return code and the output
+def run_interpret(source, input):
+    output = io.StringIO()
+    rc = worker_state["interpret"].run(source, input, output, io.StringIO())
+    return rc, output.getvalue()
+
+# run_test():
+# - runs one test, returns its result as a dictionary
+def run_test(test):
+
+    base = test[:-4]
+    expected_rc = int(read_file(base + ".rc", "0").strip() or 0)
+    expected_out = read_file(base + ".out", "")
+    input = io.StringIO(read_file(base + ".in", ""))
+
+    start = time.perf_counter()
+    signal_alarm = hasattr(signal, "SIGALRM") and worker_state["timeout"] > 0
+    try:
+        if signal_alarm:
+            signal.alarm(worker_state["timeout"])
+
+        # xml source -> interpret, IPPcode23 source -> parser (php) and the interpret
+        if worker_state["int_only"]:
+            with open(test, "r", encoding="utf-8", errors="surrogateescape") as source:
+                rc, output = run_interpret(source, input)
+        else:
+            with open(test, "rb") as source:
+                parsed = subprocess.run(["php", worker_state["parse_script"]], stdin=source, capture_output=True)
+            if parsed.returncode != 0:
+                rc, output = parsed.returncode, ""
+            else:
+                rc, output = run_interpret(io.StringIO(parsed.stdout.decode("utf-8", "surrogateescape")), input)
+
+    except TestTimeout:
+        rc, output = "timeout", ""
+    except Exception as error:
+        rc, output = "crash", f"{type(error).__name__}: {error}"
+    finally:
+        if signal_alarm:
+            signal.alarm(0)
+
+    return {
+        "name": os.path.basename(base),
+        "path": os.path.dirname(test),
+        "ok": rc == expected_rc and (rc != 0 or output == expected_out),
+        "rc": rc,
+        "expected_rc": expected_rc,
+        "output": output,
+        "expected_output": expected_out,
+        "time": time.perf_counter() - start,
+    }
+
+
+
+# - - - - - - - - - - - #
+#        RUNNER         #
+# - - - - - - - - - - - #
+
+# find_tests():
+# - returns the .src files of the directory (and its subdirectories with --recursive)
+def find_tests(directory, recursive):
+    tests = []
+    for path, dirs, files in os.walk(directory):
+        tests.extend(os.path.join(path, name) for name in files if name.endswith(".src"))
+        if not recursive:
+            break
+    return sorted(tests)
+
+# html_report():
+# - returns the html page with the results (same layout as out.html of test.php)
+def html_report(results):
+
+    passed = sum(result["ok"] for result in results)
+    page = ["""<!DOCTYPE html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="description" content="Test results">
+    <style>
+    th, td { padding-left:10px; padding-right:10px; color:white; }
+    h1,h2,h3,h4 { color:white; }
+    textarea { background-color: rgb(18, 18, 18); color:white; }
+    body { padding-left: 1em; padding-right: 1em; background-color: rgb(18, 18, 18); }
+    </style>
+</head>
+
+<body>
+    <h1 style="text-align: center;">Test result</h1>""",
+        f"    <h2>Tests run: {len(results)}</h2>",
+        f"    <h2>Passed: {passed} </h2>",
+        f"    <h2>Failed: {len(results) - passed} </h2>",
+        "    <hr>"]
+
+    # tests grouped by the directory, failed tests first
+    for ok, title, color in ((False, "Failed tests", "red"), (True, "Passed tests", "green")):
+        page.append(f'<hr><h3 style="text-align: center; color:{color}">{title}</h3>' if ok else
+                    f'    <h3 style="text-align: center; color:{color}">{title}</h3>')
+        path = None
+        for result in results:
+            if result["ok"] != ok:
+                continue
+            if result["path"] != path:
+                if path != None:
+                    page.append("</table>")
+                path = result["path"]
+                columns = "<th>Test name</th><th>Return code</th><th>Output</th>" if ok else \
+                          "<th>Test name</th><th>Return code</th><th>Expected return code</th><th>Output</th><th>Expected output</th>"
+                page.append(f"<hr><h4>{html.escape(path)}</h4><table><tr>{columns}</tr>")
+
+            name = html.escape(result["name"])
+            output = f'<td><textarea readonly rows=5 cols=50>{html.escape(result["output"])}</textarea></td>'
+            if ok:
+                page.append(f"<tr><td>{name}</td><td>{result['rc']}</td>{output}</tr>")
+            else:
+                expected = f'<td><textarea readonly rows=5 cols=50>{html.escape(result["expected_output"])}</textarea></td>'
+                page.append(f"<tr><td>{name}</td><td>{result['rc']}</td><td>{result['expected_rc']}</td>{output}{expected}</tr>")
+        if path != None:
+            page.append("</table>")
+
+    page.append("</body></html>")
+    return "\n".join(page) + "\n"
+
+# json_report():
+# - returns the results as the json document
+def json_report(results, elapsed):
+    passed = sum(result["ok"] for result in results)
+    report = {"tests": len(results), "passed": passed, "failed": len(results) - passed, "time": elapsed, "results": results}
+    return json.dumps(report, indent=2, ensure_ascii=False)
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel conformance test runner of interpret.py")
+    parser.add_argument("--directory", default=".", help="directory with the tests")
+    parser.add_argument("--recursive", action="store_true", help="search the tests in the subdirectories too")
+    parser.add_argument("--int-only", action="store_true", help=".src files are the xml sources of the interpret")
+    parser.add_argument("--int-script", default=INTERPRET, help="interpret.py file (default src/interpret.py)")
+    parser.add_argument("--parse-script", default=os.path.join(DIRECTORY, "parse.php"), help="parse.php file")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="number of worker processes")
+    parser.add_argument("--timeout", type=int, default=10, help="time limit of one test in seconds (0 -> no limit)")
+    parser.add_argument("--html", help="file for the html report (default stdout)")
+    parser.add_argument("--json", help="file for the json report")
+    parser.add_argument("--int-args", default="", help="run mode arguments of the interpret, e.g. \"--engine=compiled --no-fusion\"")
+    args = parser.parse_args()
+
+    # check the scripts
+    if not os.path.isfile(args.int_script):
+        sys.stderr.write(f"{args.int_script} not found\n")
+        return 41
+    if not args.int_only and not os.path.isfile(args.parse_script):
+        sys.stderr.write(f"{args.parse_script} not found\n")
+        return 41
+    if not args.int_only and shutil.which("php") == None:
+        sys.stderr.write("php not found (parse script can't be run), use --int-only for the xml tests\n")
+        return 41
+
+    # check the run mode arguments -> wrong arguments would stop every worker
+    int_args = shlex.split(args.int_args)
+    if len(int_args) > 0:
+        try:
+            load_interpret(args.int_script).InputParser().parse_arguments([f"--source={os.devnull}", *int_args])
+        except (Exception, SystemExit):
+            sys.stderr.write(f"wrong interpret arguments: {args.int_args}\n")
+            return 41
+
+    # run the tests in the worker processes
+    tests = find_tests(args.directory, args.recursive)
+    start = time.perf_counter()
+    init_args = (os.path.abspath(args.int_script), os.path.abspath(args.parse_script), args.int_only, args.timeout, int_args)
+    with multiprocessing.Pool(max(1, args.jobs), initializer=init_worker, initargs=init_args) as pool:
+        chunksize = max(1, len(tests) // (max(1, args.jobs) * 8))
+        results = list(pool.imap(run_test, tests, chunksize))
+    elapsed = time.perf_counter() - start
+
+    # reports
+    report = html_report(results)
+    if args.html:
+        with open(args.html, "w", encoding="utf-8") as html_file:
+            html_file.write(report)
+    else:
+        sys.stdout.write(report)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as json_file:
+            json_file.write(json_report(results, elapsed))
+
+    passed = sum(result["ok"] for result in results)
+    sys.stderr.write(f"{passed}/{len(results)} tests passed in {elapsed:.2f} s ({max(1, args.jobs)} jobs{', ' + args.int_args if args.int_args else ''})\n")
+    return 0 if passed == len(results) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())